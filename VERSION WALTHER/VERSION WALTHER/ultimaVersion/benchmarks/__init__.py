@@ -0,0 +1 @@
+"""Benchmarks del motor: ver __main__.py."""
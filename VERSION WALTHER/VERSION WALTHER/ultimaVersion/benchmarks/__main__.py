@@ -0,0 +1,56 @@
+"""Pruebas de rendimiento de las rutas calientes del motor.
+
+Ejecutar desde la carpeta del juego (junto a juego.py):
+
+    python -m benchmarks                                 # todas, resultados en pantalla
+    python -m benchmarks --out base.json                 # guardar como línea base
+    python -m benchmarks --compare base.json             # marcar regresiones (código de salida 1)
+    python -m benchmarks --only enemies projectiles      # solo algunos grupos
+"""
+import argparse
+import os
+import sys
+
+# Sin ventana ni audio; antes de importar el juego (Game los fija al iniciar pygame)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from .cases import GROUPS
+from .harness import compare, load_results, print_comparison, print_results, save_results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks de Isac")
+    parser.add_argument("--samples", type=int, default=200, help="muestras por prueba")
+    parser.add_argument("--only", nargs="+", choices=list(GROUPS), help="grupos a ejecutar")
+    parser.add_argument("--out", metavar="FICHERO", help="guardar los resultados en JSON")
+    parser.add_argument("--compare", metavar="FICHERO", help="comparar con una línea base guardada con --out")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="empeoramiento tolerado antes de marcar regresión (0.15 = 15%%)")
+    parser.add_argument("--metric", default="p50_us", choices=["p50_us", "p90_us", "p99_us", "mean_us"],
+                        help="estadística que se compara")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    results = {}
+    for name in args.only or GROUPS:
+        print(f"[{name}]", file=sys.stderr)
+        results.update(GROUPS[name](args.samples))
+    print_results(results)
+    if args.out:
+        save_results(args.out, results)
+    if args.compare:
+        rows = compare(results, load_results(args.compare), args.threshold, args.metric)
+        print()
+        print_comparison(rows, args.metric)
+        regressions = [r['name'] for r in rows if r['status'] == 'PEOR']
+        if regressions:
+            print(f"\n{len(regressions)} regresión(es): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+import os
+import random
+import tempfile
+from typing import Callable, Dict, List, Tuple
+
+import pygame
+
+from isac.core.dungeon import Dungeon
+from isac.core.fonts import fonts
+from isac.core.game import Game
+from isac.core.geometry import geometry_cache
+from isac.core.input import IDLE
+from isac.core.inventory import Inventory
+from isac.core.pathfinding import FlowField
+from isac.core.persistence import save_game, load_game
+from isac.core.room import Room
+from isac.entities.enemy_pool import EnemyPool
+from isac.entities.player import Player
+from isac.entities.projectiles import ProjectileSystem
+from isac.scenes.menu import MenuScene
+from isac.scenes.play import PlayScene
+from isac.settings import ENEMY_TYPES, ENEMY_SIZE, WIDTH, HEIGHT, GRAY
+
+from .harness import measure
+
+Results = Dict[str, Dict[str, float]]
+
+ENEMY_COUNTS = (10, 100, 1000)
+PROJECTILE_COUNTS = (10, 100, 1000)
+SCENE_ENEMIES = 20
+SIM_DT = 1.0 / 120
+
+
+def _free_positions(grid, count: int, rng: random.Random, size: int = ENEMY_SIZE) -> List[Tuple[int, int]]:
+    """Centros al azar donde cabe una entidad de `size` sin tocar la geometría."""
+    probe = pygame.Rect(0, 0, size, size)
+    out = []
+    while len(out) < count:
+        x, y = rng.randint(60, WIDTH - 60), rng.randint(60, HEIGHT - 60)
+        probe.center = (x, y)
+        if not grid.collides(probe):
+            out.append((x, y))
+    return out
+
+
+def bench_room(samples: int) -> Results:
+    room = Room((1, 0))
+    results = {'room.obstacles': measure(lambda _: room.obstacles(), samples, inner=1000)}
+
+    def cold(_) -> None:
+        geometry_cache.clear()
+        room.obstacles()
+    results['room.obstacles (sin caché)'] = measure(cold, samples)
+    return results
+
+
+def bench_dungeon(samples: int) -> Results:
+    dungeon = Dungeon()
+    return {
+        'dungeon.build': measure(lambda _: Dungeon(), samples, inner=10),
+        'dungeon._sync_doors': measure(lambda _: dungeon._sync_doors(), samples, inner=10),
+    }
+
+
+def _enemy_pool(count: int, grid, rng: random.Random) -> EnemyPool:
+    pool = EnemyPool()
+    kinds = list(ENEMY_TYPES)
+    for i, (x, y) in enumerate(_free_positions(grid, count, rng)):
+        cfg = ENEMY_TYPES[kinds[i % len(kinds)]]
+        pool.spawn(x, y, hp=cfg['hp'], speed_scale=cfg['speed_scale'], color=cfg['color'], kind=kinds[i % len(kinds)])
+    return pool
+
+
+def bench_enemies(samples: int) -> Results:
+    grid = Room((0, 0)).geometry().grid
+    player = pygame.Rect(0, 0, 40, 40)
+    player.center = (WIDTH // 2, HEIGHT // 2)
+    flow = FlowField()
+    flow.update(grid, player.center)
+    results = {}
+    for count in ENEMY_COUNTS:
+        pool = _enemy_pool(count, grid, random.Random(count))
+        results[f'enemies.update[{count}]'] = measure(
+            lambda _, pool=pool: pool.update(player, SIM_DT, grid=grid, flow=flow), samples)
+    return results
+
+
+def bench_projectiles(samples: int) -> Results:
+    grid = Room((0, 0)).geometry().grid
+    rng = random.Random(7)
+    enemies = _enemy_pool(30, grid, rng)
+    results = {}
+    for count in PROJECTILE_COUNTS:
+        starts = _free_positions(grid, count, random.Random(count), size=8)
+
+        def setup(starts=starts) -> ProjectileSystem:
+            # Mitad flechas y mitad pinchos, recién disparados (step los mueve y los retira)
+            system = ProjectileSystem()
+            for i, (x, y) in enumerate(starts):
+                if i % 2:
+                    system.spawn_spike(x, y, WIDTH // 2, HEIGHT // 2)
+                else:
+                    system.spawn_arrow(x, y, (1, -1, 0, 0)[i % 4], (0, 0, 1, -1)[i % 4])
+            # Mismos enemigos en cada muestra: vivos, sin invulnerabilidad y sin morir
+            n = enemies.count
+            enemies.alive[:n] = True
+            enemies.hp[:n] = 1e9
+            enemies.invuln_timer[:n] = 0.0
+            return system
+        results[f'projectiles.step[{count}]'] = measure(
+            lambda system: system.step(SIM_DT, grid, enemies), samples, setup=setup)
+    return results
+
+
+def _play_scene() -> Tuple[Game, PlayScene]:
+    game = Game(PlayScene, headless=True, seed=1)
+    scene = game.scene
+    geo = scene.dungeon.get_room().geometry()
+    for x, y in _free_positions(geo.grid, SCENE_ENEMIES, random.Random(3)):
+        scene.enemies.append(scene._spawn_enemy(x, y))
+    scene.enemy_hash.rebuild(scene.enemies)
+    return game, scene
+
+
+def bench_play_scene(samples: int) -> Results:
+    game, scene = _play_scene()
+    player = scene.player
+
+    def update(_) -> None:
+        # Sin morir: la escena cambiaría a GameOver a mitad de la medida
+        player.hp = player.max_hp
+        scene.update(game.sim_dt, IDLE)
+
+    def draw(_) -> None:
+        game.screen.fill(GRAY)
+        scene.draw(game.screen)
+    return {
+        f'play.update[{SCENE_ENEMIES} enemigos]': measure(update, samples),
+        f'play.draw[{SCENE_ENEMIES} enemigos]': measure(draw, samples),
+    }
+
+
+def bench_persistence(samples: int) -> Results:
+    player, inventory, dungeon = Player(WIDTH // 2, HEIGHT // 2), Inventory(), Dungeon()
+    fd, path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        results = {'save_game': measure(lambda _: save_game(path, player, inventory, dungeon), samples)}
+        results['load_game'] = measure(lambda _: load_game(path, player, inventory, dungeon), samples)
+    finally:
+        os.remove(path)
+    return results
+
+
+def bench_startup(samples: int) -> Results:
+    """Arranque hasta el primer frame del menú y paso del menú a la partida.
+
+    Sin contar importar pygame (solo pasa una vez por proceso). Cada muestra
+    empieza sin fuentes ni geometría en caché, como al abrir el juego.
+    """
+    def cold() -> None:
+        fonts.clear()
+        geometry_cache.clear()
+
+    def first_menu_frame(_) -> None:
+        game = Game(MenuScene, seed=1, fps=0, adaptive_quality=False)
+        game.run(max_frames=1)
+
+    def menu_setup() -> Game:
+        cold()
+        game = Game(MenuScene, seed=1, fps=0, adaptive_quality=False)
+        game.run(max_frames=1)
+        return game
+
+    def menu_to_play(game: Game) -> None:
+        game.change_scene(PlayScene)
+        game.run(max_frames=2)
+    return {
+        'startup.menu_first_frame': measure(first_menu_frame, samples, setup=cold),
+        'startup.menu_to_play': measure(menu_to_play, samples, setup=menu_setup),
+    }
+
+
+# Orden de ejecución; --only filtra por el nombre del grupo
+GROUPS: Dict[str, Callable[[int], Results]] = {
+    'room': bench_room,
+    'dungeon': bench_dungeon,
+    'enemies': bench_enemies,
+    'projectiles': bench_projectiles,
+    'play': bench_play_scene,
+    'persistence': bench_persistence,
+    'startup': bench_startup,
+}
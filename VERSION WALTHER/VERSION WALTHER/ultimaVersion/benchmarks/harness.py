@@ -0,0 +1,111 @@
+import json
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pygame
+
+_perf_ns = time.perf_counter_ns
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Percentil con interpolación lineal sobre valores ya ordenados."""
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * p / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def measure(fn: Callable[[Any], Any], samples: int, setup: Optional[Callable[[], Any]] = None,
+            inner: int = 1, warmup: int = 3) -> Dict[str, float]:
+    """Mide fn y devuelve estadísticas en microsegundos por llamada.
+
+    Cada muestra llama a fn `inner` veces seguidas (para funciones de menos
+    de un microsegundo, donde el reloj pesa más que lo medido). setup() se
+    llama antes de cada muestra, fuera del tiempo, y su resultado se pasa a fn.
+    """
+    for _ in range(warmup):
+        arg = setup() if setup is not None else None
+        for _ in range(inner):
+            fn(arg)
+    times: List[float] = []
+    for _ in range(samples):
+        arg = setup() if setup is not None else None
+        t0 = _perf_ns()
+        for _ in range(inner):
+            fn(arg)
+        times.append((_perf_ns() - t0) / 1000.0 / inner)
+    times.sort()
+    stats = {
+        'samples': samples,
+        'inner': inner,
+        'mean_us': sum(times) / len(times),
+        'min_us': times[0],
+        'max_us': times[-1],
+    }
+    for p in PERCENTILES:
+        stats[f'p{p}_us'] = percentile(times, p)
+    return {k: round(v, 3) if isinstance(v, float) else v for k, v in stats.items()}
+
+
+def environment() -> Dict[str, str]:
+    return {
+        'python': sys.version.split()[0],
+        'pygame': pygame.version.ver,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def save_results(path: str, results: Dict[str, Dict[str, float]]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment(), 'results': results}, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Dict[str, float]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['results']
+
+
+def compare(current: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float, metric: str = 'p50_us') -> List[Dict[str, Any]]:
+    """Compara con una línea base; una prueba empeora si metric sube más de threshold (0.15 = 15 %)."""
+    rows = []
+    for name, stats in current.items():
+        base = baseline.get(name)
+        if base is None or metric not in base or base[metric] <= 0:
+            rows.append({'name': name, 'now': stats[metric], 'base': None, 'ratio': None, 'status': 'nuevo'})
+            continue
+        ratio = stats[metric] / base[metric]
+        if ratio > 1.0 + threshold:
+            status = 'PEOR'
+        elif ratio < 1.0 - threshold:
+            status = 'mejor'
+        else:
+            status = 'igual'
+        rows.append({'name': name, 'now': stats[metric], 'base': base[metric], 'ratio': ratio, 'status': status})
+    return rows
+
+
+def print_results(results: Dict[str, Dict[str, float]]) -> None:
+    width = max((len(name) for name in results), default=10)
+    print(f"{'prueba':<{width}}  {'p50 µs':>10}  {'p90 µs':>10}  {'p99 µs':>10}  {'máx µs':>10}")
+    for name, s in results.items():
+        print(f"{name:<{width}}  {s['p50_us']:>10.2f}  {s['p90_us']:>10.2f}  {s['p99_us']:>10.2f}  {s['max_us']:>10.2f}")
+
+
+def print_comparison(rows: List[Dict[str, Any]], metric: str) -> None:
+    width = max((len(r['name']) for r in rows), default=10)
+    print(f"{'prueba':<{width}}  {'base':>10}  {'ahora':>10}  {'cambio':>8}  ({metric})")
+    for r in rows:
+        base = f"{r['base']:.2f}" if r['base'] is not None else '-'
+        change = f"{(r['ratio'] - 1.0) * 100:+.1f}%" if r['ratio'] is not None else '-'
+        print(f"{r['name']:<{width}}  {base:>10}  {r['now']:>10.2f}  {change:>8}  {r['status']}")
@@ -0,0 +1,39 @@
+import pygame
+from typing import Dict, Optional, Tuple
+
+
+class FontRegistry:
+    """Fuentes compartidas por todo el proceso, una por (nombre, tamaño).
+
+    Las escenas piden la fuente aquí en vez de crearla con SysFont cada vez
+    que se construyen: cambiar de escena no vuelve a abrir ni a buscar la
+    fuente, y como text_cache usa la fuente como clave, los textos ya
+    renderizados sirven también a la siguiente escena. Hay que vaciarla al
+    cerrar pygame (las fuentes dejan de ser válidas).
+    """
+
+    def __init__(self) -> None:
+        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self.loads = 0  # fuentes creadas (para depurar/medir)
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+    def clear(self) -> None:
+        self._fonts.clear()
+
+    def get(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        """Fuente del sistema `name` (None: la de pygame) a `size` puntos."""
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            # Sin nombre no hace falta buscar en las fuentes del sistema
+            font = pygame.font.Font(None, size) if name is None else pygame.font.SysFont(name, size)
+            self._fonts[key] = font
+            self.loads += 1
+        return font
+
+
+fonts = FontRegistry()
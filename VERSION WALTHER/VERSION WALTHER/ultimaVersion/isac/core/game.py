@@ -1,45 +1,291 @@
+import os
+import tempfile
+import time
 import pygame
-from typing import Type
+from typing import Callable, List, Optional, Type
 
-from isac.settings import WIDTH, HEIGHT, FPS, TITLE, GRAY
+from isac.settings import (
+    WIDTH, HEIGHT, FPS, TITLE, GRAY, DIRTY_RECTS, SIM_HZ, SIM_MAX_STEPS, MAX_FRAME_TIME, QUALITY_ADAPTIVE,
+)
+from .fonts import fonts
+from .input import IDLE, InputSource, InputState, KeyboardInput
+from .persistence import load_options
+from .profiler import FrameProfiler, FrameTiming, cache_allocations, is_toggle_event
+from .quality import quality
+from .replay import Replay, ReplayRecorder
+from .rng import new_seed
 from .scene import Scene
 
+_perf = time.perf_counter
+
 
 class Game:
-    def __init__(self, initial_scene: Type[Scene]) -> None:
-        pygame.init()
+    def __init__(self, initial_scene: Type[Scene], dirty_rects: bool = DIRTY_RECTS, sim_hz: int = SIM_HZ,
+                 headless: bool = False, render: bool = True, fps: Optional[int] = None,
+                 input_source: Optional[InputSource] = None, seed: Optional[int] = None,
+                 record_path: Optional[str] = None, replay: Optional[Replay] = None,
+                 adaptive_quality: Optional[bool] = None) -> None:
+        # Sin ventana ni audio (servidores, CI): drivers dummy de SDL. Tiene
+        # que decidirse antes de iniciar SDL
+        self.headless = headless
+        if headless:
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+            os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        # Solo lo necesario para el primer frame: pygame.init() abriría además
+        # el mezclador y los mandos (no se usan), lo que más tarda en arrancar
+        pygame.display.init()
+        pygame.font.init()
+        # La pantalla existe también en headless: las escenas convierten
+        # superficies a su formato y pueden dibujar sobre ella
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption(TITLE)
+        if not headless:
+            pygame.display.set_caption(TITLE)
+        # Sonido solo si no es headless y hay mezclador; se abre con init_audio()
+        self.audio = False
+        self._audio_tried = headless
+        self.render = render  # False: se simula sin llamar a draw()
+        # Límite de FPS; en headless y al reproducir por defecto sin límite (0)
+        self.fps = fps if fps is not None else (0 if headless or replay is not None else FPS)
         self.clock = pygame.time.Clock()
         self.running = True
+        self.frames = 0  # frames dados por run()
+        self.ticks = 0   # ticks de simulación dados
+        # Entrada de juego: una instantánea por frame (teclado, guion o grabación)
+        self.input_source: InputSource = input_source if input_source is not None else KeyboardInput()
+        self.input: InputState = IDLE
+        self._unconsumed: Optional[InputState] = None  # pulsaciones de un frame sin ticks
+        # Semilla de las partidas (None: una nueva en cada partida)
+        self.seed = seed
+        # Dificultad impuesta a PlayScene (None: la de options.json)
+        self.difficulty: Optional[str] = None
+        # Ficheros de partida guardada (F5/F9) y de opciones de las escenas
+        self.save_path = 'savegame.json'
+        self.options_path = 'options.json'
+        # Repetición: la semilla, SIM_HZ y la dificultad vienen de la grabación.
+        # Guardar, cargar y cambiar opciones van a un directorio temporal con la
+        # partida guardada de la grabación: no tocan los ficheros del jugador y
+        # F9 carga lo mismo que al grabar
+        self.replay = replay
+        self._replay_frames = iter(replay) if replay is not None else None
+        self._scratch: Optional[tempfile.TemporaryDirectory] = None
+        if replay is not None:
+            self.seed = replay.seed
+            sim_hz = replay.sim_hz
+            self.difficulty = replay.difficulty
+            self._scratch = tempfile.TemporaryDirectory(prefix='isac-replay-')
+            self.save_path = os.path.join(self._scratch.name, 'savegame.json')
+            self.options_path = os.path.join(self._scratch.name, 'options.json')
+            if replay.save:
+                with open(self.save_path, 'wb') as f:
+                    f.write(replay.save)
+        # Grabación: fija semilla, dificultad y la partida guardada de partida
+        # para poder reproducir la sesión
+        self.recorder: Optional[ReplayRecorder] = None
+        if record_path is not None:
+            if self.seed is None:
+                self.seed = new_seed()
+            self.difficulty = load_options(self.options_path)[3]
+            try:
+                with open(self.save_path, 'rb') as f:
+                    save = f.read()
+            except OSError:
+                save = b''
+            self.recorder = ReplayRecorder(record_path, self.seed, sim_hz, self.difficulty, save)
+        self.frame_dt = 0.0  # duración del último frame (s; la grabada al reproducir)
+        # Volcar solo las regiones que informa la escena en vez de la pantalla entera
+        self.dirty_rects = dirty_rects
+        self._full_present = True
+        # Simulación a paso fijo: update() siempre recibe sim_dt; el resto del
+        # frame queda en el acumulador y se usa para interpolar al dibujar
+        self.sim_dt = 1.0 / sim_hz
+        self._accumulator = 0.0
+        self.interp_alpha = 1.0  # fracción del siguiente tick ya transcurrida (0..1)
+        # Perfilador (F3): tiempos por frame y subsistema; apagado casi no cuesta
+        self.profiler = FrameProfiler()
+        # Ganchos de frame (telemetría, herramientas): f(game) al empezar y
+        # f(game, timing) al terminar cada frame
+        self._frame_begin_hooks: List[Callable[["Game"], None]] = []
+        self._frame_end_hooks: List[Callable[["Game", FrameTiming], None]] = []
+        self.last_frame: Optional[FrameTiming] = None
+        # Calidad adaptativa: quita efectos decorativos si el frame no cabe.
+        # Por defecto solo con ventana (en headless el tiempo no es el de un jugador)
+        if adaptive_quality is None:
+            adaptive_quality = QUALITY_ADAPTIVE and not headless
+        self.adaptive_quality = adaptive_quality
+        quality.reset()
+        if adaptive_quality:
+            self.on_frame_end(quality.on_frame)
 
         self.scene: Scene = initial_scene(self)
         self.scene.start()
 
+    def init_audio(self) -> bool:
+        """Abre el mezclador la primera vez que se pide; dice si hay sonido."""
+        if not self._audio_tried:
+            self._audio_tried = True
+            try:
+                pygame.mixer.init()
+            except pygame.error:
+                pass  # sin dispositivo de audio se juega sin sonido
+            self.audio = pygame.mixer.get_init() is not None
+        return self.audio
+
     def change_scene(self, scene_type: Type[Scene]) -> None:
         self.scene.stop()
         self.scene = scene_type(self)
         self.scene.start()
+        self._full_present = True
 
-    def run(self) -> None:
+    def run(self, max_frames: Optional[int] = None) -> None:
+        prof = self.profiler
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+            if max_frames is not None and self.frames >= max_frames:
+                break
+            frame_dt = self.clock.tick(self.fps) / 1000.0
+            if self.headless:
+                # Tiempo simulado, no de reloj: un tick por frame, tan rápido
+                # como dé la CPU y con el mismo resultado en cualquier máquina
+                frame_dt = self.sim_dt
+            for hook in self._frame_begin_hooks:
+                hook(self)
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                else:
-                    self.scene.handle_event(event)
+            t_start = _perf()
+            if self._replay_frames is not None:
+                steps = self._replay_frame()
+                if not self.running:
+                    break
+            else:
+                events = pygame.event.get()
+                for event in events:
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    elif is_toggle_event(event):
+                        self.toggle_profiler()
+                    else:
+                        self.scene.handle_event(event)
 
-            self.scene.update(dt)
+                self.frame_dt = frame_dt
+                steps = self.advance(frame_dt, self.input_source.poll(events))
+                if self.recorder is not None:
+                    self.recorder.record(self.input, steps, frame_dt, events)
+            self.frames += 1
+            t_update = t_draw = _perf()
 
-            # Clear
-            self.screen.fill(GRAY)
+            if self.render:
+                # Clear
+                self.screen.fill(GRAY)
 
-            # Draw scene
-            self.scene.draw(self.screen)
+                # Draw scene
+                self.scene.draw(self.screen)
 
-            # Flip
-            pygame.display.flip()
+                if prof.enabled:
+                    # El overlay no está en las regiones sucias de la escena
+                    prof.draw(self.screen)
+                    self._full_present = True
+                t_draw = _perf()
+                self.present()
+            t_end = _perf()
+
+            timing = FrameTiming(self.frames, self.frame_dt, steps, t_end - t_start,
+                                 t_update - t_start, t_draw - t_update, t_end - t_draw)
+            self.last_frame = timing
+            if prof.enabled:
+                counts = dict(self.scene.profile_counts())
+                if self.adaptive_quality:
+                    counts['quality-'] = quality.dropped
+                prof.end_frame(timing, counts, cache_allocations() + self.scene.surface_allocations())
+            for hook in self._frame_end_hooks:
+                hook(self, timing)
+
+        # Con max_frames se puede volver a llamar a run() y seguir la partida
+        if self.recorder is not None:
+            self.recorder.flush()
+        if not self.running:
+            if self.recorder is not None:
+                self.recorder.close()
+            if self._scratch is not None:
+                self._scratch.cleanup()
+            fonts.clear()
+            pygame.quit()
+
+    def _replay_frame(self) -> int:
+        """Repite un frame grabado: sus teclas y exactamente sus ticks."""
+        frame = next(self._replay_frames, None)
+        if frame is None:
+            self.running = False
+            return 0
+        # Vaciar la cola de SDL (y permitir cerrar la ventana o abrir el perfilador)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif is_toggle_event(event):
+                self.toggle_profiler()
+        for event in frame.events():
+            self.scene.handle_event(event)
+        self.frame_dt = frame.frame_dt
+        self.input = frame.input
+        self.simulate(frame.ticks, frame.input)
+        self.interp_alpha = 1.0
+        return frame.ticks
+
+    def on_frame_begin(self, hook: Callable[["Game"], None]) -> None:
+        self._frame_begin_hooks.append(hook)
 
-        pygame.quit()
+    def on_frame_end(self, hook: Callable[["Game", FrameTiming], None]) -> None:
+        self._frame_end_hooks.append(hook)
+
+    def remove_frame_hook(self, hook: Callable) -> None:
+        for hooks in (self._frame_begin_hooks, self._frame_end_hooks):
+            if hook in hooks:
+                hooks.remove(hook)
+
+    def toggle_profiler(self) -> None:
+        self.profiler.toggle()
+        self._full_present = True  # al apagarlo hay que borrar el overlay
+
+    def advance(self, frame_dt: float, inp: InputState = IDLE) -> int:
+        """Simula frame_dt segundos en ticks fijos de sim_dt; devuelve los ticks dados.
+
+        Las pulsaciones de inp llegan solo al primer tick; si el frame no da
+        ningún tick se guardan para el siguiente.
+        """
+        if self._unconsumed is not None:
+            inp = inp.with_presses_of(self._unconsumed)
+            self._unconsumed = None
+        self.input = inp
+        # Un tirón (guardar, leer disco...) no debe convertirse en un dt enorme
+        self._accumulator += min(frame_dt, MAX_FRAME_TIME)
+        steps = 0
+        while self._accumulator >= self.sim_dt and self.running:
+            if steps >= SIM_MAX_STEPS:
+                # Si simular cuesta más que el tiempo real, se descarta el
+                # retraso (el juego va más lento) en vez de acumularlo
+                self._accumulator = 0.0
+                break
+            self.scene.update(self.sim_dt, inp)
+            inp = inp.held()
+            self._accumulator -= self.sim_dt
+            steps += 1
+        if steps == 0 and inp.held() is not inp:
+            self._unconsumed = inp
+        self.ticks += steps
+        self.interp_alpha = min(1.0, self._accumulator / self.sim_dt)
+        return steps
+
+    def simulate(self, ticks: int, inp: InputState = IDLE) -> None:
+        """Da exactamente `ticks` ticks con la entrada (pulsaciones solo en el primero)."""
+        for _ in range(ticks):
+            if not self.running:
+                break
+            self.scene.update(self.sim_dt, inp)
+            inp = inp.held()
+            self.ticks += 1
+
+    def present(self) -> None:
+        """Vuelca el frame: entero, o solo las regiones sucias de la escena."""
+        rects = self.scene.dirty_rects() if self.dirty_rects else None
+        if rects is None or self._full_present:
+            self._full_present = False
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
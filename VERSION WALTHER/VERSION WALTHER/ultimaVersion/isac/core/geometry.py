@@ -0,0 +1,282 @@
+import numpy as np
+import pygame
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from isac.settings import (
+    WIDTH,
+    HEIGHT,
+    ROOM_PADDING,
+    TILE,
+    OBSTACLE_DENSITY,
+    CORRIDOR_WIDTH_TILES,
+    OBSTACLE_MAX_PER_ROOM,
+    DIFFICULTY_PRESETS,
+    DEFAULT_DIFFICULTY,
+)
+
+DIRECTIONS = ('up', 'down', 'left', 'right')
+
+# Flags de celda de la rejilla de ocupación
+CELL_OBSTACLE = 1  # la celda entera es sólida (obstáculo alineado a TILE)
+CELL_WALL = 2      # la celda contiene parte de una pared (requiere test exacto)
+
+
+class OccupancyGrid:
+    """Rejilla de ocupación por tile para colisiones estáticas.
+
+    Los obstáculos ocupan celdas completas, así que basta mirar la celda. Las
+    paredes no están alineadas a TILE: sus celdas se marcan como parciales y
+    solo entonces se prueba el rect contra las (cuatro) paredes.
+    El coste de una consulta depende del tamaño del rect, no del número de
+    obstáculos ni del tamaño de la sala.
+    """
+
+    def __init__(self, walls: List[pygame.Rect], obstacles: List[pygame.Rect]) -> None:
+        self.cols = (WIDTH + TILE - 1) // TILE
+        self.rows = (HEIGHT + TILE - 1) // TILE
+        self.cells = bytearray(self.cols * self.rows)
+        self._walls = walls
+        for rect in obstacles:
+            self._mark(rect, CELL_OBSTACLE)
+        for rect in walls:
+            self._mark(rect, CELL_WALL)
+        # Vista NumPy de cells (comparte memoria) para consultas vectorizadas
+        self._grid = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.rows, self.cols)
+        self._wall_bounds = np.array([(w.left, w.top, w.right, w.bottom) for w in walls], dtype=np.int64).reshape(-1, 4)
+
+    def _cell_range(self, rect: pygame.Rect) -> Tuple[int, int, int, int]:
+        tx0 = max(0, rect.left // TILE)
+        ty0 = max(0, rect.top // TILE)
+        tx1 = min(self.cols - 1, (rect.right - 1) // TILE)
+        ty1 = min(self.rows - 1, (rect.bottom - 1) // TILE)
+        return tx0, ty0, tx1, ty1
+
+    def _mark(self, rect: pygame.Rect, flag: int) -> None:
+        tx0, ty0, tx1, ty1 = self._cell_range(rect)
+        for ty in range(ty0, ty1 + 1):
+            row = ty * self.cols
+            for tx in range(tx0, tx1 + 1):
+                self.cells[row + tx] |= flag
+
+    def is_blocked(self, tx: int, ty: int) -> bool:
+        """True si la celda (tx, ty) contiene algo sólido o está fuera de la sala."""
+        if tx < 0 or ty < 0 or tx >= self.cols or ty >= self.rows:
+            return True
+        return self.cells[ty * self.cols + tx] != 0
+
+    def collides(self, rect: pygame.Rect, walls: bool = True, obstacles: bool = True) -> bool:
+        """Equivalente a colisionar rect contra paredes y/u obstáculos de la sala."""
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        mask = (CELL_WALL if walls else 0) | (CELL_OBSTACLE if obstacles else 0)
+        tx0, ty0, tx1, ty1 = self._cell_range(rect)
+        cells = self.cells
+        near_wall = False
+        for ty in range(ty0, ty1 + 1):
+            row = ty * self.cols
+            for tx in range(tx0, tx1 + 1):
+                c = cells[row + tx] & mask
+                if c & CELL_OBSTACLE:
+                    return True
+                if c:
+                    near_wall = True
+        return near_wall and rect.collidelist(self._walls) != -1
+
+    def collides_many(self, left: np.ndarray, top: np.ndarray, width: int, height: int,
+                      walls: bool = True, obstacles: bool = True) -> np.ndarray:
+        """Versión vectorizada de collides() para N rects del mismo tamaño."""
+        left = np.asarray(left, dtype=np.int64)
+        top = np.asarray(top, dtype=np.int64)
+        right = left + width
+        bottom = top + height
+        hit = np.zeros(left.shape, dtype=bool)
+        # Paredes: test exacto contra sus rects (son pocas)
+        if walls:
+            for wl, wt, wr, wb in self._wall_bounds:
+                hit |= (left < wr) & (right > wl) & (top < wb) & (bottom > wt)
+        if not obstacles:
+            return hit
+        # Obstáculos: celdas cubiertas por cada rect (como mucho span x span)
+        tx0 = left // TILE
+        ty0 = top // TILE
+        tx1 = (right - 1) // TILE
+        ty1 = (bottom - 1) // TILE
+        span_x = (width + TILE - 1) // TILE + 1
+        span_y = (height + TILE - 1) // TILE + 1
+        for oy in range(span_y):
+            ty = ty0 + oy
+            row_ok = (ty <= ty1) & (ty >= 0) & (ty < self.rows)
+            for ox in range(span_x):
+                tx = tx0 + ox
+                ok = row_ok & (tx <= tx1) & (tx >= 0) & (tx < self.cols)
+                if ok.any():
+                    cell = self._grid[np.where(ok, ty, 0), np.where(ok, tx, 0)]
+                    hit |= ok & ((cell & CELL_OBSTACLE) != 0)
+        return hit
+
+
+@dataclass
+class RoomGeometry:
+    """Geometría estática de una sala: paredes, puertas, obstáculos y rejilla.
+
+    Las listas son compartidas por todos los usuarios de la caché: no mutarlas.
+    """
+    pos: Tuple[int, int]
+    difficulty: str
+    walls: List[pygame.Rect]
+    obstacles: List[pygame.Rect]
+    doors: Dict[str, pygame.Rect]
+    grid: OccupancyGrid
+
+
+def build_walls() -> List[pygame.Rect]:
+    # Paredes rectangulares alrededor de los bordes con padding
+    p = ROOM_PADDING
+    return [
+        pygame.Rect(p, p, WIDTH - 2 * p, 10),  # top
+        pygame.Rect(p, HEIGHT - p - 10, WIDTH - 2 * p, 10),  # bottom
+        pygame.Rect(p, p, 10, HEIGHT - 2 * p),  # left
+        pygame.Rect(WIDTH - p - 10, p, 10, HEIGHT - 2 * p),  # right
+    ]
+
+
+def build_door_rect(direction: str) -> pygame.Rect:
+    p = ROOM_PADDING
+    w = 60
+    h = 20
+    if direction == 'up':
+        return pygame.Rect(WIDTH // 2 - w // 2, p - 5, w, h)
+    if direction == 'down':
+        return pygame.Rect(WIDTH // 2 - w // 2, HEIGHT - p - h + 5, w, h)
+    if direction == 'left':
+        return pygame.Rect(p - 5, HEIGHT // 2 - w // 2, h, w)
+    if direction == 'right':
+        return pygame.Rect(WIDTH - p - h + 5, HEIGHT // 2 - w // 2, h, w)
+    return pygame.Rect(0, 0, 0, 0)
+
+
+def build_obstacles(pos: Tuple[int, int], difficulty: str) -> List[pygame.Rect]:
+    """Genera obstáculos tipo tilemap (TILE x TILE) de forma determinística.
+    Diseño más limpio: menos densidad, pasillos centrales más anchos
+    y un límite superior de obstáculos por sala. Siempre despeja puertas.
+    """
+    gx, gy = pos
+    seed = (gx * 73856093) ^ (gy * 19349663)
+    p = ROOM_PADDING
+
+    preset = DIFFICULTY_PRESETS.get(difficulty, DIFFICULTY_PRESETS[DEFAULT_DIFFICULTY])
+    obs_density = max(0.0, min(1.0, OBSTACLE_DENSITY * float(preset.get('obstacle_density_scale', 1.0))))
+    obs_max = max(0, int(round(OBSTACLE_MAX_PER_ROOM * float(preset.get('obstacle_max_scale', 1.0)))))
+
+    # Rango interior alineado a la cuadrícula
+    start_x = (p + TILE - 1) // TILE * TILE
+    start_y = (p + TILE - 1) // TILE * TILE
+    end_x = ((WIDTH - p) // TILE) * TILE
+    end_y = ((HEIGHT - p) // TILE) * TILE
+
+    cx = WIDTH // 2
+    cy = HEIGHT // 2
+
+    blocked: List[pygame.Rect] = []
+
+    def rng_cell(tx: int, ty: int) -> int:
+        # PRNG simple por celda con hashing determinista
+        v = seed ^ (tx * 2654435761 & 0xFFFFFFFF) ^ (ty * 97531 & 0xFFFFFFFF)
+        v ^= (v << 13) & 0xFFFFFFFF
+        v ^= (v >> 17)
+        v ^= (v << 5) & 0xFFFFFFFF
+        return v & 0xFF
+
+    # Generación base: baja densidad, excepto pasillos centrales (ajustable)
+    corridor_px = max(1, CORRIDOR_WIDTH_TILES) * TILE // 2
+    threshold = int(obs_density * 255)
+    for y in range(start_y, end_y, TILE):
+        for x in range(start_x, end_x, TILE):
+            # Pasillos centrales (cruz) despejados y ajustables en ancho
+            if abs(y + TILE // 2 - cy) <= corridor_px or abs(x + TILE // 2 - cx) <= corridor_px:
+                continue
+            if rng_cell(x // TILE, y // TILE) >= threshold:
+                continue
+            blocked.append(pygame.Rect(x, y, TILE, TILE))
+
+    # Despejar frente a puertas para no bloquear accesos
+    door_w = 3 * TILE
+    door_h = 2 * TILE
+    clear_areas = [
+        pygame.Rect(cx - door_w // 2, p, door_w, door_h),  # up
+        pygame.Rect(cx - door_w // 2, HEIGHT - p - door_h, door_w, door_h),  # down
+        pygame.Rect(p, cy - door_w // 2, door_h, door_w),  # left
+        pygame.Rect(WIDTH - p - door_h, cy - door_w // 2, door_h, door_w),  # right
+    ]
+    blocked = [r for r in blocked if r.collidelist(clear_areas) == -1]
+
+    # Limitar cantidad total de obstáculos para un look más limpio (determinista)
+    # Ordenamos por un score determinista y recortamos a un máximo.
+    blocked.sort(key=lambda rc: rng_cell(rc.x // TILE, rc.y // TILE))
+    if len(blocked) > obs_max:
+        blocked = blocked[:obs_max]
+
+    return blocked
+
+
+class RoomGeometryCache:
+    """Caché de geometría por (posición de sala, dificultad).
+
+    La dificultad activa se lee de options.json una sola vez; la escena la
+    actualiza con set_difficulty() cuando el jugador la cambia, lo que
+    invalida la caché.
+    """
+
+    def __init__(self, options_path: str = 'options.json') -> None:
+        self._options_path = options_path
+        self._difficulty: str | None = None
+        self._rooms: Dict[Tuple[Tuple[int, int], str], RoomGeometry] = {}
+        self._walls: List[pygame.Rect] | None = None
+        self._doors: Dict[str, pygame.Rect] | None = None
+
+    @property
+    def difficulty(self) -> str:
+        if self._difficulty is None:
+            # Import local para evitar import circular (persistence -> dungeon -> room)
+            from isac.core.persistence import load_options
+            try:
+                ok, _snd, _vol, diff = load_options(self._options_path)
+            except Exception:
+                ok, diff = False, DEFAULT_DIFFICULTY
+            self._difficulty = diff if ok and diff in DIFFICULTY_PRESETS else DEFAULT_DIFFICULTY
+        return self._difficulty
+
+    def set_difficulty(self, difficulty: str) -> None:
+        diff = difficulty if difficulty in DIFFICULTY_PRESETS else DEFAULT_DIFFICULTY
+        if diff != self._difficulty:
+            self._difficulty = diff
+            self.clear()
+
+    def clear(self) -> None:
+        self._rooms.clear()
+
+    def get(self, pos: Tuple[int, int]) -> RoomGeometry:
+        difficulty = self.difficulty
+        key = (pos, difficulty)
+        geo = self._rooms.get(key)
+        if geo is None:
+            # Paredes y puertas son iguales en todas las salas: se comparten
+            if self._walls is None:
+                self._walls = build_walls()
+                self._doors = {d: build_door_rect(d) for d in DIRECTIONS}
+            obstacles = build_obstacles(pos, difficulty)
+            geo = RoomGeometry(
+                pos=pos,
+                difficulty=difficulty,
+                walls=self._walls,
+                obstacles=obstacles,
+                doors=self._doors,
+                grid=OccupancyGrid(self._walls, obstacles),
+            )
+            self._rooms[key] = geo
+        return geo
+
+
+# Instancia compartida por escenas, entidades y render
+geometry_cache = RoomGeometryCache()
@@ -0,0 +1,49 @@
+import pygame
+from typing import Callable, Hashable, Optional
+
+
+class RetainedLayer:
+    """Franja de pantalla que se recompone solo cuando cambia su estado.
+
+    `invalidate()` la marca como sucia (se conecta a las notificaciones de
+    cambio del inventario y del jugador); además `surface(key)` la recompone
+    si cambió la clave de estado que no emite notificaciones (p. ej. la
+    magia, que se regenera cada frame). La Surface se crea una vez y se
+    repinta en el sitio; en régimen estable dibujarla es un único blit en
+    `rect`. `paint` pinta en coordenadas de la franja.
+    """
+
+    def __init__(self, rect: pygame.Rect, paint: Callable[[pygame.Surface], None]) -> None:
+        self.rect = pygame.Rect(rect)
+        self._paint = paint
+        self._surface: Optional[pygame.Surface] = None
+        self._key: Hashable = None
+        self._dirty = True
+        self.composites = 0  # recomposiciones (para depurar/medir)
+
+    def invalidate(self) -> None:
+        self._dirty = True
+
+    def surface(self, key: Hashable = None) -> pygame.Surface:
+        if self._surface is None or self._dirty or key != self._key:
+            surf = self._surface
+            if surf is None:
+                surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+                if pygame.display.get_surface() is not None:
+                    surf = surf.convert_alpha()
+                self._surface = surf
+            else:
+                # Sin RLE mientras se pinta: con el alpha RLE activo, los
+                # blits con antialias sobre ella no se mezclan igual
+                surf.set_alpha(255)
+            surf.fill((0, 0, 0, 0))
+            self._paint(surf)
+            # RLE: la franja es casi toda transparente (como la de las salas)
+            surf.set_alpha(255, pygame.RLEACCEL)
+            self._key = key
+            self._dirty = False
+            self.composites += 1
+        return self._surface
+
+    def blit(self, target: pygame.Surface, key: Hashable = None) -> None:
+        target.blit(self.surface(key), self.rect.topleft)
@@ -0,0 +1,104 @@
+import pygame
+from dataclasses import dataclass, replace
+from typing import Callable, Iterable, Iterator, List, Optional, Union
+
+# Teclas de juego (la navegación de menús y la pausa siguen con eventos)
+KEYS_LEFT = (pygame.K_LEFT, pygame.K_a)
+KEYS_RIGHT = (pygame.K_RIGHT, pygame.K_d)
+KEYS_UP = (pygame.K_UP, pygame.K_w)
+KEYS_DOWN = (pygame.K_DOWN, pygame.K_s)
+KEY_SHIELD = pygame.K_k
+KEY_MELEE = pygame.K_j
+KEY_FIRE = pygame.K_l
+KEY_BOMB = pygame.K_b
+KEY_INTERACT = pygame.K_e
+
+
+@dataclass(frozen=True)
+class InputState:
+    """Entrada de juego de un frame.
+
+    move_x/move_y valen -1, 0 o 1; shield se mantiene pulsado; melee, fire,
+    bomb e interact son pulsaciones (solo verdaderas en el frame en que se
+    pulsaron).
+    """
+
+    move_x: int = 0
+    move_y: int = 0
+    shield: bool = False
+    melee: bool = False
+    fire: bool = False
+    bomb: bool = False
+    interact: bool = False
+
+    def held(self) -> "InputState":
+        """La misma entrada sin las pulsaciones (para los ticks siguientes del frame)."""
+        if not (self.melee or self.fire or self.bomb or self.interact):
+            return self
+        return replace(self, melee=False, fire=False, bomb=False, interact=False)
+
+    def with_presses_of(self, other: "InputState") -> "InputState":
+        """Esta entrada con además las pulsaciones de other (que aún no se consumieron)."""
+        return replace(self, melee=self.melee or other.melee, fire=self.fire or other.fire,
+                       bomb=self.bomb or other.bomb, interact=self.interact or other.interact)
+
+
+IDLE = InputState()
+
+
+class InputSource:
+    """Fuente de entrada: construye un InputState por frame."""
+
+    def poll(self, events: List[pygame.event.Event]) -> InputState:
+        return IDLE
+
+
+class KeyboardInput(InputSource):
+    """Entrada desde el teclado: teclas mantenidas más los KEYDOWN del frame."""
+
+    def poll(self, events: List[pygame.event.Event]) -> InputState:
+        keys = pygame.key.get_pressed()
+        # Mismo criterio que antes: derecha gana a izquierda y abajo a arriba
+        move_x = move_y = 0
+        if any(keys[k] for k in KEYS_LEFT):
+            move_x = -1
+        if any(keys[k] for k in KEYS_RIGHT):
+            move_x = 1
+        if any(keys[k] for k in KEYS_UP):
+            move_y = -1
+        if any(keys[k] for k in KEYS_DOWN):
+            move_y = 1
+        pressed = {e.key for e in events if e.type == pygame.KEYDOWN}
+        return InputState(
+            move_x=move_x,
+            move_y=move_y,
+            shield=bool(keys[KEY_SHIELD]),
+            melee=KEY_MELEE in pressed,
+            fire=KEY_FIRE in pressed,
+            bomb=KEY_BOMB in pressed,
+            interact=KEY_INTERACT in pressed,
+        )
+
+
+class ScriptedInput(InputSource):
+    """Entrada desde un guion: una secuencia de InputState o una función del frame.
+
+    Cuando la secuencia se acaba devuelve IDLE (y `finished` pasa a True).
+    """
+
+    def __init__(self, script: Union[Iterable[InputState], Callable[[int], Optional[InputState]]]) -> None:
+        self._func: Optional[Callable[[int], Optional[InputState]]] = script if callable(script) else None
+        self._states: Optional[Iterator[InputState]] = None if callable(script) else iter(script)
+        self.frame = 0
+        self.finished = False
+
+    def poll(self, events: List[pygame.event.Event]) -> InputState:
+        if self._func is not None:
+            state = self._func(self.frame)
+        else:
+            state = next(self._states, None)
+        self.frame += 1
+        if state is None:
+            self.finished = True
+            return IDLE
+        return state
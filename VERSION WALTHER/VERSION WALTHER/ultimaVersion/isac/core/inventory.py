@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Callable, List
 
 
 @dataclass
@@ -6,6 +7,15 @@ class Inventory:
     bombs: int = 0
     keys: int = 0
     arrows: int = 0
+    # Callbacks avisados cuando cambia algún contador (p. ej. el HUD)
+    _listeners: List[Callable[[], None]] = field(default_factory=list, repr=False, compare=False)
+
+    def subscribe(self, callback: Callable[[], None]) -> None:
+        self._listeners.append(callback)
+
+    def notify_changed(self) -> None:
+        for callback in self._listeners:
+            callback()
 
     def add(self, item_type: str, amount: int = 1) -> None:
         if item_type == "bomb":
@@ -14,21 +24,27 @@ class Inventory:
             self.keys += amount
         elif item_type == "arrow":
             self.arrows += amount
+        else:
+            return
+        self.notify_changed()
 
     def use_bomb(self) -> bool:
         if self.bombs > 0:
             self.bombs -= 1
+            self.notify_changed()
             return True
         return False
 
     def use_key(self) -> bool:
         if self.keys > 0:
             self.keys -= 1
+            self.notify_changed()
             return True
         return False
 
     def use_arrow(self) -> bool:
         if self.arrows > 0:
             self.arrows -= 1
+            self.notify_changed()
             return True
         return False
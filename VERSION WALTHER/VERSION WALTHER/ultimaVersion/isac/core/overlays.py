@@ -0,0 +1,48 @@
+import pygame
+from typing import Dict, Tuple
+
+Color = Tuple[int, int, int]
+
+
+class OverlayCache:
+    """Superficies de color liso para overlays translúcidos (fades, pausa, flashes, bandas).
+
+    Se crea una Surface opaca por (tamaño, color) la primera vez y después
+    se reutiliza cambiando su alpha de superficie con set_alpha antes de cada
+    blit, en vez de crear una Surface SRCALPHA nueva por frame.
+    """
+
+    def __init__(self) -> None:
+        self._surfaces: Dict[Tuple[Tuple[int, int], Color], pygame.Surface] = {}
+        self.builds = 0  # superficies creadas (para depurar/medir)
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+    def solid(self, size: Tuple[int, int], color: Color, alpha: int = 255) -> pygame.Surface:
+        key = (tuple(size), tuple(color))
+        surf = self._surfaces.get(key)
+        if surf is None:
+            surf = pygame.Surface(key[0])
+            # Formato del display para blits rápidos (si ya hay ventana)
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert()
+            surf.fill(key[1])
+            self._surfaces[key] = surf
+            self.builds += 1
+        surf.set_alpha(max(0, min(255, int(alpha))))
+        return surf
+
+    def blit(self, target: pygame.Surface, pos: Tuple[int, int], size: Tuple[int, int],
+             color: Color, alpha: int) -> None:
+        """Mezcla un rectángulo `size` de `color` a `alpha` (0..255) sobre `target` en `pos`."""
+        if alpha <= 0:
+            return
+        target.blit(self.solid(size, color, alpha), pos)
+
+
+# Instancia compartida por todas las escenas
+overlay_cache = OverlayCache()
@@ -0,0 +1,151 @@
+import heapq
+import math
+import numpy as np
+import pygame
+from typing import List, Optional, Tuple
+
+from isac.settings import TILE, ENEMY_SIZE
+from .geometry import OccupancyGrid
+
+# Coste de paso ortogonal y diagonal (enteros para Dijkstra)
+STEP_COST = 10
+DIAG_COST = 14
+UNREACHABLE = -1
+
+_NEIGHBORS = (
+    (1, 0, STEP_COST), (-1, 0, STEP_COST), (0, 1, STEP_COST), (0, -1, STEP_COST),
+    (1, 1, DIAG_COST), (1, -1, DIAG_COST), (-1, 1, DIAG_COST), (-1, -1, DIAG_COST),
+)
+
+
+class FlowField:
+    """Campo de flujo compartido por todos los enemigos de la sala.
+
+    Un Dijkstra desde el tile del jugador sobre la rejilla de ocupación deja,
+    para cada tile alcanzable, el siguiente tile del camino más corto. Solo se
+    recalcula cuando el jugador cambia de tile o cambia la sala; cada enemigo
+    se limita a consultar su tile.
+    """
+
+    def __init__(self, agent_size: int = ENEMY_SIZE) -> None:
+        self.agent_size = agent_size
+        self.grid: Optional[OccupancyGrid] = None
+        self.target: Optional[Tuple[int, int]] = None
+        self.cols = 0
+        self.rows = 0
+        self._walkable = bytearray()
+        self._dist: List[int] = []
+        self._step: List[int] = []
+        # Centro del siguiente tile por tile (NaN si no hay paso), para consultas vectorizadas
+        self.step_x = np.empty(0)
+        self.step_y = np.empty(0)
+        self.recomputes = 0  # contador para depurar/medir
+
+    def _build_walkable(self, grid: OccupancyGrid) -> None:
+        # Un tile es transitable si un enemigo centrado en él no choca con nada
+        self.cols, self.rows = grid.cols, grid.rows
+        self._walkable = bytearray(self.cols * self.rows)
+        probe = pygame.Rect(0, 0, self.agent_size, self.agent_size)
+        for ty in range(self.rows):
+            for tx in range(self.cols):
+                probe.center = (tx * TILE + TILE // 2, ty * TILE + TILE // 2)
+                if not grid.collides(probe):
+                    self._walkable[ty * self.cols + tx] = 1
+
+    def update(self, grid: OccupancyGrid, target_pos: Tuple[int, int]) -> None:
+        """Recalcula el campo si cambió la rejilla (sala) o el tile objetivo."""
+        tx = min(max(0, int(target_pos[0]) // TILE), grid.cols - 1)
+        ty = min(max(0, int(target_pos[1]) // TILE), grid.rows - 1)
+        if grid is not self.grid:
+            self.grid = grid
+            self._build_walkable(grid)
+            self.target = None
+        if (tx, ty) == self.target:
+            return
+        self.target = (tx, ty)
+        self._compute()
+
+    def _compute(self) -> None:
+        cols, rows = self.cols, self.rows
+        walkable = self._walkable
+        dist = [UNREACHABLE] * (cols * rows)
+        nxt = [UNREACHABLE] * (cols * rows)
+        tx, ty = self.target
+        start = ty * cols + tx
+        # El tile del jugador siempre es semilla, aunque no sea transitable
+        dist[start] = 0
+        heap = [(0, start)]
+        while heap:
+            d, i = heapq.heappop(heap)
+            if d != dist[i]:
+                continue
+            cx, cy = i % cols, i // cols
+            for dx, dy, cost in _NEIGHBORS:
+                nx, ny = cx + dx, cy + dy
+                if nx < 0 or ny < 0 or nx >= cols or ny >= rows:
+                    continue
+                j = ny * cols + nx
+                if not walkable[j]:
+                    continue
+                # Sin cortar esquinas: en diagonal ambos ortogonales deben estar libres
+                if dx and dy and not (walkable[cy * cols + nx] and walkable[ny * cols + cx]):
+                    continue
+                nd = d + cost
+                if dist[j] == UNREACHABLE or nd < dist[j]:
+                    dist[j] = nd
+                    nxt[j] = i  # desde j se avanza hacia i
+                    heapq.heappush(heap, (nd, j))
+        self._dist = dist
+
+        # Paso por tile: siguiente tile del camino. Un enemigo descentrado puede
+        # estar en un tile no transitable: entra al vecino alcanzable más cercano.
+        # Si el paso es el tile del jugador no hay paso (se va directo a él).
+        step = [UNREACHABLE] * (cols * rows)
+        step_x = np.full(cols * rows, np.nan)
+        step_y = np.full(cols * rows, np.nan)
+        for i in range(cols * rows):
+            n = nxt[i]
+            if n == UNREACHABLE and dist[i] != 0:
+                n = self._best_neighbor(i % cols, i // cols)
+            if n == UNREACHABLE or dist[n] == 0:
+                continue
+            step[i] = n
+            step_x[i] = (n % cols) * TILE + TILE // 2
+            step_y[i] = (n // cols) * TILE + TILE // 2
+        self._step = step
+        self.step_x = step_x
+        self.step_y = step_y
+        self.recomputes += 1
+
+    def _best_neighbor(self, tx: int, ty: int) -> int:
+        best, best_d = UNREACHABLE, -1
+        for dx, dy, _cost in _NEIGHBORS:
+            nx, ny = tx + dx, ty + dy
+            if nx < 0 or ny < 0 or nx >= self.cols or ny >= self.rows:
+                continue
+            j = ny * self.cols + nx
+            d = self._dist[j]
+            if d != UNREACHABLE and (best_d < 0 or d < best_d):
+                best, best_d = j, d
+        return best
+
+    def direction_at(self, pos: Tuple[int, int]) -> Optional[Tuple[float, float]]:
+        """Dirección normalizada hacia el siguiente tile del camino.
+
+        Devuelve None si no hay campo, el tile no es alcanzable o el siguiente
+        paso ya es el tile del jugador (entonces conviene ir directo a él).
+        """
+        if self.grid is None:
+            return None
+        tx, ty = int(pos[0]) // TILE, int(pos[1]) // TILE
+        if tx < 0 or ty < 0 or tx >= self.cols or ty >= self.rows:
+            return None
+        n = self._step[ty * self.cols + tx]
+        if n == UNREACHABLE:
+            return None
+        dx = (n % self.cols) * TILE + TILE // 2 - pos[0]
+        dy = (n // self.cols) * TILE + TILE // 2 - pos[1]
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return None
+        return dx / length, dy / length
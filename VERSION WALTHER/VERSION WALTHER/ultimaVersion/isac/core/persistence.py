@@ -54,6 +54,8 @@ def load_game(path: str, player: Player, inv: Inventory, dungeon: Dungeon) -> bo
     if isinstance(cur, (list, tuple)) and len(cur) == 2:
         dungeon.current = (int(cur[0]), int(cur[1]))
 
+    player.notify_changed()
+    inv.notify_changed()
     return True
 
 
@@ -0,0 +1,58 @@
+from typing import Callable, Dict, Generic, List, TypeVar
+
+T = TypeVar('T')
+
+
+class ObjectPool(Generic[T]):
+    """Pool de objetos reutilizables con lista libre.
+
+    Se preasignan `capacity` objetos; acquire() saca uno de la lista libre y
+    release() lo devuelve. Si se agota, crea uno nuevo y lo cuenta en
+    `overflows` (señal de que la capacidad se quedó corta).
+    Los objetos deben tener atributo `alive`.
+    """
+
+    def __init__(self, factory: Callable[[], T], capacity: int, name: str = '') -> None:
+        self.name = name
+        self._factory = factory
+        self._free: List[T] = [factory() for _ in range(capacity)]
+        self.capacity = capacity
+        self.in_use = 0
+        self.peak = 0
+        self.overflows = 0
+
+    def acquire(self) -> T:
+        if self._free:
+            obj = self._free.pop()
+        else:
+            obj = self._factory()
+            self.capacity += 1
+            self.overflows += 1
+        self.in_use += 1
+        if self.in_use > self.peak:
+            self.peak = self.in_use
+        return obj
+
+    def release(self, obj: T) -> None:
+        self.in_use -= 1
+        self._free.append(obj)
+
+    def sweep(self, items: List[T]) -> None:
+        """Libera los objetos muertos de items y la compacta en el sitio."""
+        j = 0
+        for obj in items:
+            if obj.alive:
+                items[j] = obj
+                j += 1
+            else:
+                self.release(obj)
+        del items[j:]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'in_use': self.in_use,
+            'free': len(self._free),
+            'capacity': self.capacity,
+            'peak': self.peak,
+            'overflows': self.overflows,
+        }
@@ -0,0 +1,163 @@
+import time
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import pygame
+
+from isac.settings import PROFILER_HISTORY, PROFILER_REFRESH, FPS
+from .fonts import fonts
+from .overlays import overlay_cache
+from .sprites import sprite_cache
+from .text import text_cache
+
+_perf = time.perf_counter
+
+PROFILER_KEY = pygame.K_F3
+
+
+class FrameTiming(NamedTuple):
+    """Tiempos de un frame de Game.run() (en segundos)."""
+    frame: int       # número de frame (Game.frames)
+    frame_dt: float  # duración real del frame, con la espera del límite de FPS
+    ticks: int       # ticks de simulación dados
+    work: float      # update + draw + present
+    update: float    # eventos y ticks de simulación
+    draw: float      # dibujo de la escena (y del overlay)
+    present: float   # volcado a pantalla
+
+
+# Secciones que mide Game; las demás las añaden las escenas y se muestran sangradas
+TOP_SECTIONS = ('update', 'draw', 'present')
+
+
+def cache_allocations() -> int:
+    """Superficies creadas hasta ahora por las cachés globales (sprites, textos, overlays)."""
+    return sprite_cache.bakes + text_cache.renders + overlay_cache.builds
+
+
+class FrameProfiler:
+    """Tiempos por frame y por subsistema, con un overlay que dibuja Game (F3).
+
+    Los subsistemas se miden con begin()/end(); desactivado, begin()
+    devuelve 0.0 sin leer el reloj y end() solo comprueba el flag.
+    """
+
+    def __init__(self, history: int = PROFILER_HISTORY) -> None:
+        self.enabled = False
+        self.frame_times: "deque[float]" = deque(maxlen=history)  # ms
+        self._sections: Dict[str, float] = {}  # s acumulados en el frame actual
+        self._window: Dict[str, float] = {}    # s acumulados desde el último refresco
+        self._window_frames = 0
+        self._window_start = 0.0
+        self._window_dt = 0.0
+        self._allocs_mark: Optional[int] = None
+        self._font: Optional[pygame.font.Font] = None
+        self._lines: List[Tuple[pygame.Surface, Optional[pygame.Surface]]] = []
+        self.counts: Dict[str, int] = {}
+
+    def toggle(self) -> None:
+        self.enabled = not self.enabled
+        self.frame_times.clear()
+        self._sections.clear()
+        self._window.clear()
+        self._window_frames = 0
+        self._window_start = _perf()
+        self._window_dt = 0.0
+        self._allocs_mark = None
+        self._lines = []
+
+    # ---- Medición ----
+    def begin(self) -> float:
+        return _perf() if self.enabled else 0.0
+
+    def end(self, name: str, t0: float) -> None:
+        if self.enabled:
+            self._sections[name] = self._sections.get(name, 0.0) + (_perf() - t0)
+
+    def end_frame(self, timing: FrameTiming, counts: Dict[str, int], allocations: int) -> None:
+        """Cierra el frame y refresca el texto unas veces por segundo.
+
+        allocations: total acumulado de superficies creadas por las cachés.
+        """
+        if not self.enabled:
+            return
+        self.frame_times.append(timing.work * 1000.0)
+        self._window_dt += timing.frame_dt
+        window = self._window
+        for name in TOP_SECTIONS:
+            window[name] = window.get(name, 0.0) + getattr(timing, name)
+        for name, t in self._sections.items():
+            window[name] = window.get(name, 0.0) + t
+        self._sections.clear()
+        self._window_frames += 1
+        now = _perf()
+        if self._allocs_mark is None:
+            self._allocs_mark = allocations
+        if now - self._window_start >= PROFILER_REFRESH:
+            # Un cambio de escena puede bajar el total: no hay asignaciones negativas
+            self.counts = dict(counts)
+            self.counts['surf/frame'] = round(max(0, allocations - self._allocs_mark) / self._window_frames, 2)
+            self._allocs_mark = allocations
+            self._lines = self._render_lines()
+            window.clear()
+            self._window_frames = 0
+            self._window_dt = 0.0
+            self._window_start = now
+
+    # ---- Overlay ----
+    def _render_lines(self) -> List[Tuple[pygame.Surface, Optional[pygame.Surface]]]:
+        if self._font is None:
+            self._font = fonts.get(18)
+        n = max(1, self._window_frames)
+        times = list(self.frame_times)
+        avg = sum(times) / len(times) if times else 0.0
+        worst = max(times) if times else 0.0
+        fps = n / self._window_dt if self._window_dt > 0 else 0.0
+        rows: List[Tuple[str, Optional[str]]] = [(f"frame {avg:.2f} ms  max {worst:.2f}  {fps:.0f} fps", None)]
+        window = self._window
+        names = [name for name in TOP_SECTIONS if name in window]
+        names += [name for name in window if name not in TOP_SECTIONS]
+        for name in names:
+            label = name if name in TOP_SECTIONS else "   " + name
+            rows.append((label, f"{window[name] * 1000.0 / n:.3f} ms"))
+        rows.append(("  ".join(f"{k} {v}" for k, v in self.counts.items()), None))
+        # Textos que cambian cada refresco: fuera de text_cache para no vaciarla
+        color = (230, 230, 230)
+        font = self._font
+        return [(font.render(left, True, color), font.render(right, True, color) if right else None)
+                for left, right in rows]
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if not self.enabled:
+            return
+        graph_w, graph_h = PROFILER_HISTORY * 2, 48
+        w = graph_w
+        for left, right in self._lines:
+            w = max(w, left.get_width() + (right.get_width() + 24 if right else 0))
+        w += 12
+        h = sum(left.get_height() for left, _ in self._lines) + graph_h + 16
+        x0 = surface.get_width() - w - 8
+        y0 = 8
+        overlay_cache.blit(surface, (x0, y0), (w, h), (0, 0, 0), 180)
+        y = y0 + 4
+        for left, right in self._lines:
+            surface.blit(left, (x0 + 6, y))
+            if right is not None:
+                # Valores alineados a la derecha
+                surface.blit(right, (x0 + w - 6 - right.get_width(), y))
+            y += left.get_height()
+        # Gráfica de tiempos de frame; la línea marca el presupuesto a FPS
+        y += 4
+        budget = 1000.0 / FPS
+        scale = graph_h / (2 * budget)
+        for i, ms in enumerate(self.frame_times):
+            bar = min(graph_h, int(ms * scale))
+            color = (80, 200, 120) if ms <= budget else (230, 80, 60)
+            gx = x0 + 6 + 2 * i
+            pygame.draw.line(surface, color, (gx, y + graph_h), (gx, y + graph_h - bar), 2)
+        by = y + graph_h - int(budget * scale)
+        pygame.draw.line(surface, (240, 220, 70), (x0 + 6, by), (x0 + 6 + graph_w, by))
+
+
+def is_toggle_event(event: pygame.event.Event) -> bool:
+    return event.type == pygame.KEYDOWN and event.key == PROFILER_KEY
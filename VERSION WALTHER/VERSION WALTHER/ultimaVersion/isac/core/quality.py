@@ -0,0 +1,121 @@
+from typing import Dict, Optional
+
+from isac.settings import (
+    QUALITY_BUDGET_MS, QUALITY_WINDOW_FRAMES, QUALITY_RESTORE_RATIO, QUALITY_RESTORE_WINDOWS,
+    QUALITY_RESTORE_MAX_WINDOWS,
+)
+
+# Niveles de coste de los efectos: con el frame fuera de presupuesto se
+# apagan de menor a mayor
+TIER_ORNAMENT = 1  # adornos puros (brillos, partículas, círculo de rango)
+TIER_EFFECT = 2    # efectos vistosos sin información de juego (estela de las botas)
+TIER_FEEDBACK = 3  # respuesta a lo que pasa (flashes de muerte, temblor de cámara)
+
+
+class QualityEffect:
+    """Efecto decorativo registrado; quien lo dibuja consulta .enabled."""
+
+    __slots__ = ('name', 'tier', 'enabled')
+
+    def __init__(self, name: str, tier: int) -> None:
+        self.name = name
+        self.tier = tier
+        self.enabled = True
+
+
+class QualityManager:
+    """Gobernador de calidad adaptativa según el tiempo de frame.
+
+    Los efectos se registran con su nivel (register) y quedan activos
+    mientras su nivel esté por encima de los apagados. Cada
+    QUALITY_WINDOW_FRAMES frames se mira el tiempo medio de trabajo: por
+    encima del presupuesto se apaga un nivel más; por debajo de
+    QUALITY_RESTORE_RATIO del presupuesto durante varias ventanas seguidas se
+    recupera uno. Si al recuperar se vuelve a pasar enseguida, la siguiente
+    recuperación espera el doble (histéresis para no oscilar); la espera solo
+    vuelve a la inicial cuando lo recuperado aguanta más que esa espera.
+    """
+
+    def __init__(self, budget_ms: float = QUALITY_BUDGET_MS) -> None:
+        self.budget = budget_ms / 1000.0
+        self.dropped = 0  # niveles apagados (0: calidad completa)
+        self.changes = 0  # cambios de nivel (para depurar/medir)
+        self._effects: Dict[str, QualityEffect] = {}
+        self._sum = 0.0
+        self._frames = 0
+        self._calm = 0
+        self._restore_after = QUALITY_RESTORE_WINDOWS
+        self._since_restore: Optional[int] = None
+
+    def register(self, name: str, tier: int) -> QualityEffect:
+        effect = self._effects.get(name)
+        if effect is None:
+            effect = self._effects[name] = QualityEffect(name, tier)
+        effect.tier = tier
+        effect.enabled = tier > self.dropped
+        return effect
+
+    @property
+    def max_tier(self) -> int:
+        return max((e.tier for e in self._effects.values()), default=0)
+
+    def effects(self) -> Dict[str, bool]:
+        return {name: e.enabled for name, e in self._effects.items()}
+
+    def set_dropped(self, dropped: int) -> None:
+        dropped = max(0, min(dropped, self.max_tier))
+        if dropped == self.dropped:
+            return
+        self.dropped = dropped
+        self.changes += 1
+        for effect in self._effects.values():
+            effect.enabled = effect.tier > dropped
+
+    def reset(self, budget_ms: Optional[float] = None) -> None:
+        """Calidad completa y medida desde cero (al crear una partida)."""
+        if budget_ms is not None:
+            self.budget = budget_ms / 1000.0
+        self.set_dropped(0)
+        self._sum = 0.0
+        self._frames = 0
+        self._calm = 0
+        self._restore_after = QUALITY_RESTORE_WINDOWS
+        self._since_restore = None
+
+    def observe(self, work: float) -> None:
+        """Un frame más con `work` segundos de trabajo (update + draw + present)."""
+        self._sum += work
+        self._frames += 1
+        if self._frames < QUALITY_WINDOW_FRAMES:
+            return
+        mean = self._sum / self._frames
+        self._sum = 0.0
+        self._frames = 0
+        if self._since_restore is not None:
+            self._since_restore += 1
+            if self._since_restore > self._restore_after:
+                # Lo recuperado aguantó: la próxima vez se espera lo normal
+                self._restore_after = QUALITY_RESTORE_WINDOWS
+                self._since_restore = None
+        if mean > self.budget:
+            self._calm = 0
+            if self.dropped < self.max_tier:
+                if self._since_restore is not None:
+                    # Lo recuperado no cabía: esperar más la próxima vez
+                    self._restore_after = min(self._restore_after * 2, QUALITY_RESTORE_MAX_WINDOWS)
+                    self._since_restore = None
+                self.set_dropped(self.dropped + 1)
+        elif mean < self.budget * QUALITY_RESTORE_RATIO and self.dropped > 0:
+            self._calm += 1
+            if self._calm >= self._restore_after:
+                self._calm = 0
+                self._since_restore = 0
+                self.set_dropped(self.dropped - 1)
+        else:
+            self._calm = 0
+
+    def on_frame(self, game: "Game", timing) -> None:
+        self.observe(timing.work)
+
+
+quality = QualityManager()
@@ -0,0 +1,144 @@
+import struct
+from typing import BinaryIO, Iterator, List, NamedTuple, Tuple
+
+import pygame
+
+from .input import InputState
+
+# Formato (little endian):
+#   cabecera: magic, versión, semilla, SIM_HZ, dificultad (longitud + utf-8)
+#             y la partida guardada al empezar (longitud + bytes; 0 si no había)
+#   por frame: entrada empaquetada, ticks simulados, duración del frame (s),
+#              nº de KEYDOWN y cada uno como (tecla, modificadores)
+MAGIC = b'ISACRPL'
+VERSION = 2
+_HEADER = struct.Struct('<7sBQHB')
+_SAVE = struct.Struct('<I')
+_FRAME = struct.Struct('<HBfB')
+_EVENT = struct.Struct('<IH')
+
+# Bits de la entrada: move_x y move_y con 2 bits cada uno (valor + 1), luego las acciones
+_SHIELD, _MELEE, _FIRE, _BOMB, _INTERACT = (1 << 4, 1 << 5, 1 << 6, 1 << 7, 1 << 8)
+
+
+class ReplayError(Exception):
+    pass
+
+
+def pack_input(inp: InputState) -> int:
+    bits = (inp.move_x + 1) | ((inp.move_y + 1) << 2)
+    if inp.shield:
+        bits |= _SHIELD
+    if inp.melee:
+        bits |= _MELEE
+    if inp.fire:
+        bits |= _FIRE
+    if inp.bomb:
+        bits |= _BOMB
+    if inp.interact:
+        bits |= _INTERACT
+    return bits
+
+
+def unpack_input(bits: int) -> InputState:
+    return InputState(
+        move_x=(bits & 3) - 1,
+        move_y=((bits >> 2) & 3) - 1,
+        shield=bool(bits & _SHIELD),
+        melee=bool(bits & _MELEE),
+        fire=bool(bits & _FIRE),
+        bomb=bool(bits & _BOMB),
+        interact=bool(bits & _INTERACT),
+    )
+
+
+class ReplayFrame(NamedTuple):
+    input: InputState
+    ticks: int                   # ticks de simulación que dio el frame
+    frame_dt: float              # duración real del frame al grabar (s)
+    keys: List[Tuple[int, int]]  # KEYDOWN del frame: (tecla, modificadores)
+
+    def events(self) -> List[pygame.event.Event]:
+        return [pygame.event.Event(pygame.KEYDOWN, key=key, mod=mod, unicode='') for key, mod in self.keys]
+
+
+class ReplayRecorder:
+    """Graba una sesión frame a frame en un fichero binario compacto.
+
+    Se guarda la entrada efectiva de cada frame y cuántos ticks dio, así la
+    reproducción no depende del reloj. Las teclas van aparte porque la pausa
+    y los menús siguen funcionando con eventos. `save` es el contenido de la
+    partida guardada al empezar: F9 puede cargarla durante la sesión.
+    """
+
+    def __init__(self, path: str, seed: int, sim_hz: int, difficulty: str, save: bytes = b'') -> None:
+        self.path = path
+        self.frames = 0
+        name = difficulty.encode('utf-8')[:255]
+        self._file: BinaryIO = open(path, 'wb')
+        self._file.write(_HEADER.pack(MAGIC, VERSION, seed, sim_hz, len(name)) + name)
+        self._file.write(_SAVE.pack(len(save)) + save)
+
+    def record(self, inp: InputState, ticks: int, frame_dt: float, events: List[pygame.event.Event]) -> None:
+        keys = [(e.key, e.mod) for e in events if e.type == pygame.KEYDOWN]
+        out = self._file
+        out.write(_FRAME.pack(pack_input(inp), min(ticks, 255), frame_dt, len(keys)))
+        for key, mod in keys:
+            out.write(_EVENT.pack(key & 0xFFFFFFFF, mod & 0xFFFF))
+        self.frames += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+class Replay:
+    """Sesión grabada: semilla, ajustes, partida guardada inicial y frames."""
+
+    def __init__(self, seed: int, sim_hz: int, difficulty: str, frames: List[ReplayFrame],
+                 save: bytes = b'') -> None:
+        self.seed = seed
+        self.sim_hz = sim_hz
+        self.difficulty = difficulty
+        self.frames = frames
+        self.save = save  # savegame.json al empezar la grabación (b'': no había)
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __iter__(self) -> Iterator[ReplayFrame]:
+        return iter(self.frames)
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ReplayError(f"{path}: fichero demasiado corto")
+        magic, version, seed, sim_hz, name_len = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ReplayError(f"{path}: no es una repetición compatible")
+        pos = _HEADER.size
+        difficulty = data[pos:pos + name_len].decode('utf-8')
+        pos += name_len
+        if pos + _SAVE.size > len(data):
+            raise ReplayError(f"{path}: cabecera cortada")
+        (save_len,) = _SAVE.unpack_from(data, pos)
+        pos += _SAVE.size
+        if pos + save_len > len(data):
+            raise ReplayError(f"{path}: cabecera cortada")
+        save = data[pos:pos + save_len]
+        pos += save_len
+        frames: List[ReplayFrame] = []
+        while pos + _FRAME.size <= len(data):
+            bits, ticks, frame_dt, n_keys = _FRAME.unpack_from(data, pos)
+            pos += _FRAME.size
+            if pos + n_keys * _EVENT.size > len(data):
+                break  # último frame cortado (la grabación no se cerró bien)
+            keys = [_EVENT.unpack_from(data, pos + i * _EVENT.size) for i in range(n_keys)]
+            pos += n_keys * _EVENT.size
+            frames.append(ReplayFrame(unpack_input(bits), ticks, frame_dt, keys))
+        return cls(seed, sim_hz, difficulty, frames, save)
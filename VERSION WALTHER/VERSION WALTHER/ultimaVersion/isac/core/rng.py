@@ -0,0 +1,45 @@
+import hashlib
+import random
+from typing import Dict, Optional, Tuple
+
+# Flujos de aleatoriedad del juego. Cada uno es independiente: gastar números
+# en uno (p. ej. el temblor de cámara) no cambia lo que sale en los demás
+STREAM_SPAWNS = 'spawns'      # tipo de enemigo
+STREAM_LOOT = 'loot'          # botín al matar
+STREAM_CHESTS = 'chests'      # colocación y contenido de cofres
+STREAM_COSMETIC = 'cosmetic'  # efectos visuales (temblor)
+
+RoomPos = Tuple[int, int]
+
+
+def new_seed() -> int:
+    """Semilla de partida aleatoria (cuando no se pide una concreta)."""
+    return random.SystemRandom().getrandbits(32)
+
+
+def derive_seed(seed: int, name: str, room: Optional[RoomPos] = None) -> int:
+    # hashlib y no hash(): el hash de str cambia entre procesos
+    data = f"{seed}:{name}:{room}".encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+class RngService:
+    """Generadores deterministas con nombre, derivados de la semilla de la partida.
+
+    stream(nombre, sala) devuelve siempre el mismo random.Random para esa
+    pareja; su semilla sale de (semilla de partida, nombre, sala), así el
+    contenido de una sala no depende del orden en que se visitan. Misma
+    semilla y misma entrada: partida idéntica.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.seed = seed if seed is not None else new_seed()
+        self._streams: Dict[Tuple[str, Optional[RoomPos]], random.Random] = {}
+
+    def stream(self, name: str, room: Optional[RoomPos] = None) -> random.Random:
+        key = (name, tuple(room) if room is not None else None)
+        rng = self._streams.get(key)
+        if rng is None:
+            rng = random.Random(derive_seed(self.seed, name, key[1]))
+            self._streams[key] = rng
+        return rng
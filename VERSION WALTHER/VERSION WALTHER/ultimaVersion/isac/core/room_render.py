@@ -0,0 +1,111 @@
+import pygame
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from isac.settings import WIDTH, HEIGHT, ROOM_SURFACE_CACHE_SIZE
+from .geometry import DIRECTIONS, RoomGeometry
+from .room import Door, Room
+
+WALL_COLOR = (90, 90, 90)
+OBSTACLE_COLOR = (110, 110, 110)
+
+
+def door_color(door: Door, feedback: float = 0.0) -> Tuple[int, int, int]:
+    """Color de una puerta según su estado y el pulso de apertura (0..1)."""
+    # Color base por estado
+    base_color = (80, 200, 120) if door.open else ((200, 160, 40) if door.locked else (160, 160, 160))
+    # Pulso de color cuando se acaban de abrir
+    if door.open and feedback > 0:
+        intensity = feedback  # lineal simple
+        r = min(255, int(base_color[0] + 60 * intensity))
+        g = min(255, int(base_color[1] + 40 * intensity))
+        b = min(255, int(base_color[2] + 40 * intensity))
+        return (r, g, b)
+    return base_color
+
+
+class _Entry:
+    __slots__ = ('geo', 'surface', 'door_colors')
+
+    def __init__(self, geo: RoomGeometry, surface: pygame.Surface, door_colors: tuple) -> None:
+        self.geo = geo
+        self.surface = surface
+        self.door_colors = door_colors
+
+
+class RoomSurfaceCache:
+    """Capa estática de cada sala (paredes, obstáculos y puertas) pre-renderizada.
+
+    Cada sala se dibuja una vez en una Surface convertida y después se blitea
+    de una sola vez. Solo se repintan los rects de las puertas cuando cambia
+    su color (abrir, bloquear o el pulso de apertura), y la sala entera si
+    cambió su geometría (p. ej. al cambiar la dificultad).
+    """
+
+    def __init__(self, max_rooms: int = ROOM_SURFACE_CACHE_SIZE) -> None:
+        self.max_rooms = max(1, max_rooms)
+        self._entries: "OrderedDict[Tuple[int, int], _Entry]" = OrderedDict()
+        self._pending: List[Room] = []  # salas a pre-renderizar poco a poco
+        self.renders = 0       # salas renderizadas completas
+        self.door_redraws = 0  # repintados de puertas
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pending.clear()
+
+    def get(self, room: Room, feedback: float = 0.0) -> pygame.Surface:
+        """Surface de la sala con las puertas al día."""
+        geo = room.geometry()
+        colors = tuple(door_color(room.doors[d], feedback) for d in DIRECTIONS)
+        entry = self._entries.get(room.pos)
+        if entry is None or entry.geo is not geo:
+            entry = _Entry(geo, self._render(geo, colors), colors)
+            self._entries[room.pos] = entry
+            while len(self._entries) > self.max_rooms:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(room.pos)
+            if colors != entry.door_colors:
+                # Las puertas son opacas y se dibujan encima de las paredes:
+                # basta con repintar sus rects
+                for d, color in zip(DIRECTIONS, colors):
+                    pygame.draw.rect(entry.surface, color, geo.doors[d])
+                entry.door_colors = colors
+                self.door_redraws += 1
+        return entry.surface
+
+    def warm(self, rooms: Iterable[Optional[Room]]) -> None:
+        """Pre-renderiza salas (p. ej. las vecinas) para que entrar no cueste un frame."""
+        for room in rooms:
+            if room is not None and room.pos not in self._entries:
+                self.get(room)
+
+    def schedule(self, rooms: Iterable[Optional[Room]]) -> None:
+        """Como warm(), pero repartido entre frames con warm_pending()."""
+        self._pending = [room for room in rooms if room is not None and room.pos not in self._entries]
+
+    def warm_pending(self, limit: int = 1) -> None:
+        while limit > 0 and self._pending:
+            room = self._pending.pop(0)
+            if room.pos not in self._entries:
+                self.get(room)
+                limit -= 1
+
+    def _render(self, geo: RoomGeometry, colors: tuple) -> pygame.Surface:
+        surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        # paredes
+        for wall in geo.walls:
+            pygame.draw.rect(surface, WALL_COLOR, wall)
+        # obstáculos internos
+        for obs in geo.obstacles:
+            pygame.draw.rect(surface, OBSTACLE_COLOR, obs)
+        # puertas
+        for d, color in zip(DIRECTIONS, colors):
+            pygame.draw.rect(surface, color, geo.doors[d])
+        self.renders += 1
+        # Formato del display (si ya hay ventana) y RLE: la sala es casi toda
+        # transparente y el blit salta esas tiradas en vez de mezclar píxel a píxel
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        surface.set_alpha(255, pygame.RLEACCEL)
+        return surface
@@ -1,5 +1,7 @@
 import pygame
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+from .input import IDLE, InputState
 
 
 class Scene:
@@ -23,8 +25,28 @@ class Scene:
     def handle_event(self, event: pygame.event.Event) -> None:
         pass
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float, inp: InputState = IDLE) -> None:
+        """Avanza un tick fijo con la entrada del frame (ver Game.advance)."""
         pass
 
     def draw(self, surface: pygame.Surface) -> None:
         pass
+
+    def dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Regiones que cambiaron en el último draw().
+
+        None (por defecto) indica que hay que volcar la pantalla entera.
+        """
+        return None
+
+    def profile_counts(self) -> Dict[str, int]:
+        """Contadores que muestra el perfilador (entidades vivas, etc.)."""
+        return {}
+
+    def location(self) -> Optional[Tuple[int, int]]:
+        """Sala actual, para la telemetría (None si la escena no tiene mapa)."""
+        return None
+
+    def surface_allocations(self) -> int:
+        """Superficies creadas por cachés propias de la escena (total acumulado)."""
+        return 0
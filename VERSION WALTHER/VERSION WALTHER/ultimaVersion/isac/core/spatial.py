@@ -0,0 +1,75 @@
+import pygame
+from typing import Any, Dict, Iterable, List, Tuple
+
+from isac.settings import SPATIAL_CELL_SIZE
+
+
+class SpatialHash:
+    """Hash espacial uniforme para consultas de proximidad entre entidades.
+
+    Se reconstruye por frame a partir de las entidades vivas. Las consultas
+    devuelven candidatos (quienes comparten celda con el área pedida) en el
+    mismo orden en que se insertaron; el llamador hace el test exacto.
+    """
+
+    def __init__(self, cell_size: int = SPATIAL_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[Tuple[int, Any]]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._count = 0
+
+    def _cell_range(self, left: int, top: int, right: int, bottom: int) -> Tuple[int, int, int, int]:
+        cs = self.cell_size
+        return left // cs, top // cs, (right - 1) // cs, (bottom - 1) // cs
+
+    def insert(self, item: Any, rect: pygame.Rect) -> None:
+        entry = (self._count, item)
+        self._count += 1
+        cx0, cy0, cx1, cy1 = self._cell_range(rect.left, rect.top, rect.right, rect.bottom)
+        cells = self._cells
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def rebuild(self, items: Iterable[Any]) -> None:
+        """Vacía el hash e inserta cada item por su atributo rect."""
+        self.clear()
+        for item in items:
+            self.insert(item, item.rect)
+
+    def _query_cells(self, cx0: int, cy0: int, cx1: int, cy1: int) -> List[Any]:
+        cells = self._cells
+        found: Dict[int, Any] = {}
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for idx, item in bucket:
+                        found[idx] = item
+        if len(found) > 1:
+            return [found[i] for i in sorted(found)]
+        return list(found.values())
+
+    def query_rect(self, rect: pygame.Rect) -> List[Any]:
+        """Candidatos que pueden solaparse con rect."""
+        if not self._cells or rect.width <= 0 or rect.height <= 0:
+            return []
+        return self._query_cells(*self._cell_range(rect.left, rect.top, rect.right, rect.bottom))
+
+    def query_radius(self, center: Tuple[float, float], radius: float) -> List[Any]:
+        """Candidatos en las celdas que cubre el círculo (center, radius)."""
+        if not self._cells:
+            return []
+        x, y = center
+        r = int(radius) + 1
+        return self._query_cells(*self._cell_range(int(x) - r, int(y) - r, int(x) + r, int(y) + r))
@@ -0,0 +1,51 @@
+import pygame
+from typing import Callable, Dict, Hashable, Tuple
+
+from isac.settings import SPRITE_PHASE_BUCKETS
+
+
+def phase_bucket(t: float, period: float, buckets: int = SPRITE_PHASE_BUCKETS) -> Tuple[int, float]:
+    """Cuantiza un timer de animación periódico.
+
+    Devuelve (índice de cubeta, tiempo representativo de esa cubeta); el
+    sprite se hornea con el tiempo representativo.
+    """
+    # El épsilon evita que el propio tiempo representativo caiga en la cubeta anterior
+    b = int((t % period) * buckets / period + 1e-9) % buckets
+    return b, b * period / buckets
+
+
+class SpriteCache:
+    """Sprites horneados, compartidos por todas las instancias y escenas.
+
+    Cada clave identifica un aspecto concreto de una entidad (tipo, estado,
+    fase de animación). La primera vez se pinta con las mismas primitivas que
+    antes se usaban en cada frame sobre una Surface transparente; después
+    dibujar la entidad es un blit de esa Surface.
+    """
+
+    def __init__(self) -> None:
+        self._sprites: Dict[Hashable, pygame.Surface] = {}
+        self.bakes = 0  # sprites pintados (para depurar/medir)
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def clear(self) -> None:
+        self._sprites.clear()
+
+    def get(self, key: Hashable, size: Tuple[int, int], paint: Callable[[pygame.Surface], None]) -> pygame.Surface:
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface(size, pygame.SRCALPHA)
+            paint(sprite)
+            # Formato del display para blits rápidos (si ya hay ventana)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self._sprites[key] = sprite
+            self.bakes += 1
+        return sprite
+
+
+# Instancia compartida por todas las entidades
+sprite_cache = SpriteCache()
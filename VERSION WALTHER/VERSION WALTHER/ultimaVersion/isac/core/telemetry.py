@@ -0,0 +1,321 @@
+import csv
+import gc
+import io
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+from isac.settings import (
+    TELEMETRY_MAX_BYTES, TELEMETRY_BACKUPS, TELEMETRY_FLUSH_INTERVAL, TELEMETRY_RSS_INTERVAL,
+    TELEMETRY_QUEUE_MAX,
+)
+from .profiler import FrameTiming
+
+_perf = time.perf_counter
+
+FORMATS = ('jsonl', 'csv')
+
+# Columnas de cada modo (el CSV necesita una cabecera fija; en JSONL los
+# contadores que no estén aquí se escriben igualmente)
+COUNT_FIELDS = ['enemies', 'projectiles', 'pickups']
+FRAME_FIELDS = (['t', 'frame', 'frame_ms', 'work_ms', 'update_ms', 'draw_ms', 'present_ms', 'ticks',
+                 'scene', 'room'] + COUNT_FIELDS + ['gc0', 'gc1', 'gc2', 'gc_ms', 'rss_mb'])
+SECOND_FIELDS = (['t', 'frames', 'fps', 'frame_ms_avg', 'frame_ms_max', 'work_ms_avg', 'work_ms_max',
+                  'update_ms_avg', 'draw_ms_avg', 'present_ms_avg', 'ticks', 'scene', 'room']
+                 + COUNT_FIELDS + ['gc0', 'gc1', 'gc2', 'gc_ms', 'rss_mb'])
+
+
+def current_rss() -> Optional[int]:
+    """Memoria residente del proceso en bytes (None si el sistema no la da)."""
+    if sys.platform == 'win32':
+        return _rss_windows()
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _rss_windows() -> Optional[int]:
+    import ctypes
+    from ctypes import wintypes
+
+    class _Counters(ctypes.Structure):
+        _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                    ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                    ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                    ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+    try:
+        kernel32 = ctypes.windll.kernel32
+        kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        counters = _Counters()
+        counters.cb = ctypes.sizeof(counters)
+        ok = ctypes.windll.psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters),
+                                                      counters.cb)
+        return counters.WorkingSetSize if ok else None
+    except (AttributeError, OSError):
+        return None
+
+
+class RotatingWriter:
+    """Escribe registros en un hilo aparte, en JSONL o CSV, rotando ficheros.
+
+    write() solo encola: el hilo de juego no toca el disco. El hilo escribe
+    por lotes y vacía cada TELEMETRY_FLUSH_INTERVAL s. Si la cola se llena
+    (disco lento o bloqueado) los registros se descartan y se cuentan en
+    dropped. Al pasar de max_bytes el fichero se renombra a .1 (el .1 a .2,
+    etc.) y se empieza otro; un fichero de una sesión anterior se rota igual
+    al abrir (sin copias se sigue escribiendo al final). En CSV cada fichero
+    lleva su cabecera.
+    """
+
+    def __init__(self, path: str, fmt: str = 'jsonl', fields: Optional[List[str]] = None,
+                 max_bytes: int = TELEMETRY_MAX_BYTES, backups: int = TELEMETRY_BACKUPS,
+                 queue_max: int = TELEMETRY_QUEUE_MAX) -> None:
+        if fmt not in FORMATS:
+            raise ValueError(f"formato de telemetría desconocido: {fmt}")
+        if fmt == 'csv' and not fields:
+            raise ValueError("el formato csv necesita la lista de columnas")
+        self.path = path
+        self.fmt = fmt
+        self.fields = fields
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.written = 0  # registros escritos (para depurar/medir)
+        self.dropped = 0  # registros descartados con la cola llena
+        self.error: Optional[BaseException] = None
+        self._queue: "queue.Queue[Optional[dict]]" = queue.Queue(maxsize=max(1, queue_max))
+        self._file: Optional[io.TextIOWrapper] = None
+        self._thread = threading.Thread(target=self._run, name='telemetry-writer', daemon=True)
+        self._thread.start()
+
+    def write(self, record: dict) -> None:
+        if self.error is None:
+            try:
+                self._queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+
+    def close(self) -> None:
+        """Escribe lo pendiente y termina el hilo."""
+        # Con la cola llena se espera a que el hilo haga sitio (o termine por un error)
+        while self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+        self._thread.join()
+
+    # ---- Hilo de escritura ----
+    def _run(self) -> None:
+        try:
+            self._open(first=True)
+            while True:
+                try:
+                    record = self._queue.get(timeout=TELEMETRY_FLUSH_INTERVAL)
+                except queue.Empty:
+                    self._file.flush()
+                    continue
+                if record is None:
+                    break
+                self._write_line(record)
+                # Vaciar lo que ya esté en cola antes de volver a esperar
+                while True:
+                    try:
+                        record = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if record is None:
+                        return
+                    self._write_line(record)
+        except Exception as e:
+            # La telemetría nunca debe tumbar el juego: se anota y se deja de escribir
+            self.error = e
+        finally:
+            if self._file is not None:
+                self._file.close()
+
+    def _open(self, first: bool = False) -> None:
+        mode = 'w'
+        if first and os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            # No pisar la sesión anterior: a .1 como en una rotación, o a
+            # continuación si no se conservan copias
+            if self.backups > 0:
+                self._shift()
+            else:
+                mode = 'a'
+        self._file = open(self.path, mode, encoding='utf-8', newline='')
+        if self.fmt == 'csv':
+            self._csv = csv.DictWriter(self._file, fieldnames=self.fields, extrasaction='ignore')
+            if self._file.tell() == 0:
+                self._csv.writeheader()
+
+    def _write_line(self, record: dict) -> None:
+        if self.fmt == 'csv':
+            self._csv.writerow(record)
+        else:
+            self._file.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self.written += 1
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._shift()
+        self._open()
+
+    def _shift(self) -> None:
+        # .1 -> .2, ... y el actual a .1 (el más antiguo se pierde)
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+
+
+class TelemetrySink:
+    """Telemetría de rendimiento por frame (o agregada por segundo) de una partida.
+
+    Se engancha a los ganchos de frame de Game y apunta, junto a los tiempos,
+    la escena, la sala, los contadores de la escena, las pasadas del GC (y lo
+    que tardaron) y la memoria residente. Sirve para cruzar tirones con salas
+    y combates concretos.
+    """
+
+    def __init__(self, game: "Game", path: str, fmt: str = 'jsonl', per_second: bool = False,
+                 max_bytes: int = TELEMETRY_MAX_BYTES, backups: int = TELEMETRY_BACKUPS) -> None:
+        self.game = game
+        self.per_second = per_second
+        fields = SECOND_FIELDS if per_second else FRAME_FIELDS
+        self.writer = RotatingWriter(path, fmt, fields, max_bytes, backups)
+        self._start = _perf()
+        # GC: pasadas por generación y tiempo de pausa desde el último registro
+        self._gc_counts = [0, 0, 0]
+        self._gc_time = 0.0
+        self._gc_t0 = 0.0
+        gc.callbacks.append(self._on_gc)
+        # RSS: leerlo cuesta una llamada al sistema; se muestrea cada poco
+        self._rss_mb: Optional[float] = None
+        self._rss_at = -TELEMETRY_RSS_INTERVAL
+        # Agregado del segundo en curso
+        self._agg: Optional[Dict] = None
+        game.on_frame_end(self._on_frame)
+
+    def close(self) -> None:
+        if self._agg is not None:
+            self._emit_second()
+        self.game.remove_frame_hook(self._on_frame)
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        self.writer.close()
+        if self.writer.dropped:
+            print(f"Telemetría: {self.writer.dropped} registros descartados (el disco no daba abasto)",
+                  file=sys.stderr)
+
+    def _on_gc(self, phase: str, info: Dict) -> None:
+        if phase == 'start':
+            self._gc_t0 = _perf()
+        elif self._gc_t0:
+            self._gc_time += _perf() - self._gc_t0
+            self._gc_t0 = 0.0
+            self._gc_counts[info['generation']] += 1
+
+    def _take_gc(self) -> Dict:
+        counts = self._gc_counts
+        data = {'gc0': counts[0], 'gc1': counts[1], 'gc2': counts[2], 'gc_ms': round(self._gc_time * 1000.0, 3)}
+        self._gc_counts = [0, 0, 0]
+        self._gc_time = 0.0
+        return data
+
+    def _rss(self, now: float) -> Optional[float]:
+        if now - self._rss_at >= TELEMETRY_RSS_INTERVAL:
+            self._rss_at = now
+            rss = current_rss()
+            self._rss_mb = round(rss / (1024 * 1024), 1) if rss is not None else None
+        return self._rss_mb
+
+    def _on_frame(self, game: "Game", timing: FrameTiming) -> None:
+        now = _perf() - self._start
+        scene = game.scene
+        room = scene.location()
+        room = list(room) if room is not None else None
+        if self.per_second:
+            self._accumulate(now, type(scene).__name__, room, timing)
+            return
+        record = {
+            't': round(now, 4),
+            'frame': timing.frame,
+            'frame_ms': round(timing.frame_dt * 1000.0, 3),
+            'work_ms': round(timing.work * 1000.0, 3),
+            'update_ms': round(timing.update * 1000.0, 3),
+            'draw_ms': round(timing.draw * 1000.0, 3),
+            'present_ms': round(timing.present * 1000.0, 3),
+            'ticks': timing.ticks,
+            'scene': type(scene).__name__,
+            'room': room,
+        }
+        record.update(scene.profile_counts())
+        record.update(self._take_gc())
+        record['rss_mb'] = self._rss(now)
+        self.writer.write(record)
+
+    def _accumulate(self, now: float, scene: str, room: Optional[list], timing: FrameTiming) -> None:
+        agg = self._agg
+        # Un registro por segundo de juego (suma de frame_dt; en headless no es
+        # tiempo de reloj), o antes si cambia la escena o la sala, para que
+        # cada registro pertenezca a un único sitio
+        if agg is not None and (agg['scene'] != scene or agg['room'] != room):
+            self._emit_second()
+            agg = None
+        if agg is None:
+            agg = self._agg = {'start': now, 'scene': scene, 'room': room, 'frames': 0, 'dt': 0.0,
+                               'frame_max': 0.0, 'work': 0.0, 'work_max': 0.0, 'update': 0.0, 'draw': 0.0,
+                               'present': 0.0, 'ticks': 0, 'counts': {}}
+        agg['frames'] += 1
+        agg['dt'] += timing.frame_dt
+        agg['frame_max'] = max(agg['frame_max'], timing.frame_dt)
+        agg['work'] += timing.work
+        agg['work_max'] = max(agg['work_max'], timing.work)
+        agg['update'] += timing.update
+        agg['draw'] += timing.draw
+        agg['present'] += timing.present
+        agg['ticks'] += timing.ticks
+        # Contadores: el máximo del intervalo (el pico de un combate)
+        counts = agg['counts']
+        for name, value in self.game.scene.profile_counts().items():
+            if value > counts.get(name, -1):
+                counts[name] = value
+        if agg['dt'] >= 1.0 - 1e-9:
+            self._emit_second()
+
+    def _emit_second(self) -> None:
+        agg = self._agg
+        self._agg = None
+        n = agg['frames']
+        record = {
+            't': round(agg['start'], 4),
+            'frames': n,
+            'fps': round(n / agg['dt'], 1) if agg['dt'] > 0 else None,
+            'frame_ms_avg': round(agg['dt'] * 1000.0 / n, 3),
+            'frame_ms_max': round(agg['frame_max'] * 1000.0, 3),
+            'work_ms_avg': round(agg['work'] * 1000.0 / n, 3),
+            'work_ms_max': round(agg['work_max'] * 1000.0, 3),
+            'update_ms_avg': round(agg['update'] * 1000.0 / n, 3),
+            'draw_ms_avg': round(agg['draw'] * 1000.0 / n, 3),
+            'present_ms_avg': round(agg['present'] * 1000.0 / n, 3),
+            'ticks': agg['ticks'],
+            'scene': agg['scene'],
+            'room': agg['room'],
+        }
+        record.update(agg['counts'])
+        record.update(self._take_gc())
+        record['rss_mb'] = self._rss(_perf() - self._start)
+        self.writer.write(record)
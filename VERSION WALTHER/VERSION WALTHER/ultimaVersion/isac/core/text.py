@@ -0,0 +1,81 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Hashable, Tuple
+
+from isac.settings import TEXT_CACHE_SIZE
+
+Color = Tuple[int, int, int]
+
+
+class TextCache:
+    """Textos ya renderizados, con expulsión LRU.
+
+    La clave es (fuente, texto, color, antialias): un texto que no cambia se
+    renderiza una sola vez y un contador solo vuelve a renderizar cuando
+    cambia su valor.
+    """
+
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE) -> None:
+        self.max_entries = max(1, max_entries)
+        self._surfaces: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.renders = 0  # llamadas reales a font.render (para depurar/medir)
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+    def render(self, font: pygame.font.Font, text: str, color: Color, antialias: bool = True) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            return surf
+        surf = font.render(text, antialias, color)
+        self.renders += 1
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surf
+
+
+class DigitAtlas:
+    """Glifos pre-renderizados para contadores ("x12", "MP 40/100").
+
+    Cada carácter del juego de caracteres se renderiza una vez; un contador
+    se dibuja blitteando sus glifos, con el avance que da font.size para el
+    prefijo (así respeta el espaciado de la fuente). Los caracteres que no
+    están en el atlas se renderizan a través de text_cache.
+
+    El resultado puede diferir en algún píxel de antialias respecto a
+    renderizar la cadena entera; para textos que no son contadores usar
+    text_cache.
+    """
+
+    def __init__(self, font: pygame.font.Font, color: Color, antialias: bool = True,
+                 charset: str = "0123456789x/ MP") -> None:
+        self.font = font
+        self.color = tuple(color)
+        self.antialias = antialias
+        self._glyphs: Dict[str, pygame.Surface] = {c: font.render(c, antialias, color) for c in charset}
+        self._advance: Dict[str, Tuple[int, ...]] = {}
+
+    def size(self, text: str) -> Tuple[int, int]:
+        return self.font.size(text)
+
+    def blit(self, surface: pygame.Surface, text: str, pos: Tuple[int, int]) -> None:
+        offsets = self._advance.get(text)
+        if offsets is None:
+            offsets = tuple(self.font.size(text[:i])[0] for i in range(len(text)))
+            self._advance[text] = offsets
+        x, y = pos
+        for ch, dx in zip(text, offsets):
+            glyph = self._glyphs.get(ch)
+            if glyph is None:
+                glyph = text_cache.render(self.font, ch, self.color, self.antialias)
+            surface.blit(glyph, (x + dx, y))
+
+
+# Instancia compartida por todas las escenas
+text_cache = TextCache()
@@ -1,75 +1,10 @@
 import pygame
 import math
 from isac.settings import TILE
+from isac.core.sprites import sprite_cache
+from isac.core.quality import quality, TIER_ORNAMENT
 
-class Spike:
-    def __init__(self, x: int, y: int, target_x: int, target_y: int):
-        self.x = float(x)
-        self.y = float(y)
-        self.speed = 200.0  # píxeles por segundo
-        self.alive = True
-        self.damage = 0.5  # Daño muy bajo
-        
-        # Calcular dirección hacia el objetivo
-        dx = target_x - x
-        dy = target_y - y
-        distance = math.sqrt(dx*dx + dy*dy)
-        
-        if distance > 0:
-            self.vx = (dx / distance) * self.speed
-            self.vy = (dy / distance) * self.speed
-        else:
-            self.vx = self.vy = 0
-            
-    def update(self, dt: float):
-        """Actualiza la posición del pincho"""
-        if not self.alive:
-            return
-            
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        
-        # Eliminar si sale de pantalla
-        if self.x < -50 or self.x > 850 or self.y < -50 or self.y > 650:
-            self.alive = False
-    
-    def rect(self) -> pygame.Rect:
-        """Devuelve el rectángulo de colisión del pincho"""
-        return pygame.Rect(int(self.x) - 3, int(self.y) - 3, 6, 6)
-    
-    def draw(self, surface: pygame.Surface):
-        """Dibuja el pincho"""
-        if not self.alive:
-            return
-            
-        # Pincho como pequeña línea puntiaguda
-        spike_color = (139, 69, 19)  # Marrón
-        tip_color = (160, 82, 45)    # Marrón claro
-        
-        # Calcular ángulo para orientar el pincho
-        angle = math.atan2(self.vy, self.vx)
-        
-        # Puntos del pincho (triángulo alargado)
-        length = 8
-        width = 3
-        
-        # Punta del pincho
-        tip_x = self.x + math.cos(angle) * length
-        tip_y = self.y + math.sin(angle) * length
-        
-        # Base del pincho
-        base_angle1 = angle + math.pi * 0.8
-        base_angle2 = angle - math.pi * 0.8
-        base1_x = self.x + math.cos(base_angle1) * width
-        base1_y = self.y + math.sin(base_angle1) * width
-        base2_x = self.x + math.cos(base_angle2) * width
-        base2_y = self.y + math.sin(base_angle2) * width
-        
-        # Dibujar pincho como triángulo
-        points = [(tip_x, tip_y), (base1_x, base1_y), (base2_x, base2_y)]
-        pygame.draw.polygon(surface, spike_color, points)
-        pygame.draw.polygon(surface, tip_color, points, 1)
-
+_RANGE = quality.register('companion.range', TIER_ORNAMENT)
 
 class Companion:
     def __init__(self, x: int, y: int):
@@ -143,10 +78,12 @@ class Companion:
         """Verifica si puede disparar"""
         return self.active and self.shoot_timer <= 0
     
-    def shoot_at_enemy(self, enemy_rect: pygame.Rect) -> list[Spike]:
-        """Dispara tres pinchos hacia un enemigo en diferentes direcciones"""
+    def shoot_at_enemy(self, enemy_rect: pygame.Rect, projectiles: "ProjectileSystem") -> bool:
+        """Dispara tres pinchos (en projectiles) hacia un enemigo en diferentes direcciones.
+        Devuelve True si disparó."""
+
         if not self.can_shoot():
-            return []
+            return False
             
         # Verificar si el enemigo está en rango
         dx = enemy_rect.centerx - self.rect.centerx
@@ -160,7 +97,6 @@ class Companion:
             angle_to_enemy = math.atan2(dy, dx)
             
             # Crear tres pinchos con diferentes ángulos
-            spikes = []
             angles = [
                 angle_to_enemy - 0.3,  # 17 grados a la izquierda
                 angle_to_enemy,        # Directo al enemigo
@@ -173,12 +109,11 @@ class Companion:
                 target_x = self.rect.centerx + math.cos(angle) * target_distance
                 target_y = self.rect.centery + math.sin(angle) * target_distance
                 
-                spike = Spike(self.rect.centerx, self.rect.centery, target_x, target_y)
-                spikes.append(spike)
+                projectiles.spawn_spike(self.rect.centerx, self.rect.centery, target_x, target_y)
             
-            return spikes
+            return True
         
-        return []
+        return False
     
     def find_nearest_enemy(self, enemies: list):
         """Encuentra el enemigo más cercano en rango"""
@@ -203,75 +138,91 @@ class Companion:
         return nearest_enemy
     
     def draw(self, surface: pygame.Surface):
-        """Dibuja el compañero perrito"""
+        """Dibuja el compañero perrito (sprite horneado por posición de la cola)"""
         if self.collected and not self.active:
             return
-            
-        # Colores del perrito
-        body_color = (139, 69, 19)    # Marrón
-        ear_color = (101, 67, 33)     # Marrón más oscuro
-        nose_color = (0, 0, 0)        # Negro
-        tongue_color = (255, 182, 193) # Rosa
-        
-        # Cuerpo principal (óvalo)
-        body_rect = pygame.Rect(self.rect.x, self.rect.y + 4, self.rect.width, self.rect.height - 4)
-        pygame.draw.ellipse(surface, body_color, body_rect)
-        
-        # Cabeza (círculo más pequeño)
-        head_size = int(self.rect.width * 0.7)
-        head_rect = pygame.Rect(self.rect.centerx - head_size//2, self.rect.y, head_size, head_size)
-        pygame.draw.ellipse(surface, body_color, head_rect)
-        
-        # Orejas (triángulos caídos)
-        ear_size = 6
-        left_ear_points = [
-            (head_rect.left + 3, head_rect.top + 2),
-            (head_rect.left - 2, head_rect.top + 8),
-            (head_rect.left + 8, head_rect.top + 6)
-        ]
-        right_ear_points = [
-            (head_rect.right - 3, head_rect.top + 2),
-            (head_rect.right + 2, head_rect.top + 8),
-            (head_rect.right - 8, head_rect.top + 6)
-        ]
-        pygame.draw.polygon(surface, ear_color, left_ear_points)
-        pygame.draw.polygon(surface, ear_color, right_ear_points)
-        
-        # Ojos (más grandes y expresivos)
-        eye_size = 4
-        left_eye = pygame.Rect(head_rect.centerx - 6, head_rect.centery - 2, eye_size, eye_size)
-        right_eye = pygame.Rect(head_rect.centerx + 2, head_rect.centery - 2, eye_size, eye_size)
-        pygame.draw.ellipse(surface, (255, 255, 255), left_eye)
-        pygame.draw.ellipse(surface, (255, 255, 255), right_eye)
-        
-        # Pupilas
-        pygame.draw.circle(surface, (0, 0, 0), left_eye.center, 2)
-        pygame.draw.circle(surface, (0, 0, 0), right_eye.center, 2)
-        
-        # Nariz (triángulo pequeño)
-        nose_points = [
-            (head_rect.centerx, head_rect.centery + 2),
-            (head_rect.centerx - 2, head_rect.centery + 5),
-            (head_rect.centerx + 2, head_rect.centery + 5)
-        ]
-        pygame.draw.polygon(surface, nose_color, nose_points)
-        
-        # Lengua (pequeña línea rosa)
-        tongue_rect = pygame.Rect(head_rect.centerx - 1, head_rect.centery + 5, 2, 3)
-        pygame.draw.rect(surface, tongue_color, tongue_rect)
-        
-        # Cola (pequeña línea que se mueve)
+
+        # Cola (pequeña línea que se mueve): el único detalle animado
         tail_offset = int(math.sin(self.bob_timer * 3) * 2)
-        tail_start = (body_rect.right - 2, body_rect.centery)
-        tail_end = (body_rect.right + 4 + tail_offset, body_rect.centery - 2)
-        pygame.draw.line(surface, ear_color, tail_start, tail_end, 2)
-        
+        w, h = self.rect.size
+        pad = _COMPANION_PAD
+        sprite = sprite_cache.get(
+            ('companion', w, h, tail_offset),
+            (w + 2 * pad, h + 2 * pad),
+            lambda s: _paint_companion(s, pygame.Rect(pad, pad, w, h), tail_offset),
+        )
+        surface.blit(sprite, (self.rect.x - pad, self.rect.y - pad))
+
         # Indicador de rango de detección (solo si está activo)
-        if self.active and self.can_shoot():
-            range_surface = pygame.Surface((self.detection_range * 2, self.detection_range * 2), pygame.SRCALPHA)
-            range_color = (139, 69, 19, 30)  # Marrón translúcido
-            pygame.draw.circle(range_surface, range_color, 
-                             (self.detection_range, self.detection_range), self.detection_range)
-            surface.blit(range_surface, 
-                        (self.rect.centerx - self.detection_range, 
-                         self.rect.centery - self.detection_range))
+        if self.active and self.can_shoot() and _RANGE.enabled:
+            r = self.detection_range
+            range_surface = sprite_cache.get(('companion_range', r), (r * 2, r * 2), lambda s: _paint_range(s, r))
+            surface.blit(range_surface, (self.rect.centerx - r, self.rect.centery - r))
+
+
+# Margen del sprite del perrito: orejas y cola sobresalen del rect
+_COMPANION_PAD = 8
+
+
+def _paint_companion(surface: pygame.Surface, rect: pygame.Rect, tail_offset: int) -> None:
+    # Colores del perrito
+    body_color = (139, 69, 19)    # Marrón
+    ear_color = (101, 67, 33)     # Marrón más oscuro
+    nose_color = (0, 0, 0)        # Negro
+    tongue_color = (255, 182, 193) # Rosa
+
+    # Cuerpo principal (óvalo)
+    body_rect = pygame.Rect(rect.x, rect.y + 4, rect.width, rect.height - 4)
+    pygame.draw.ellipse(surface, body_color, body_rect)
+
+    # Cabeza (círculo más pequeño)
+    head_size = int(rect.width * 0.7)
+    head_rect = pygame.Rect(rect.centerx - head_size//2, rect.y, head_size, head_size)
+    pygame.draw.ellipse(surface, body_color, head_rect)
+
+    # Orejas (triángulos caídos)
+    left_ear_points = [
+        (head_rect.left + 3, head_rect.top + 2),
+        (head_rect.left - 2, head_rect.top + 8),
+        (head_rect.left + 8, head_rect.top + 6)
+    ]
+    right_ear_points = [
+        (head_rect.right - 3, head_rect.top + 2),
+        (head_rect.right + 2, head_rect.top + 8),
+        (head_rect.right - 8, head_rect.top + 6)
+    ]
+    pygame.draw.polygon(surface, ear_color, left_ear_points)
+    pygame.draw.polygon(surface, ear_color, right_ear_points)
+
+    # Ojos (más grandes y expresivos)
+    eye_size = 4
+    left_eye = pygame.Rect(head_rect.centerx - 6, head_rect.centery - 2, eye_size, eye_size)
+    right_eye = pygame.Rect(head_rect.centerx + 2, head_rect.centery - 2, eye_size, eye_size)
+    pygame.draw.ellipse(surface, (255, 255, 255), left_eye)
+    pygame.draw.ellipse(surface, (255, 255, 255), right_eye)
+
+    # Pupilas
+    pygame.draw.circle(surface, (0, 0, 0), left_eye.center, 2)
+    pygame.draw.circle(surface, (0, 0, 0), right_eye.center, 2)
+
+    # Nariz (triángulo pequeño)
+    nose_points = [
+        (head_rect.centerx, head_rect.centery + 2),
+        (head_rect.centerx - 2, head_rect.centery + 5),
+        (head_rect.centerx + 2, head_rect.centery + 5)
+    ]
+    pygame.draw.polygon(surface, nose_color, nose_points)
+
+    # Lengua (pequeña línea rosa)
+    tongue_rect = pygame.Rect(head_rect.centerx - 1, head_rect.centery + 5, 2, 3)
+    pygame.draw.rect(surface, tongue_color, tongue_rect)
+
+    # Cola
+    tail_start = (body_rect.right - 2, body_rect.centery)
+    tail_end = (body_rect.right + 4 + tail_offset, body_rect.centery - 2)
+    pygame.draw.line(surface, ear_color, tail_start, tail_end, 2)
+
+
+def _paint_range(surface: pygame.Surface, r: int) -> None:
+    range_color = (139, 69, 19, 30)  # Marrón translúcido
+    pygame.draw.circle(surface, range_color, (r, r), r)
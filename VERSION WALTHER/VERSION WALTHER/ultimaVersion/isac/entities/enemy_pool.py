@@ -0,0 +1,356 @@
+import numpy as np
+import pygame
+from typing import List
+
+from isac.settings import RED, ENEMY_SPEED, ENEMY_SIZE, ENEMY_DEFAULT_HP, TILE
+
+# Códigos de tipo para los arrays (cualquier otro tipo se comporta como grunt)
+KIND_GRUNT = 0
+KIND_RUNNER = 1
+KIND_BRUTE = 2
+KIND_CODES = {'grunt': KIND_GRUNT, 'runner': KIND_RUNNER, 'brute': KIND_BRUTE}
+
+# Direcciones alternativas al chocar, como el antiguo Enemy._navigate_around_obstacle:
+# (coef vx, coef vy) para cada componente de la dirección probada
+_PROBES = (
+    ((0.0, 1.0), (-1.0, 0.0)),    # Perpendicular izquierda
+    ((0.0, -1.0), (1.0, 0.0)),    # Perpendicular derecha
+    ((0.7, 0.7), (-0.7, 0.7)),    # Diagonal izquierda
+    ((0.7, -0.7), (0.7, 0.7)),    # Diagonal derecha
+    ((-0.5, 0.0), (0.0, -0.5)),   # Retroceso parcial
+)
+
+
+class PooledEnemy:
+    """Vista de un enemigo dentro de un EnemyPool con la API del antiguo Enemy.
+
+    El estado vive en los arrays del pool; rect es un pygame.Rect que el pool
+    sincroniza tras cada paso y no debe moverse desde fuera.
+    """
+    __slots__ = ('pool', 'index', 'rect', 'color', 'kind')
+
+    def __init__(self, pool: "EnemyPool", index: int, rect: pygame.Rect, color: tuple[int, int, int], kind: str) -> None:
+        self.pool = pool
+        self.index = index
+        self.rect = rect
+        self.color = color
+        self.kind = kind
+
+    @property
+    def alive(self) -> bool:
+        return self.index >= 0 and bool(self.pool.alive[self.index])
+
+    @alive.setter
+    def alive(self, value: bool) -> None:
+        if self.index >= 0:
+            self.pool.alive[self.index] = value
+
+    @property
+    def hp(self) -> float:
+        return float(self.pool.hp[self.index])
+
+    @hp.setter
+    def hp(self, value: float) -> None:
+        self.pool.hp[self.index] = value
+
+    @property
+    def max_hp(self) -> int:
+        return int(self.pool.max_hp[self.index])
+
+    @property
+    def speed_scale(self) -> float:
+        return float(self.pool.speed_scale[self.index])
+
+    @property
+    def hurt_timer(self) -> float:
+        return float(self.pool.hurt_timer[self.index])
+
+    @property
+    def invuln_timer(self) -> float:
+        return float(self.pool.invuln_timer[self.index])
+
+    @property
+    def charge_just_started(self) -> bool:
+        return self.index >= 0 and bool(self.pool.charge_just_started[self.index])
+
+    def take_damage(self, dmg: int) -> bool:
+        """Aplica daño. Devuelve True si muere tras el golpe."""
+        if not self.alive:
+            return False
+        pool, i = self.pool, self.index
+        if pool.invuln_timer[i] > 0:
+            return False
+        pool.hp[i] -= max(0, dmg)
+        pool.hurt_timer[i] = 0.12
+        pool.invuln_timer[i] = 0.05
+        if pool.hp[i] <= 0:
+            pool.alive[i] = False
+            return True
+        return False
+
+    def draw(self, surface: pygame.Surface) -> None:
+        if not self.alive:
+            return
+        pool, i = self.pool, self.index
+        color = self.color
+        hurt = pool.hurt_timer[i]
+        # Parpadeo blanco cuando está herido (prioridad máxima)
+        if hurt > 0 and int(hurt * 15) % 2 == 0:
+            color = (255, 255, 255)
+        # Telegraph: brute en carga se tiñe anaranjado
+        elif pool.kind[i] == KIND_BRUTE and pool.charge_time[i] > 0:
+            color = (255, 200, 80)
+        pygame.draw.rect(surface, color, self.rect)
+
+
+class EnemyPool:
+    """Enemigos de una sala en estructura de arrays (NumPy).
+
+    Posición, vida, timers, tipo y escala de velocidad se guardan en arrays
+    contiguos y el movimiento de todos los enemigos (grunt, zig-zag del runner,
+    embestida del brute, colisión y rodeo de obstáculos) se calcula en un solo
+    paso vectorizado. Cada enemigo se expone como PooledEnemy.
+    """
+
+    def __init__(self, capacity: int = 16, size: int = ENEMY_SIZE) -> None:
+        self.size = size
+        self.count = 0
+        self.handles: List[PooledEnemy] = []
+        self._alloc(max(1, capacity))
+
+    def _alloc(self, capacity: int) -> None:
+        def grow(name: str, dtype, fill=0) -> None:
+            arr = np.full(capacity, fill, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                arr[:self.count] = old[:self.count]
+            setattr(self, name, arr)
+
+        grow('x', np.int64)
+        grow('y', np.int64)
+        grow('prev_x', np.int64)  # posición al empezar el último tick (interpolación)
+        grow('prev_y', np.int64)
+        grow('hp', np.float64)  # admite daño fraccionario (pinchos del compañero)
+        grow('max_hp', np.int64)
+        grow('alive', bool, False)
+        grow('kind', np.int8)
+        grow('speed_scale', np.float64, 1.0)
+        grow('hurt_timer', np.float64)
+        grow('invuln_timer', np.float64)
+        grow('zigzag_phase', np.float64)
+        grow('charge_cd', np.float64)
+        grow('charge_time', np.float64)
+        grow('charge_just_started', bool, False)
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        return self.count
+
+    def spawn(self, x: int, y: int, hp: int | None = None, speed_scale: float = 1.0,
+              color: tuple[int, int, int] | None = None, kind: str = 'grunt') -> PooledEnemy:
+        """Crea un enemigo centrado en (x, y); mismos parámetros que Enemy."""
+        if self.count >= self.capacity:
+            self._alloc(self.capacity * 2)
+        i = self.count
+        self.count += 1
+        rect = pygame.Rect(0, 0, self.size, self.size)
+        rect.center = (x, y)
+        self.x[i] = self.prev_x[i] = rect.x
+        self.y[i] = self.prev_y[i] = rect.y
+        self.max_hp[i] = hp if hp is not None else ENEMY_DEFAULT_HP
+        self.hp[i] = self.max_hp[i]
+        self.alive[i] = True
+        self.kind[i] = KIND_CODES.get(kind, KIND_GRUNT)
+        self.speed_scale[i] = max(0.1, speed_scale)
+        self.hurt_timer[i] = 0.0
+        self.invuln_timer[i] = 0.0
+        self.zigzag_phase[i] = 0.0
+        self.charge_cd[i] = 0.0
+        self.charge_time[i] = 0.0
+        self.charge_just_started[i] = False
+        handle = PooledEnemy(self, i, rect, color if color is not None else RED, kind)
+        self.handles.append(handle)
+        return handle
+
+    def alive_count(self) -> int:
+        return int(np.count_nonzero(self.alive[:self.count]))
+
+    def charges_started(self) -> int:
+        """Cantidad de brutes que empezaron a cargar en el último paso."""
+        return int(np.count_nonzero(self.charge_just_started[:self.count]))
+
+    def compact(self) -> None:
+        """Elimina los muertos de los arrays; sus vistas quedan con index -1."""
+        n = self.count
+        keep = np.flatnonzero(self.alive[:n])
+        if keep.size == n:
+            return
+        for name in _ARRAYS:
+            arr = getattr(self, name)
+            arr[:keep.size] = arr[keep]
+        survivors: List[PooledEnemy] = []
+        for h in self.handles:
+            h.index = -1
+        for new_i, old_i in enumerate(keep.tolist()):
+            h = self.handles[old_i]
+            h.index = new_i
+            survivors.append(h)
+        self.handles = survivors
+        self.count = keep.size
+        self.alive[self.count:n] = False
+
+    def update(self, player_rect: pygame.Rect, dt: float, grid=None, flow=None) -> None:
+        """Avanza a todos los enemigos vivos en un paso vectorizado.
+
+        Equivale a llamar Enemy.update(player_rect, dt, grid=grid, flow=flow)
+        sobre cada enemigo (la clase original está en
+        tests/test_enemy_pool_parity.py, que comprueba la paridad).
+        """
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.charge_just_started[:n] = False
+        idx = np.flatnonzero(self.alive[:n])
+        if idx.size == 0:
+            return
+        half = self.size // 2
+
+        # Timers
+        self.hurt_timer[idx] = np.maximum(0.0, self.hurt_timer[idx] - dt)
+        self.invuln_timer[idx] = np.maximum(0.0, self.invuln_timer[idx] - dt)
+
+        prev_x = self.x[idx]
+        prev_y = self.y[idx]
+        cx = prev_x + half
+        cy = prev_y + half
+
+        # Dirección hacia el jugador (o según el campo de flujo)
+        tpx = (player_rect.centerx - cx).astype(np.float64)
+        tpy = (player_rect.centery - cy).astype(np.float64)
+        dist = np.sqrt(tpx * tpx + tpy * tpy)
+        safe = np.where(dist > 0, dist, 1.0)
+        dir_x = np.where(dist > 0, tpx / safe, 0.0)
+        dir_y = np.where(dist > 0, tpy / safe, 0.0)
+        if flow is not None and flow.grid is not None:
+            tx = cx // TILE
+            ty = cy // TILE
+            inside = (tx >= 0) & (ty >= 0) & (tx < flow.cols) & (ty < flow.rows)
+            tile = np.where(inside, ty * flow.cols + tx, 0)
+            sx = flow.step_x[tile] - cx
+            sy = flow.step_y[tile] - cy
+            slen = np.sqrt(sx * sx + sy * sy)
+            use = inside & ~np.isnan(slen) & (slen > 0)
+            slen = np.where(use, slen, 1.0)
+            dir_x = np.where(use, sx / slen, dir_x)
+            dir_y = np.where(use, sy / slen, dir_y)
+
+        kind = self.kind[idx]
+        speed = ENEMY_SPEED * self.speed_scale[idx]
+        vx = dir_x * speed
+        vy = dir_y * speed
+
+        # Runner: zig-zag con componente perpendicular oscilante
+        runner = kind == KIND_RUNNER
+        if runner.any():
+            r = idx[runner]
+            self.zigzag_phase[r] += dt * 6.0
+            wave = np.sin(self.zigzag_phase[r])
+            dx = dir_x[runner]
+            dy = dir_y[runner]
+            mx = dx + -dy * 0.6 * wave
+            my = dy + dx * 0.6 * wave
+            mlen = np.sqrt(mx * mx + my * my)
+            ok = mlen > 0
+            mlen = np.where(ok, mlen, 1.0)
+            vx[runner] = np.where(ok, mx / mlen, dx) * speed[runner]
+            vy[runner] = np.where(ok, my / mlen, dy) * speed[runner]
+
+        # Brute: embestidas con cooldown
+        brute = kind == KIND_BRUTE
+        if brute.any():
+            b = idx[brute]
+            cd = np.maximum(0.0, self.charge_cd[b] - dt)
+            ct = np.maximum(0.0, self.charge_time[b] - dt)
+            start = (ct == 0) & (cd == 0) & (dist[brute] < 180)
+            ct[start] = 0.6
+            cd[start] = 2.0
+            self.charge_cd[b] = cd
+            self.charge_time[b] = ct
+            self.charge_just_started[b] = start
+            mul = np.where(ct > 0, 2.0, 1.0)
+            vx[brute] *= mul
+            vy[brute] *= mul
+
+        # Movimiento (truncado a píxeles enteros como Rect)
+        new_x = prev_x + np.trunc(vx * dt).astype(np.int64)
+        new_y = prev_y + np.trunc(vy * dt).astype(np.int64)
+
+        if grid is not None:
+            blocked = grid.collides_many(new_x, new_y, self.size, self.size)
+            if blocked.any():
+                # Revertir y probar direcciones alternativas
+                new_x[blocked] = prev_x[blocked]
+                new_y[blocked] = prev_y[blocked]
+                pending = np.flatnonzero(blocked)
+                bvx = vx[pending]
+                bvy = vy[pending]
+                bspeed = np.sqrt(bvx * bvx + bvy * bvy)
+                for (ax, ay), (bx, by) in _PROBES:
+                    if pending.size == 0:
+                        break
+                    alt_x = ax * bvx + ay * bvy
+                    alt_y = bx * bvx + by * bvy
+                    alen = np.sqrt(alt_x * alt_x + alt_y * alt_y)
+                    # Normalizar a la velocidad original reducida (navegando más lento)
+                    scale = (bspeed > 0) & (alen > 0)
+                    alen = np.where(scale, alen, 1.0)
+                    alt_x = np.where(scale, alt_x / alen * bspeed * 0.8, alt_x)
+                    alt_y = np.where(scale, alt_y / alen * bspeed * 0.8, alt_y)
+                    test_x = prev_x[pending] + np.trunc(alt_x * dt).astype(np.int64)
+                    test_y = prev_y[pending] + np.trunc(alt_y * dt).astype(np.int64)
+                    free = ~grid.collides_many(test_x, test_y, self.size, self.size)
+                    new_x[pending[free]] = test_x[free]
+                    new_y[pending[free]] = test_y[free]
+                    keep = ~free
+                    pending = pending[keep]
+                    bvx = bvx[keep]
+                    bvy = bvy[keep]
+                    bspeed = bspeed[keep]
+
+        self.x[idx] = new_x
+        self.y[idx] = new_y
+        # Sincronizar los Rect de las vistas
+        handles = self.handles
+        for i, px, py in zip(idx.tolist(), new_x.tolist(), new_y.tolist()):
+            rect = handles[i].rect
+            rect.x = px
+            rect.y = py
+
+    def interpolate_rects(self, alpha: float, snap: int) -> None:
+        """Coloca los Rect de las vistas entre el tick anterior y el actual (para dibujar).
+
+        Los saltos mayores que snap se dejan en la posición actual. sync_rects()
+        los devuelve a la posición simulada.
+        """
+        n = self.count
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        px, py = self.prev_x[:n], self.prev_y[:n]
+        ix = np.rint(px + (x - px) * alpha).astype(np.int64)
+        iy = np.rint(py + (y - py) * alpha).astype(np.int64)
+        jump = (np.abs(x - px) > snap) | (np.abs(y - py) > snap)
+        ix[jump] = x[jump]
+        iy[jump] = y[jump]
+        for h, rx, ry in zip(self.handles, ix.tolist(), iy.tolist()):
+            h.rect.x = rx
+            h.rect.y = ry
+
+    def sync_rects(self) -> None:
+        for h, rx, ry in zip(self.handles, self.x[:self.count].tolist(), self.y[:self.count].tolist()):
+            h.rect.x = rx
+            h.rect.y = ry
+
+
+_ARRAYS = ('x', 'y', 'prev_x', 'prev_y', 'hp', 'max_hp', 'alive', 'kind', 'speed_scale', 'hurt_timer',
+           'invuln_timer', 'zigzag_phase', 'charge_cd', 'charge_time', 'charge_just_started')
@@ -1,6 +1,11 @@
 import pygame
 import math
 from isac.settings import TILE
+from isac.core.sprites import sprite_cache, phase_bucket
+from isac.core.quality import quality, TIER_ORNAMENT
+
+_GLOW = quality.register('health_doubler.glow', TIER_ORNAMENT)
+_SPARKLES = quality.register('health_doubler.sparkles', TIER_ORNAMENT)
 
 class HealthDoubler:
     def __init__(self, x: int, y: int):
@@ -22,97 +27,117 @@ class HealthDoubler:
         player.max_hp *= 2
         # Curar completamente al jugador cuando obtiene el item
         player.hp = player.max_hp
+        player.notify_changed()
         self.collected = True
         
     def draw(self, surface: pygame.Surface):
-        """Dibuja el corazón doblador con efectos"""
+        """Dibuja el corazón doblador con efectos (sprites horneados por fase del pulso)"""
         if self.collected:
             return
-            
+
         # Flotación suave
         float_offset = math.sin(self.float_timer) * 4
         draw_y = self.original_y + float_offset
-        
-        # Efecto de pulso
-        pulse_scale = 1.0 + 0.3 * math.sin(self.pulse_timer)
-        pulse_size = int(self.rect.width * pulse_scale)
-        
-        # Calcular posición centrada para el pulso
-        pulse_rect = pygame.Rect(0, 0, pulse_size, pulse_size)
-        pulse_rect.center = (self.rect.centerx, int(draw_y))
-        
-        # Brillo exterior pulsante
-        glow_intensity = int(100 + 80 * math.sin(self.pulse_timer))
-        glow_surface = pygame.Surface((pulse_size + 30, pulse_size + 30), pygame.SRCALPHA)
-        glow_color = (255, 100, 100, glow_intensity)
-        
-        # Crear múltiples capas de brillo
-        for i in range(3):
-            glow_size = pulse_size + 10 + i * 8
-            glow_alpha = max(0, glow_intensity - i * 30)
-            if glow_alpha > 0:
-                glow_rect = pygame.Rect((30 - glow_size) // 2, (30 - glow_size) // 2, 
-                                       glow_size, glow_size)
-                pygame.draw.ellipse(glow_surface, (255, 100, 100, glow_alpha), glow_rect)
-        
-        surface.blit(glow_surface, (pulse_rect.centerx - 15, pulse_rect.centery - 15),
-                    special_flags=pygame.BLEND_ADD)
-        
-        # Dibujar corazón principal
-        heart_color = (220, 20, 60)  # Rojo intenso
-        highlight_color = (255, 105, 180)  # Rosa claro
-        
-        # Corazón como dos círculos y un triángulo
-        heart_size = pulse_size // 2
-        
-        # Círculos superiores del corazón
-        left_circle = pygame.Rect(pulse_rect.centerx - heart_size // 2, 
-                                 pulse_rect.centery - heart_size // 4,
-                                 heart_size // 2, heart_size // 2)
-        right_circle = pygame.Rect(pulse_rect.centerx, 
-                                  pulse_rect.centery - heart_size // 4,
-                                  heart_size // 2, heart_size // 2)
-        
-        pygame.draw.ellipse(surface, heart_color, left_circle)
-        pygame.draw.ellipse(surface, heart_color, right_circle)
-        
-        # Parte inferior del corazón (triángulo)
-        bottom_points = [
-            (pulse_rect.centerx, pulse_rect.centery + heart_size // 2),
-            (pulse_rect.centerx - heart_size // 2, pulse_rect.centery),
-            (pulse_rect.centerx + heart_size // 2, pulse_rect.centery)
-        ]
-        pygame.draw.polygon(surface, heart_color, bottom_points)
-        
-        # Brillos en el corazón
-        highlight_alpha = int(150 + 100 * math.sin(self.pulse_timer * 1.5))
-        
-        # Brillo en círculo izquierdo
-        left_highlight = pygame.Rect(left_circle.x + 2, left_circle.y + 2, 
-                                    left_circle.width // 3, left_circle.height // 3)
-        highlight_surface = pygame.Surface(left_highlight.size, pygame.SRCALPHA)
-        highlight_surface.fill((255, 255, 255, highlight_alpha))
-        surface.blit(highlight_surface, left_highlight.topleft, special_flags=pygame.BLEND_ADD)
-        
-        # Brillo en círculo derecho
-        right_highlight = pygame.Rect(right_circle.x + 2, right_circle.y + 2,
-                                     right_circle.width // 3, right_circle.height // 3)
-        highlight_surface = pygame.Surface(right_highlight.size, pygame.SRCALPHA)
+
+        # El pulso, los brillos y las partículas dependen solo de pulse_timer,
+        # que se repite cada 4π: se hornea una cubeta de esa fase
+        bucket, t = phase_bucket(self.pulse_timer, _PULSE_PERIOD)
+        w = self.rect.width
+        pulse_size = int(w * (1.0 + 0.3 * math.sin(t)))
+        cx, cy = self.rect.centerx, int(draw_y)
+
+        # Brillo exterior pulsante (aditivo)
+        if _GLOW.enabled:
+            glow = sprite_cache.get(('health_doubler_glow', w, bucket), (pulse_size + 30, pulse_size + 30),
+                                    lambda s: _paint_glow(s, pulse_size, t))
+            surface.blit(glow, (cx - 15, cy - 15), special_flags=pygame.BLEND_ADD)
+
+        # Corazón principal
+        c = _HEART_CANVAS // 2
+        heart = sprite_cache.get(('health_doubler', w, bucket), (_HEART_CANVAS, _HEART_CANVAS),
+                                 lambda s: _paint_heart(s, c, c, pulse_size))
+        surface.blit(heart, (cx - c, cy - c))
+
+        # Brillos y partículas (aditivos)
+        if _SPARKLES.enabled:
+            sparkles = sprite_cache.get(('health_doubler_sparkles', w, bucket), (_HEART_CANVAS, _HEART_CANVAS),
+                                        lambda s: _paint_sparkles(s, c, c, pulse_size, t))
+            surface.blit(sparkles, (cx - c, cy - c), special_flags=pygame.BLEND_ADD)
+
+
+# Periodo común de todas las ondas de pulse_timer y lienzo de los sprites
+# (las partículas orbitan hasta 25 px del centro)
+_PULSE_PERIOD = 4 * math.pi
+_HEART_CANVAS = 64
+_ROUND_REF = 256
+
+
+def _heart_circles(cx: int, cy: int, pulse_size: int) -> tuple[pygame.Rect, pygame.Rect]:
+    # Círculos superiores del corazón
+    heart_size = pulse_size // 2
+    left_circle = pygame.Rect(cx - heart_size // 2,
+                             cy - heart_size // 4,
+                             heart_size // 2, heart_size // 2)
+    right_circle = pygame.Rect(cx,
+                              cy - heart_size // 4,
+                              heart_size // 2, heart_size // 2)
+    return left_circle, right_circle
+
+
+def _paint_glow(surface: pygame.Surface, pulse_size: int, t: float) -> None:
+    glow_intensity = int(100 + 80 * math.sin(t))
+    # Crear múltiples capas de brillo
+    for i in range(3):
+        glow_size = pulse_size + 10 + i * 8
+        glow_alpha = max(0, glow_intensity - i * 30)
+        if glow_alpha > 0:
+            glow_rect = pygame.Rect((30 - glow_size) // 2, (30 - glow_size) // 2,
+                                   glow_size, glow_size)
+            pygame.draw.ellipse(surface, (255, 100, 100, glow_alpha), glow_rect)
+
+
+def _paint_heart(surface: pygame.Surface, cx: int, cy: int, pulse_size: int) -> None:
+    # Corazón como dos círculos y un triángulo
+    heart_color = (220, 20, 60)  # Rojo intenso
+    heart_size = pulse_size // 2
+    left_circle, right_circle = _heart_circles(cx, cy, pulse_size)
+    pygame.draw.ellipse(surface, heart_color, left_circle)
+    pygame.draw.ellipse(surface, heart_color, right_circle)
+
+    # Parte inferior del corazón (triángulo)
+    bottom_points = [
+        (cx, cy + heart_size // 2),
+        (cx - heart_size // 2, cy),
+        (cx + heart_size // 2, cy)
+    ]
+    pygame.draw.polygon(surface, heart_color, bottom_points)
+
+
+def _paint_sparkles(surface: pygame.Surface, cx: int, cy: int, pulse_size: int, t: float) -> None:
+    # Se suman como se sumaban sobre la pantalla (BLEND_ADD satura igual)
+    left_circle, right_circle = _heart_circles(cx, cy, pulse_size)
+    highlight_alpha = int(150 + 100 * math.sin(t * 1.5))
+
+    # Brillos en los círculos izquierdo y derecho
+    for circle in (left_circle, right_circle):
+        highlight = pygame.Rect(circle.x + 2, circle.y + 2, circle.width // 3, circle.height // 3)
+        highlight_surface = pygame.Surface(highlight.size, pygame.SRCALPHA)
         highlight_surface.fill((255, 255, 255, highlight_alpha))
-        surface.blit(highlight_surface, right_highlight.topleft, special_flags=pygame.BLEND_ADD)
-        
-        # Partículas flotantes alrededor del corazón
-        particle_count = 6
-        for i in range(particle_count):
-            angle = (self.pulse_timer * 0.5 + i * (2 * math.pi / particle_count)) % (2 * math.pi)
-            particle_distance = 20 + 5 * math.sin(self.pulse_timer + i)
-            particle_x = pulse_rect.centerx + math.cos(angle) * particle_distance
-            particle_y = pulse_rect.centery + math.sin(angle) * particle_distance
-            
-            particle_alpha = int(100 + 50 * math.sin(self.pulse_timer * 2 + i))
-            if particle_alpha > 0:
-                particle_surface = pygame.Surface((6, 6), pygame.SRCALPHA)
-                particle_color = (255, 150, 150, particle_alpha)
-                pygame.draw.circle(particle_surface, particle_color, (3, 3), 3)
-                surface.blit(particle_surface, (int(particle_x) - 3, int(particle_y) - 3),
-                           special_flags=pygame.BLEND_ADD)
+        surface.blit(highlight_surface, highlight.topleft, special_flags=pygame.BLEND_ADD)
+
+    # Partículas flotantes alrededor del corazón
+    particle_count = 6
+    for i in range(particle_count):
+        angle = (t * 0.5 + i * (2 * math.pi / particle_count)) % (2 * math.pi)
+        particle_distance = 20 + 5 * math.sin(t + i)
+        # Redondeo como con coordenadas absolutas de pantalla (int(cx + dx))
+        px = int(_ROUND_REF + math.cos(angle) * particle_distance) - _ROUND_REF
+        py = int(_ROUND_REF + math.sin(angle) * particle_distance) - _ROUND_REF
+
+        particle_alpha = int(100 + 50 * math.sin(t * 2 + i))
+        if particle_alpha > 0:
+            particle_surface = pygame.Surface((6, 6), pygame.SRCALPHA)
+            particle_color = (255, 150, 150, particle_alpha)
+            pygame.draw.circle(particle_surface, particle_color, (3, 3), 3)
+            surface.blit(particle_surface, (cx + px - 3, cy + py - 3),
+                       special_flags=pygame.BLEND_ADD)
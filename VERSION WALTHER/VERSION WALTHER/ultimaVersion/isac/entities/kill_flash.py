@@ -0,0 +1,22 @@
+import pygame
+
+
+class KillFlash:
+    """Destello breve sobre un enemigo muerto (reutilizable desde un pool)."""
+
+    DURATION = 0.15
+
+    def __init__(self) -> None:
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.time = 0.0
+        self.alive = False
+
+    def reset(self, rect: pygame.Rect, duration: float = DURATION) -> "KillFlash":
+        self.rect.update(rect)
+        self.time = duration
+        self.alive = True
+        return self
+
+    def update(self, dt: float) -> None:
+        self.time = max(0.0, self.time - dt)
+        self.alive = self.time > 0
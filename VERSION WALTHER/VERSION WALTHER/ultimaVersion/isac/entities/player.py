@@ -11,6 +11,10 @@ from isac.settings import (
     MELEE_COOLDOWN,
     MELEE_RANGE,
 )
+from isac.core.input import IDLE, InputState
+from isac.core.quality import quality, TIER_EFFECT
+
+_BOOTS_TRAIL = quality.register('player.boots_trail', TIER_EFFECT)
 
 
 class Player:
@@ -33,8 +37,18 @@ class Player:
         self.melee_active_time = 0.0  # duración breve del golpe visible
         self.shield = False
         self._prev_center = self.rect.center
+        self.move_dir = (0, 0)  # dirección de movimiento del último tick (-1/0/1)
+        # Callbacks avisados cuando cambia la vida (p. ej. el HUD)
+        self._listeners: list = []
+
+    def subscribe(self, callback) -> None:
+        self._listeners.append(callback)
+
+    def notify_changed(self) -> None:
+        for callback in self._listeners:
+            callback()
 
-    def update(self, dt: float, walls: list, obstacles: list) -> None:
+    def update(self, dt: float, walls: list, obstacles: list, inp: InputState = IDLE) -> None:
         # Reducir cooldowns
         if self.melee_cd > 0:
             self.melee_cd -= dt
@@ -51,21 +65,18 @@ class Player:
                 # Resetear velocidad cuando se acaba el efecto
                 self.speed_multiplier = 1.0
 
-        # Movimiento con teclas
-        keys = pygame.key.get_pressed()
-        vx = vy = 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            vx = -1
-            self.facing = "left"
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            vx = 1
-            self.facing = "right"
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            vy = -1
-            self.facing = "up"
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            vy = 1
+        # Movimiento según la entrada del frame
+        vx, vy = inp.move_x, inp.move_y
+        self.move_dir = (vx, vy)
+        # La vertical manda sobre la horizontal al mirar (como con las teclas)
+        if vy > 0:
             self.facing = "down"
+        elif vy < 0:
+            self.facing = "up"
+        elif vx > 0:
+            self.facing = "right"
+        elif vx < 0:
+            self.facing = "left"
 
         # Normalizar diagonal
         if vx != 0 and vy != 0:
@@ -98,20 +109,20 @@ class Player:
 
     def draw(self, surface: pygame.Surface) -> None:
         # Efecto de fuego/rayos detrás del jugador si tiene botas activas
-        if self.speed_boots_timer > 0:
+        if self.speed_boots_timer > 0 and _BOOTS_TRAIL.enabled:
             # Determinar dirección opuesta al movimiento
-            keys = pygame.key.get_pressed()
+            move_x, move_y = self.move_dir
             trail_x = self.rect.centerx
             trail_y = self.rect.centery
             
             # Calcular dirección del rastro basado en el movimiento
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+            if move_x < 0:
                 trail_x += 25  # Rastro a la derecha si va izquierda
-            elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            elif move_x > 0:
                 trail_x -= 25  # Rastro a la izquierda si va derecha
-            elif keys[pygame.K_UP] or keys[pygame.K_w]:
+            elif move_y < 0:
                 trail_y += 25  # Rastro abajo si va arriba
-            elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
+            elif move_y > 0:
                 trail_y -= 25  # Rastro arriba si va abajo
             else:
                 # Si no se mueve, rastro detrás según la dirección que mira
@@ -162,6 +173,7 @@ class Player:
             return
         self.hp = max(0, self.hp - amount)
         self.invuln = PLAYER_INVULN_TIME
+        self.notify_changed()
 
     # Ataque melee: activa una pequeña ventana donde existe una hitbox delante del jugador
     def start_melee(self) -> bool:
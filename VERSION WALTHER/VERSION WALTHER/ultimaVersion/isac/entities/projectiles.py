@@ -0,0 +1,331 @@
+import math
+import numpy as np
+import pygame
+from typing import List, Optional, Sequence, Tuple
+
+from isac.settings import (
+    WIDTH,
+    HEIGHT,
+    CYAN,
+    WHITE,
+    ARROW_SPEED,
+    ARROW_SIZE,
+    ARROW_DAMAGE,
+    SPIKE_SPEED,
+    SPIKE_SIZE,
+    SPIKE_DAMAGE,
+    BULLET_RADIUS,
+    BULLET_TTL,
+    SPATIAL_CELL_SIZE,
+    PROJECTILE_CAPACITY,
+)
+
+# Tipos de proyectil
+KIND_ARROW = 0
+KIND_SPIKE = 1
+KIND_BULLET = 2
+
+# Quién lo disparó
+OWNER_PLAYER = 0
+OWNER_COMPANION = 1
+
+# Por tipo: lado del rect, si choca con paredes/obstáculos, margen fuera de
+# pantalla y si se descarta fuera de pantalla antes de comprobar impactos
+# (como hacía el antiguo Spike.update) o después (como hacían las flechas);
+# tests/test_projectiles_parity.py conserva las clases originales
+_KIND_SIZE = np.array([ARROW_SIZE, SPIKE_SIZE, BULLET_RADIUS * 2], dtype=np.int64)
+_KIND_SOLID = (True, False, True)
+_KIND_MARGIN = np.array([0, 50, 0], dtype=np.float64)
+_KIND_CULL_FIRST = np.array([False, True, False])
+
+# Clave de celda = cy * _KEY_STRIDE + cx (cx puede ser negativo cerca del borde)
+_KEY_STRIDE = 1 << 20
+
+_SPIKE_COLOR = (139, 69, 19)  # Marrón
+_SPIKE_TIP_COLOR = (160, 82, 45)  # Marrón claro
+
+# Impacto devuelto por step(): (tipo, enemigo o None si fue un obstáculo, murió)
+Hit = Tuple[int, Optional[object], bool]
+
+
+def _cell_entries(left: np.ndarray, top: np.ndarray, size: np.ndarray, cell: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(clave de celda, índice) por cada celda que cubre cada rect cuadrado."""
+    idx = np.arange(len(left))
+    cx0 = left // cell
+    cy0 = top // cell
+    cx1 = (left + size - 1) // cell
+    cy1 = (top + size - 1) // cell
+    span = int((size.max() + cell - 1) // cell) + 1 if len(size) else 0
+    keys = []
+    ids = []
+    for oy in range(span):
+        cy = cy0 + oy
+        for ox in range(span):
+            cx = cx0 + ox
+            ok = (cx <= cx1) & (cy <= cy1)
+            keys.append(cy[ok] * _KEY_STRIDE + cx[ok])
+            ids.append(idx[ok])
+    if not keys:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(keys), np.concatenate(ids)
+
+
+class ProjectileSystem:
+    """Flechas, pinchos y balas en arrays contiguos.
+
+    Todos los proyectiles avanzan en un único paso vectorizado y los impactos
+    se resuelven en una sola pasada: paredes y obstáculos con la rejilla de
+    ocupación, y enemigos cruzando por celdas los rects de proyectiles y
+    enemigos. Solo los proyectiles que tocan algo llegan al bucle en Python,
+    que respeta el orden de disparo y el orden de la lista de enemigos.
+    """
+
+    def __init__(self, capacity: int = PROJECTILE_CAPACITY, cell_size: int = SPATIAL_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self.count = 0
+        self.peak = 0
+        self._alloc(max(1, capacity))
+
+    def _alloc(self, capacity: int) -> None:
+        def grow(name: str, dtype, fill=0) -> None:
+            arr = np.full(capacity, fill, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                arr[:self.count] = old[:self.count]
+            setattr(self, name, arr)
+
+        grow('x', np.float64)
+        grow('y', np.float64)
+        grow('vx', np.float64)
+        grow('vy', np.float64)
+        grow('ttl', np.float64, np.inf)
+        grow('damage', np.float64)
+        grow('owner', np.int8)
+        grow('kind', np.int8)
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        return self.count
+
+    def spawn(self, kind: int, x: float, y: float, vx: float, vy: float, damage: float,
+              ttl: float = math.inf, owner: int = OWNER_PLAYER) -> None:
+        if self.count == self.capacity:
+            self._alloc(self.capacity * 2)
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.ttl[i] = ttl
+        self.damage[i] = damage
+        self.owner[i] = owner
+        self.kind[i] = kind
+        self.count += 1
+        self.peak = max(self.peak, self.count)
+
+    def spawn_arrow(self, x: int, y: int, dx: int, dy: int) -> None:
+        """Flecha del jugador en una de las cuatro direcciones (dx, dy en -1..1)."""
+        self.spawn(KIND_ARROW, x, y, dx * ARROW_SPEED, dy * ARROW_SPEED, ARROW_DAMAGE)
+
+    def spawn_spike(self, x: int, y: int, target_x: float, target_y: float) -> None:
+        """Pincho del compañero dirigido hacia (target_x, target_y)."""
+        dx = target_x - x
+        dy = target_y - y
+        distance = math.sqrt(dx * dx + dy * dy)
+        if distance > 0:
+            vx = (dx / distance) * SPIKE_SPEED
+            vy = (dy / distance) * SPIKE_SPEED
+        else:
+            vx = vy = 0.0
+        self.spawn(KIND_SPIKE, x, y, vx, vy, SPIKE_DAMAGE, owner=OWNER_COMPANION)
+
+    def spawn_bullet(self, x: int, y: int, dir_x: int, dir_y: int, speed: int = 480,
+                     damage: float = ARROW_DAMAGE, ttl: float = BULLET_TTL) -> None:
+        self.spawn(KIND_BULLET, x, y, dir_x * speed, dir_y * speed, damage, ttl)
+
+    def clear(self, kind: Optional[int] = None) -> None:
+        """Elimina todos los proyectiles, o solo los de un tipo."""
+        if kind is None:
+            self.count = 0
+        else:
+            self._keep(self.kind[:self.count] != kind)
+
+    def _keep(self, keep: np.ndarray) -> None:
+        # Compacta en el sitio conservando el orden de disparo
+        n = self.count
+        k = int(keep.sum())
+        if k == n:
+            return
+        for name in _ARRAYS:
+            arr = getattr(self, name)
+            arr[:k] = arr[:n][keep]
+        self.count = k
+
+    def step(self, dt: float, grid=None, enemy_pool=None, kinds: Optional[Sequence[int]] = None) -> List[Hit]:
+        """Avanza todos los proyectiles y resuelve sus impactos.
+
+        Aplica el daño a los enemigos y devuelve los impactos para que la
+        escena reproduzca sonidos y efectos. Los choques con paredes no se
+        devuelven (la flecha desaparece sin sonido). Con `kinds` solo avanzan
+        esos tipos y el resto queda como estaba (la escena mueve las flechas
+        antes que los enemigos y los pinchos después, como los bucles antiguos).
+        """
+        n = self.count
+        if n == 0:
+            return []
+        x, y = self.x[:n], self.y[:n]
+        kind = self.kind[:n]
+        # np.True_ y no True: ~moving tiene que seguir siendo un booleano
+        moving = np.True_ if kinds is None else np.isin(kind, kinds)
+        np.add(x, self.vx[:n] * dt, out=x, where=moving)
+        np.add(y, self.vy[:n] * dt, out=y, where=moving)
+        ttl = self.ttl[:n]
+        np.subtract(ttl, dt, out=ttl, where=moving)
+        alive = ttl > 0
+
+        size = _KIND_SIZE[kind]
+        left = np.trunc(x).astype(np.int64) - size // 2
+        top = np.trunc(y).astype(np.int64) - size // 2
+        margin = _KIND_MARGIN[kind]
+        offscreen = ((x < -margin) | (x > WIDTH + margin) | (y < -margin) | (y > HEIGHT + margin)) & moving
+        cull_first = _KIND_CULL_FIRST[kind]
+        alive &= ~(offscreen & cull_first)
+
+        hits: List[Hit] = []
+        # Paredes (sin sonido) y obstáculos, por tipo porque el tamaño es fijo por tipo
+        if grid is not None:
+            for k, solid in enumerate(_KIND_SOLID):
+                if not solid:
+                    continue
+                sel = np.flatnonzero(alive & moving & (kind == k))
+                if len(sel) == 0:
+                    continue
+                s = int(_KIND_SIZE[k])
+                wall = grid.collides_many(left[sel], top[sel], s, s, obstacles=False)
+                obstacle = ~wall & grid.collides_many(left[sel], top[sel], s, s, walls=False)
+                alive[sel[wall | obstacle]] = False
+                hits.extend((k, None, False) for _ in range(int(obstacle.sum())))
+
+        if enemy_pool is not None and len(enemy_pool):
+            live = alive & moving
+            if live.any():
+                self._resolve_enemy_hits(enemy_pool, live, left, top, size, hits)
+                alive &= live | ~moving
+
+        alive &= ~(offscreen & ~cull_first)
+        self._keep(alive)
+        return hits
+
+    def _resolve_enemy_hits(self, enemy_pool, alive: np.ndarray, left: np.ndarray, top: np.ndarray,
+                            size: np.ndarray, hits: List[Hit]) -> None:
+        m = len(enemy_pool)
+        ex = enemy_pool.x[:m]
+        ey = enemy_pool.y[:m]
+        es = enemy_pool.size
+        live_e = np.flatnonzero(enemy_pool.alive[:m])
+        live_p = np.flatnonzero(alive)
+        if len(live_e) == 0:
+            return
+        # Cruce por celdas: cada proyectil solo se compara con los enemigos de sus celdas
+        ekeys, eids = _cell_entries(ex[live_e], ey[live_e], np.full(len(live_e), es, dtype=np.int64), self.cell_size)
+        pkeys, pids = _cell_entries(left[live_p], top[live_p], size[live_p], self.cell_size)
+        order = np.argsort(ekeys, kind='stable')
+        ekeys = ekeys[order]
+        eids = live_e[eids[order]]
+        lo = np.searchsorted(ekeys, pkeys, side='left')
+        counts = np.searchsorted(ekeys, pkeys, side='right') - lo
+        total = int(counts.sum())
+        if total == 0:
+            return
+        p = live_p[np.repeat(pids, counts)]
+        offs = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        e = eids[np.repeat(lo, counts) + offs]
+        # Test exacto (mismo criterio que Rect.colliderect)
+        ps = size[p]
+        overlap = (left[p] < ex[e] + es) & (left[p] + ps > ex[e]) & (top[p] < ey[e] + es) & (top[p] + ps > ey[e])
+        if not overlap.any():
+            return
+        # Pares únicos ordenados por (proyectil, enemigo)
+        pairs = np.unique(p[overlap] * m + e[overlap])
+
+        # Resolución secuencial: cada proyectil golpea al primer enemigo vivo
+        # (en orden de lista) y los siguientes ya ven a los que murieron
+        handles = enemy_pool.handles
+        kind = self.kind
+        damage = self.damage
+        done = -1
+        for pair in pairs.tolist():
+            pi, ei = divmod(pair, m)
+            if pi == done:
+                continue
+            enemy = handles[ei]
+            if not enemy.alive:
+                continue
+            died = enemy.take_damage(float(damage[pi]))
+            alive[pi] = False
+            hits.append((int(kind[pi]), enemy, died))
+            done = pi
+
+    def bounds(self, out: List[pygame.Rect], margin: int = 0, lag: float = 0.0) -> None:
+        """Añade a out el rect de dibujo de cada proyectil (ampliado en margin)."""
+        n = self.count
+        if n == 0:
+            return
+        # La punta del pincho sobresale hasta 8 px del centro
+        half = np.maximum(_KIND_SIZE[self.kind[:n]] // 2, 8) + margin
+        x = self.x[:n] - self.vx[:n] * lag
+        y = self.y[:n] - self.vy[:n] * lag
+        left = (np.trunc(x).astype(np.int64) - half).tolist()
+        top = (np.trunc(y).astype(np.int64) - half).tolist()
+        for l, t, h in zip(left, top, half.tolist()):
+            out.append(pygame.Rect(l, t, 2 * h + 1, 2 * h + 1))
+
+    def count_of(self, kind: int) -> int:
+        return int(np.count_nonzero(self.kind[:self.count] == kind))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'in_use': self.count,
+            'capacity': self.capacity,
+            'peak': self.peak,
+            'arrows': self.count_of(KIND_ARROW),
+            'spikes': self.count_of(KIND_SPIKE),
+        }
+
+    def draw(self, surface: pygame.Surface, kind: Optional[int] = None, lag: float = 0.0) -> None:
+        """Dibuja todos los proyectiles, o solo los de un tipo.
+
+        lag retrasa el dibujo esos segundos sobre su trayectoria (recta): es
+        la interpolación entre el tick anterior y el actual.
+        """
+        n = self.count
+        if n == 0:
+            return
+        for i, k in enumerate(self.kind[:n].tolist()):
+            if kind is not None and k != kind:
+                continue
+            x = float(self.x[i]) - float(self.vx[i]) * lag
+            y = float(self.y[i]) - float(self.vy[i]) * lag
+            if k == KIND_ARROW:
+                half = ARROW_SIZE // 2
+                pygame.draw.rect(surface, CYAN, (int(x) - half, int(y) - half, ARROW_SIZE, ARROW_SIZE))
+            elif k == KIND_SPIKE:
+                _draw_spike(surface, x, y, float(self.vx[i]), float(self.vy[i]))
+            else:
+                pygame.draw.circle(surface, WHITE, (int(x), int(y)), BULLET_RADIUS)
+
+
+def _draw_spike(surface: pygame.Surface, x: float, y: float, vx: float, vy: float) -> None:
+    # Triángulo alargado orientado según la velocidad (como el antiguo Spike.draw)
+    angle = math.atan2(vy, vx)
+    length = 8
+    width = 3
+    tip = (x + math.cos(angle) * length, y + math.sin(angle) * length)
+    base1 = (x + math.cos(angle + math.pi * 0.8) * width, y + math.sin(angle + math.pi * 0.8) * width)
+    base2 = (x + math.cos(angle - math.pi * 0.8) * width, y + math.sin(angle - math.pi * 0.8) * width)
+    points = [tip, base1, base2]
+    pygame.draw.polygon(surface, _SPIKE_COLOR, points)
+    pygame.draw.polygon(surface, _SPIKE_TIP_COLOR, points, 1)
+
+
+_ARRAYS = ('x', 'y', 'vx', 'vy', 'ttl', 'damage', 'owner', 'kind')
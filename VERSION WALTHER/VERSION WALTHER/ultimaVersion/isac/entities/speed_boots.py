@@ -1,6 +1,7 @@
 import pygame
 import math
 from isac.settings import TILE
+from isac.core.sprites import sprite_cache
 
 class SpeedBoots:
     def __init__(self, x: int, y: int):
@@ -26,41 +27,46 @@ class SpeedBoots:
         # self.collected = True
         
     def draw(self, surface: pygame.Surface):
-        """Dibuja las botas sin efectos brillantes"""
+        """Dibuja las botas sin efectos brillantes (sprite horneado)"""
         if self.collected:
             return
-        
-        # Dibujar las botas
-        boot_color = (139, 69, 19)  # Marrón
-        sole_color = (101, 67, 33)  # Marrón más oscuro
-        lace_color = (255, 255, 255)  # Blanco
-        
-        # Bota izquierda
-        left_boot = pygame.Rect(self.rect.x, self.rect.y + 4, 
-                               self.rect.width // 2 - 1, self.rect.height - 4)
-        pygame.draw.rect(surface, boot_color, left_boot, border_radius=3)
-        pygame.draw.rect(surface, sole_color, 
-                        (left_boot.x, left_boot.bottom - 3, left_boot.width, 3))
-        
-        # Bota derecha
-        right_boot = pygame.Rect(self.rect.x + self.rect.width // 2 + 1, self.rect.y + 4,
-                                self.rect.width // 2 - 1, self.rect.height - 4)
-        pygame.draw.rect(surface, boot_color, right_boot, border_radius=3)
-        pygame.draw.rect(surface, sole_color,
-                        (right_boot.x, right_boot.bottom - 3, right_boot.width, 3))
-        
-        # Cordones
-        pygame.draw.line(surface, lace_color, 
-                        (left_boot.centerx, left_boot.y + 2),
-                        (left_boot.centerx, left_boot.y + 8), 1)
-        pygame.draw.line(surface, lace_color,
-                        (right_boot.centerx, right_boot.y + 2),
-                        (right_boot.centerx, right_boot.y + 8), 1)
-        
-        # Brillo adicional en las botas
+
+        w, h = self.rect.size
+        sprite = sprite_cache.get(('speed_boots', w, h), (w, h), lambda s: _paint_boots(s, pygame.Rect(0, 0, w, h)))
+        surface.blit(sprite, self.rect.topleft)
+
+        # Brillo adicional en las botas (aditivo, por eso va aparte)
         highlight_alpha = int(150 + 100 * math.sin(self.glow_timer * 1.5))
-        highlight_surface = pygame.Surface((self.rect.width, 4), pygame.SRCALPHA)
-        highlight_color = (255, 255, 200, highlight_alpha)
-        highlight_surface.fill(highlight_color)
+        highlight_surface = sprite_cache.get(('speed_boots_glow', w, highlight_alpha), (w, 4),
+                                             lambda s: s.fill((255, 255, 200, highlight_alpha)))
         surface.blit(highlight_surface, (self.rect.x, self.rect.y + 2),
                     special_flags=pygame.BLEND_ADD)
+
+
+def _paint_boots(surface: pygame.Surface, rect: pygame.Rect) -> None:
+    # Dibujar las botas
+    boot_color = (139, 69, 19)  # Marrón
+    sole_color = (101, 67, 33)  # Marrón más oscuro
+    lace_color = (255, 255, 255)  # Blanco
+
+    # Bota izquierda
+    left_boot = pygame.Rect(rect.x, rect.y + 4,
+                           rect.width // 2 - 1, rect.height - 4)
+    pygame.draw.rect(surface, boot_color, left_boot, border_radius=3)
+    pygame.draw.rect(surface, sole_color,
+                    (left_boot.x, left_boot.bottom - 3, left_boot.width, 3))
+
+    # Bota derecha
+    right_boot = pygame.Rect(rect.x + rect.width // 2 + 1, rect.y + 4,
+                            rect.width // 2 - 1, rect.height - 4)
+    pygame.draw.rect(surface, boot_color, right_boot, border_radius=3)
+    pygame.draw.rect(surface, sole_color,
+                    (right_boot.x, right_boot.bottom - 3, right_boot.width, 3))
+
+    # Cordones
+    pygame.draw.line(surface, lace_color,
+                    (left_boot.centerx, left_boot.y + 2),
+                    (left_boot.centerx, left_boot.y + 8), 1)
+    pygame.draw.line(surface, lace_color,
+                    (right_boot.centerx, right_boot.y + 2),
+                    (right_boot.centerx, right_boot.y + 8), 1)
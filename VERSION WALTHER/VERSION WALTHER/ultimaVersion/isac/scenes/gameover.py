@@ -1,14 +1,18 @@
 import pygame
 
 from isac.core.scene import Scene
+from isac.core.fonts import fonts
+from isac.core.input import IDLE, InputState
+from isac.core.text import text_cache
+from isac.core.overlays import overlay_cache
 from isac.settings import WIDTH, HEIGHT, WHITE, RED, BLUE
 
 
 class GameOverScene(Scene):
     def __init__(self, game: "Game") -> None:
         super().__init__(game)
-        self.title_font = pygame.font.SysFont(None, 72)
-        self.small_font = pygame.font.SysFont(None, 28)
+        self.title_font = fonts.get(72)
+        self.small_font = fonts.get(28)
         self.blink_time = 0.0
 
         # Fade state
@@ -19,7 +23,7 @@ class GameOverScene(Scene):
         # Start with fade-in
         self._start_fade(out=False, duration=0.25)
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float, inp: InputState = IDLE) -> None:
         self.blink_time += dt
         # Update fade
         if self._fade_dir != 0:
@@ -55,12 +59,12 @@ class GameOverScene(Scene):
         self.game.running = False
 
     def draw(self, surface: pygame.Surface) -> None:
-        title = self.title_font.render("GAME OVER", True, RED)
+        title = text_cache.render(self.title_font, "GAME OVER", RED)
         surface.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 2 - 80))
 
         # Mensajes
-        hint1 = self.small_font.render("Enter/Espacio: Menú", True, WHITE)
-        hint2 = self.small_font.render("R: Reiniciar  |  Esc: Salir", True, BLUE)
+        hint1 = text_cache.render(self.small_font, "Enter/Espacio: Menú", WHITE)
+        hint2 = text_cache.render(self.small_font, "R: Reiniciar  |  Esc: Salir", BLUE)
         surface.blit(hint1, (WIDTH // 2 - hint1.get_width() // 2, HEIGHT // 2))
         # Parpadeo suave del segundo hint
         if int(self.blink_time * 2) % 2 == 0:
@@ -69,11 +73,7 @@ class GameOverScene(Scene):
         # Fade overlay
         if self._fade_dir != 0 or self._fade_alpha > 0:
             alpha = int(self._fade_alpha)
-            if alpha > 0:
-                overlay = pygame.Surface((WIDTH, HEIGHT))
-                overlay.set_alpha(alpha)
-                overlay.fill((0, 0, 0))
-                surface.blit(overlay, (0, 0))
+            overlay_cache.blit(surface, (0, 0), (WIDTH, HEIGHT), (0, 0, 0), alpha)
 
     def _start_fade(self, out: bool, duration: float, on_complete=None) -> None:
         self._fade_dir = -1 if out else 1
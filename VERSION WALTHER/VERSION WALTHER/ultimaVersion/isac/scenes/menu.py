@@ -1,14 +1,17 @@
 import pygame
 
 from isac.core.scene import Scene
+from isac.core.fonts import fonts
+from isac.core.input import IDLE, InputState
+from isac.core.text import text_cache
 from isac.settings import WIDTH, HEIGHT, WHITE, BLUE
 
 
 class MenuScene(Scene):
     def __init__(self, game: "Game") -> None:
         super().__init__(game)
-        self.font = pygame.font.SysFont(None, 48)
-        self.small = pygame.font.SysFont(None, 28)
+        self.font = fonts.get(48)
+        self.small = fonts.get(28)
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -19,11 +22,14 @@ class MenuScene(Scene):
             elif event.key == pygame.K_ESCAPE:
                 self.game.running = False
 
-    def update(self, dt: float) -> None:
-        pass
+    def update(self, dt: float, inp: InputState = IDLE) -> None:
+        # El mezclador se abre con el menú ya en pantalla (no retrasa el
+        # primer frame ni el paso a la partida, que carga los sonidos)
+        if self.game.frames > 0:
+            self.game.init_audio()
 
     def draw(self, surface: pygame.Surface) -> None:
-        title = self.font.render("Isac", True, WHITE)
-        hint = self.small.render("Enter/Espacio: Jugar  |  Esc: Salir", True, BLUE)
+        title = text_cache.render(self.font, "Isac", WHITE)
+        hint = text_cache.render(self.small, "Enter/Espacio: Jugar  |  Esc: Salir", BLUE)
         surface.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 2 - 60))
         surface.blit(hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT // 2 + 10))
@@ -1,5 +1,4 @@
 import os
-import random
 import pygame
 
 from isac.core.scene import Scene
@@ -7,6 +6,7 @@ from isac.settings import (
     WIDTH,
     HEIGHT,
     WHITE,
+    GRAY,
     GREEN,
     RED,
     YELLOW,
@@ -14,6 +14,7 @@ from isac.settings import (
     MAGIC_MAX,
     SHIELD_MAGIC_COST_PER_SEC,
     HUD_HEART_SIZE,
+    INTERP_SNAP_DISTANCE,
     TILE,
     ROOM_PADDING,
     PLAYER_SIZE,
@@ -26,7 +27,6 @@ from isac.settings import (
     PICKUP_SOUND,
     PAUSE_OPEN_SOUND,
     PAUSE_CLOSE_SOUND,
-    ARROW_DAMAGE,
     MELEE_DAMAGE,
     BOMB_DAMAGE,
     LOOT_CHANCE,
@@ -36,28 +36,62 @@ from isac.settings import (
     DIFFICULTY_PRESETS,
     DEFAULT_DIFFICULTY,
     BRUTE_CHARGE_SOUND,
+    KILL_FLASH_POOL_SIZE,
+    DIRTY_RECT_MARGIN,
+    DIRTY_RECT_MAX,
 )
 from isac.entities.player import Player
-from isac.entities.enemy import Enemy
+from isac.entities.enemy_pool import EnemyPool, PooledEnemy
 from isac.entities.pickup import Pickup
 from isac.core.inventory import Inventory
 from isac.core.dungeon import Dungeon
+from isac.core.geometry import geometry_cache
+from isac.core.spatial import SpatialHash
+from isac.core.pathfinding import FlowField
+from isac.core.pool import ObjectPool
+from isac.core.room_render import RoomSurfaceCache
+from isac.core.text import text_cache, DigitAtlas
+from isac.core.input import IDLE, InputState
+from isac.core.rng import RngService, STREAM_SPAWNS, STREAM_LOOT, STREAM_CHESTS, STREAM_COSMETIC
+from isac.core.hud import RetainedLayer
+from isac.core.fonts import fonts
+from isac.core.overlays import overlay_cache
+from isac.core.quality import quality, TIER_FEEDBACK
 from isac.core.persistence import save_game, load_game, save_options, load_options
-from isac.entities.arrow import Arrow
 from isac.entities.chest import Chest
 from isac.entities.speed_boots import SpeedBoots
-from isac.entities.companion import Companion, Spike
+from isac.entities.companion import Companion
 from isac.entities.health_doubler import HealthDoubler
+from isac.entities.kill_flash import KillFlash
+from isac.entities.projectiles import ProjectileSystem, KIND_ARROW, KIND_SPIKE, KIND_BULLET
+
+# Efectos que el gobernador de calidad puede quitar si el frame no cabe
+_KILL_FLASHES = quality.register('play.kill_flashes', TIER_FEEDBACK)
+_SCREEN_SHAKE = quality.register('play.screen_shake', TIER_FEEDBACK)
+
+# Orden de los proyectiles en el tick (el de los antiguos bucles por objeto):
+# las flechas avanzan antes que los enemigos y los pinchos del compañero
+# después, en el mismo tick en que se disparan
+_STEP_BEFORE_ENEMIES = (KIND_ARROW, KIND_BULLET)
+_STEP_AFTER_ENEMIES = (KIND_SPIKE,)
 
 
 class PlayScene(Scene):
     def __init__(self, game: "Game") -> None:
         super().__init__(game)
         self.player = Player(WIDTH // 2, HEIGHT // 2)
-        self.enemies: list[Enemy] = []
-        self.font = pygame.font.SysFont(None, 24)
-        self.big_font = pygame.font.SysFont(None, 32)
+        self.enemies: list[PooledEnemy] = []
+        self.enemy_pool: EnemyPool | None = None  # pool de la sala actual
+        self.font = fonts.get(24)
+        self.big_font = fonts.get(32)
+        # Contadores del HUD (MP y slots) con glifos pre-renderizados
+        self.counter_digits = DigitAtlas(self.font, WHITE)
         self.inventory = Inventory(bombs=1, keys=0, arrows=5)
+        # HUD en dos franjas retenidas: arriba vida, magia y escudo; abajo el inventario
+        self.hud_top = RetainedLayer(pygame.Rect(0, 0, WIDTH, 10 + HUD_HEART_SIZE + 30), self.draw_hud)
+        self.hud_bottom = RetainedLayer(pygame.Rect(0, HEIGHT - 60, WIDTH, 60), self._paint_hud_bottom)
+        self.player.subscribe(self.hud_top.invalidate)
+        self.inventory.subscribe(self.hud_bottom.invalidate)
         self.pickups: list[Pickup] = [
             Pickup('bomb', WIDTH // 3, HEIGHT // 3),
             Pickup('key', WIDTH // 2, HEIGHT // 3),
@@ -65,18 +99,37 @@ class PlayScene(Scene):
             Pickup('arrow', WIDTH // 2, HEIGHT * 2 // 3),
         ]
         self.dungeon = Dungeon()
+        # Aleatoriedad de la partida: flujos con nombre derivados de una semilla
+        # (la de Game si se fijó, si no una nueva por partida)
+        self.rng = RngService(game.seed)
         self.paused = False
         self.pause_options = ["Continuar", "Guardar", "Salir al menú"]
         self.pause_index = 0
-        self._save_path = 'savegame.json'
-        self._options_path = 'options.json'
-        self.arrows: list[Arrow] = []
+        # Los de Game (al reproducir, un directorio temporal)
+        self._save_path = game.save_path
+        self._options_path = game.options_path
+        # Flechas del jugador y pinchos del compañero, en arrays contiguos
+        self.projectiles = ProjectileSystem()
+        # Pool de objetos: el bucle de combate no asigna en régimen estable
+        self.flash_pool: ObjectPool[KillFlash] = ObjectPool(KillFlash, KILL_FLASH_POOL_SIZE, 'kill_flashes')
         self.door_feedback_timer: float = 0.0  # feedback visual al abrir puertas
+        # Capa estática de las salas (paredes, obstáculos y puertas) pre-renderizada
+        self.room_surfaces = RoomSurfaceCache()
+        # Buffer del mundo para el temblor de cámara (se crea al primer temblor)
+        self._world_buffer: pygame.Surface | None = None
+        # Modo de rectángulos sucios: regiones dibujadas en este frame y en el anterior
+        self._dirty: list[pygame.Rect] | None = None
+        self._prev_drawn: list[pygame.Rect] = []
+        self._drawn_room: tuple[int, int] | None = None
+        self._last_full = True
+        # Interpolación de dibujo entre ticks fijos
+        self._interp_prev = self.player.rect.center
+        self._interp_cur = self.player.rect.center
+        self._sim_moved = False
         
         # Sistema de cofres y objetos especiales
         self.chests: list[Chest] = []
         self.special_items: list = []  # SpeedBoots, Companion, HealthDoubler
-        self.companion_spikes: list[Spike] = []
         self.active_companion: Companion = None
         
         # Tracking de items obtenidos
@@ -93,35 +146,37 @@ class PlayScene(Scene):
         self.snd_pause_open = None
         self.snd_pause_close = None
         self.snd_brute_charge = None
-        try:
-            if DOOR_OPEN_SOUND and os.path.exists(DOOR_OPEN_SOUND):
-                self.snd_door_open = pygame.mixer.Sound(DOOR_OPEN_SOUND)
-            if ARROW_HIT_SOUND and os.path.exists(ARROW_HIT_SOUND):
-                self.snd_arrow_hit = pygame.mixer.Sound(ARROW_HIT_SOUND)
-            if ENEMY_DIE_SOUND and os.path.exists(ENEMY_DIE_SOUND):
-                self.snd_enemy_die = pygame.mixer.Sound(ENEMY_DIE_SOUND)
-            if PLAYER_HURT_SOUND and os.path.exists(PLAYER_HURT_SOUND):
-                self.snd_player_hurt = pygame.mixer.Sound(PLAYER_HURT_SOUND)
-            if ARROW_SHOOT_SOUND and os.path.exists(ARROW_SHOOT_SOUND):
-                self.snd_arrow_shoot = pygame.mixer.Sound(ARROW_SHOOT_SOUND)
-            if PICKUP_SOUND and os.path.exists(PICKUP_SOUND):
-                self.snd_pickup = pygame.mixer.Sound(PICKUP_SOUND)
-            if PAUSE_OPEN_SOUND and os.path.exists(PAUSE_OPEN_SOUND):
-                self.snd_pause_open = pygame.mixer.Sound(PAUSE_OPEN_SOUND)
-            if PAUSE_CLOSE_SOUND and os.path.exists(PAUSE_CLOSE_SOUND):
-                self.snd_pause_close = pygame.mixer.Sound(PAUSE_CLOSE_SOUND)
-            if BRUTE_CHARGE_SOUND and os.path.exists(BRUTE_CHARGE_SOUND):
-                self.snd_brute_charge = pygame.mixer.Sound(BRUTE_CHARGE_SOUND)
-        except Exception:
-            self.snd_door_open = None
-            self.snd_arrow_hit = None
-            self.snd_enemy_die = None
-            self.snd_player_hurt = None
-            self.snd_arrow_shoot = None
-            self.snd_pickup = None
-            self.snd_pause_open = None
-            self.snd_pause_close = None
-            self.snd_brute_charge = None
+        # Sin mezclador (headless, sin dispositivo de audio) se juega sin sonido
+        if self.game.init_audio():
+            try:
+                if DOOR_OPEN_SOUND and os.path.exists(DOOR_OPEN_SOUND):
+                    self.snd_door_open = pygame.mixer.Sound(DOOR_OPEN_SOUND)
+                if ARROW_HIT_SOUND and os.path.exists(ARROW_HIT_SOUND):
+                    self.snd_arrow_hit = pygame.mixer.Sound(ARROW_HIT_SOUND)
+                if ENEMY_DIE_SOUND and os.path.exists(ENEMY_DIE_SOUND):
+                    self.snd_enemy_die = pygame.mixer.Sound(ENEMY_DIE_SOUND)
+                if PLAYER_HURT_SOUND and os.path.exists(PLAYER_HURT_SOUND):
+                    self.snd_player_hurt = pygame.mixer.Sound(PLAYER_HURT_SOUND)
+                if ARROW_SHOOT_SOUND and os.path.exists(ARROW_SHOOT_SOUND):
+                    self.snd_arrow_shoot = pygame.mixer.Sound(ARROW_SHOOT_SOUND)
+                if PICKUP_SOUND and os.path.exists(PICKUP_SOUND):
+                    self.snd_pickup = pygame.mixer.Sound(PICKUP_SOUND)
+                if PAUSE_OPEN_SOUND and os.path.exists(PAUSE_OPEN_SOUND):
+                    self.snd_pause_open = pygame.mixer.Sound(PAUSE_OPEN_SOUND)
+                if PAUSE_CLOSE_SOUND and os.path.exists(PAUSE_CLOSE_SOUND):
+                    self.snd_pause_close = pygame.mixer.Sound(PAUSE_CLOSE_SOUND)
+                if BRUTE_CHARGE_SOUND and os.path.exists(BRUTE_CHARGE_SOUND):
+                    self.snd_brute_charge = pygame.mixer.Sound(BRUTE_CHARGE_SOUND)
+            except Exception:
+                self.snd_door_open = None
+                self.snd_arrow_hit = None
+                self.snd_enemy_die = None
+                self.snd_player_hurt = None
+                self.snd_arrow_shoot = None
+                self.snd_pickup = None
+                self.snd_pause_open = None
+                self.snd_pause_close = None
+                self.snd_brute_charge = None
         # ----- Opciones (menú de pausa) -----
         self.in_options: bool = False
         self.options_items = ["Sonido", "Volumen", "Dificultad"]
@@ -137,10 +192,18 @@ class PlayScene(Scene):
             self.sound_enabled = snd
             self.volume = vol
             self.difficulty = diff if diff in DIFFICULTY_PRESETS else DEFAULT_DIFFICULTY
+        # Al grabar o reproducir, la dificultad es la de la grabación
+        if game.difficulty in DIFFICULTY_PRESETS:
+            self.difficulty = game.difficulty
         # Aplicar dificultad
         self._apply_difficulty_presets()
         self._apply_sound_settings()
 
+        # Hash espacial de enemigos (se reconstruye al moverse y al cambiar de sala)
+        self.enemy_hash = SpatialHash()
+        # Campo de flujo hacia el jugador, compartido por los enemigos de la sala
+        self.flow_field = FlowField()
+
         # Inicializar sala actual (tras aplicar dificultad y sonido)
         self._enter_room(initial=True)
 
@@ -157,26 +220,17 @@ class PlayScene(Scene):
         # Cooldown para no reentrar puerta inmediatamente tras mover de sala
         self._door_cooldown: float = 0.0
 
-        # Flashes de muerte de enemigos (lista de tuplas: (rect, tiempo_restante))
-        self.kill_flashes: list[tuple[pygame.Rect, float]] = []
+        # Flashes de muerte de enemigos (reciclados desde flash_pool)
+        self.kill_flashes: list[KillFlash] = []
 
-    def _spawn_enemy(self, x: int, y: int) -> Enemy:
-        # Elegir tipo según pesos
-        r = random.random()
-        accum = 0.0
-        choice_key = next(iter(ENEMY_TYPES))
-        total_w = sum(max(0.0, t.get('weight', 1.0)) for t in ENEMY_TYPES.values())
-        for name, data in ENEMY_TYPES.items():
-            w = max(0.0, data.get('weight', 1.0))
-            accum += w / (total_w if total_w > 0 else 1.0)
-            if r <= accum:
-                choice_key = name
-                break
+    def _spawn_enemy(self, x: int, y: int, kind: str | None = None) -> PooledEnemy:
+        # Elegir tipo según pesos (salvo que se pida uno concreto)
+        choice_key = kind if kind in ENEMY_TYPES else self._pick_enemy_kind()
         cfg = ENEMY_TYPES[choice_key]
         # Aplicar escala de dificultad a HP y velocidad
         hp = int(max(1, round(cfg.get('hp', 2) * self._diff_preset.get('enemy_hp_scale', 1.0))))
         spd = float(cfg.get('speed_scale', 1.0)) * float(self._diff_preset.get('enemy_speed_scale', 1.0))
-        return Enemy(
+        return self.enemy_pool.spawn(
             x,
             y,
             hp=hp,
@@ -185,21 +239,33 @@ class PlayScene(Scene):
             kind=choice_key,
         )
 
+    def _pick_enemy_kind(self) -> str:
+        r = self.rng.stream(STREAM_SPAWNS, self.dungeon.current).random()
+        accum = 0.0
+        total_w = sum(max(0.0, t.get('weight', 1.0)) for t in ENEMY_TYPES.values())
+        for name, data in ENEMY_TYPES.items():
+            w = max(0.0, data.get('weight', 1.0))
+            accum += w / (total_w if total_w > 0 else 1.0)
+            if r <= accum:
+                return name
+        return next(iter(ENEMY_TYPES))
+
     def _enter_room(self, initial: bool = False) -> None:
         room = self.dungeon.get_room()
-        obstacles = room.obstacles()
+        geo = room.geometry()
+        # Los enemigos de cada sala viven en su propio pool (persisten al salir)
+        if room.enemy_pool is None:
+            room.enemy_pool = EnemyPool()
+        self.enemy_pool = room.enemy_pool
+        # Pre-renderizar las salas vecinas para que cruzar una puerta no cueste
+        # un frame: una por frame al dibujar, para que entrar tampoco lo cueste
+        self.room_surfaces.schedule(self.dungeon.rooms.get(p) for p in room.neighbors().values())
 
         # Helper: comprobar espacio libre para un enemigo
         def enemy_place_free(x: int, y: int) -> bool:
             rect = pygame.Rect(0, 0, ENEMY_SIZE, ENEMY_SIZE)
             rect.center = (x, y)
-            for w in room.walls():
-                if rect.colliderect(w):
-                    return False
-            for o in obstacles:
-                if rect.colliderect(o):
-                    return False
-            return True
+            return not geo.grid.collides(rect)
 
         # Buscar celda libre cercana en cuadrícula de TILE
         def nearest_free(x: int, y: int) -> tuple[int, int]:
@@ -223,9 +289,10 @@ class PlayScene(Scene):
             positions: list[tuple[int, int]] = []
             
             # Generar cofre con alta probabilidad (85% de probabilidad)
-            if random.random() < 0.85:
-                chest_x = WIDTH // 2 + random.randint(-120, 120)
-                chest_y = HEIGHT // 2 + random.randint(-100, 100)
+            chest_rng = self.rng.stream(STREAM_CHESTS, room.pos)
+            if chest_rng.random() < 0.85:
+                chest_x = WIDTH // 2 + chest_rng.randint(-120, 120)
+                chest_y = HEIGHT // 2 + chest_rng.randint(-100, 100)
                 if enemy_place_free(chest_x, chest_y):
                     chest = Chest(chest_x, chest_y)
                     room.chests.append(chest)
@@ -242,11 +309,12 @@ class PlayScene(Scene):
         
         # Cargar estado persistente de la sala
         self.enemies = room.enemies.copy() if not room.cleared else []
+        self.enemy_hash.rebuild(self.enemies)
         self.chests = room.chests.copy()
         
         # Solo limpiar items temporales
         self.special_items.clear()
-        self.companion_spikes.clear()
+        self.projectiles.clear(KIND_SPIKE)
         
         # Re-agregar compañero activo si existe y reposicionarlo junto al jugador
         if self.active_companion:
@@ -280,7 +348,7 @@ class PlayScene(Scene):
                         pass
                     elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
                         # Si el usuario quiere abrir opciones, insertamos una entrada virtual
-                        if self.pause_options[self.pause_index] == "Guardar" and pygame.key.get_mods() & pygame.KMOD_SHIFT:
+                        if self.pause_options[self.pause_index] == "Guardar" and getattr(event, 'mod', 0) & pygame.KMOD_SHIFT:
                             # Shift+Enter abre opciones (no bloqueante del flujo normal)
                             self.in_options = True
                         else:
@@ -309,31 +377,10 @@ class PlayScene(Scene):
                     elif event.key == pygame.K_p:
                         self.paused = False
                     return
-            # Ataque melee con J
-            if event.key == pygame.K_j:
-                self.player.start_melee()
-            # Usar bomba con B
-            elif event.key == pygame.K_b:
-                if self.inventory.use_bomb():
-                    # Pequeño "boom" visual (placeholder) dañando enemigos cerca
-                    boom_rect = self.player.rect.inflate(160, 160)
-                    for e in self.enemies:
-                        if e.alive and boom_rect.colliderect(e.rect):
-                            died = e.take_damage(BOMB_DAMAGE)
-                            if died:
-                                if self.snd_enemy_die:
-                                    self.snd_enemy_die.play()
-                                self.shake_time = max(self.shake_time, 0.15)
-                                self.shake_intensity = max(self.shake_intensity, 4)
-                                self._on_enemy_killed(e)
-            # Recoger items al pasar encima (también se recoge automáticamente en update)
-            elif event.key == pygame.K_e:
-                # Intentar recoger y también abrir puerta si hay y tenemos llave
-                self.try_pickup()
-                self.try_unlock_door()
-                self.try_open_chest()
+            # Melee (J), bomba (B), interactuar (E) y flecha (L) llegan a update()
+            # en la InputState del frame
             # Pausa
-            elif event.key == pygame.K_p:
+            if event.key == pygame.K_p:
                 self.paused = not self.paused
                 self.pause_index = 0
                 # Sonidos de pausa
@@ -349,124 +396,116 @@ class PlayScene(Scene):
                 save_game(self._save_path, self.player, self.inventory, self.dungeon)
             elif event.key == pygame.K_F9:
                 load_game(self._save_path, self.player, self.inventory, self.dungeon)
-            # Disparar flecha (arco) con L
-            elif event.key == pygame.K_l:
-                if self.inventory.use_arrow():
-                    dx = dy = 0
-                    if self.player.facing == 'up':
-                        dy = -1
-                    elif self.player.facing == 'down':
-                        dy = 1
-                    elif self.player.facing == 'left':
-                        dx = -1
-                    elif self.player.facing == 'right':
-                        dx = 1
-                    if dx != 0 or dy != 0:
-                        self.arrows.append(Arrow(self.player.rect.centerx, self.player.rect.centery, dx, dy))
-                        if self.snd_arrow_shoot:
-                            self.snd_arrow_shoot.play()
-        elif event.type == pygame.KEYUP:
-            # Soltar escudo cuando se suelta K
-            if event.key == pygame.K_k:
-                self.player.shield = False
-
-    def update(self, dt: float) -> None:
+
+    def _use_bomb(self) -> None:
+        if self.inventory.use_bomb():
+            # Pequeño "boom" visual (placeholder) dañando enemigos cerca
+            boom_rect = self.player.rect.inflate(160, 160)
+            for e in self.enemy_hash.query_rect(boom_rect):
+                if e.alive and boom_rect.colliderect(e.rect):
+                    died = e.take_damage(BOMB_DAMAGE)
+                    if died:
+                        if self.snd_enemy_die:
+                            self.snd_enemy_die.play()
+                        self.shake_time = max(self.shake_time, 0.15)
+                        self.shake_intensity = max(self.shake_intensity, 4)
+                        self._on_enemy_killed(e)
+
+    def _fire_arrow(self) -> None:
+        if self.inventory.use_arrow():
+            dx = dy = 0
+            if self.player.facing == 'up':
+                dy = -1
+            elif self.player.facing == 'down':
+                dy = 1
+            elif self.player.facing == 'left':
+                dx = -1
+            elif self.player.facing == 'right':
+                dx = 1
+            if dx != 0 or dy != 0:
+                self.projectiles.spawn_arrow(self.player.rect.centerx, self.player.rect.centery, dx, dy)
+                if self.snd_arrow_shoot:
+                    self.snd_arrow_shoot.play()
+
+    def update(self, dt: float, inp: InputState = IDLE) -> None:
+        # Estado al empezar el tick, para interpolar al dibujar
+        self._interp_prev = self.player.rect.center
+        self._sim_moved = not self.paused
         if self.paused:
             return
-        keys = pygame.key.get_pressed()
-        self.player.update(dt, [], [])
+        prof = self.game.profiler
+        t = prof.begin()
+        # Acciones pulsadas en este frame (antes de mover, como cuando iban por eventos)
+        if inp.melee:
+            self.player.start_melee()
+        if inp.bomb:
+            self._use_bomb()
+        if inp.interact:
+            # Intentar recoger y también abrir puerta si hay y tenemos llave
+            self.try_pickup()
+            self.try_unlock_door()
+            self.try_open_chest()
+        if inp.fire:
+            self._fire_arrow()
+        self.player.update(dt, [], [], inp)
 
         # Reducir cooldown de puerta
         if self._door_cooldown > 0:
             self._door_cooldown = max(0.0, self._door_cooldown - dt)
 
         # Escudo con K (mantener). Consume magia mientras esté activo
-        if keys[pygame.K_k] and self.player.magic > 0:
+        if inp.shield and self.player.magic > 0:
             self.player.shield = True
             self.player.magic = max(0.0, self.player.magic - SHIELD_MAGIC_COST_PER_SEC * dt)
         else:
             self.player.shield = False
 
-        # Colisiones con paredes de la sala
+        # Colisiones con paredes y obstáculos de la sala (rejilla de ocupación)
         room = self.dungeon.get_room()
-        for wall in room.walls():
-            if self.player.rect.colliderect(wall):
-                self.player.revert_position()
-                break
-        # Colisiones con obstáculos internos
-        for obs in room.obstacles():
-            if self.player.rect.colliderect(obs):
-                self.player.revert_position()
-                break
+        geo = room.geometry()
+        if geo.grid.collides(self.player.rect):
+            self.player.revert_position()
+        prof.end('player', t)
 
         # Recoger objetos automáticamente al pasar encima
+        t = prof.begin()
         self.try_pickup()
         
         # Intentar abrir cofres automáticamente al acercarse
         self.try_open_chest()
+        prof.end('pickups/chests', t)
 
-        # Actualizar flechas y colisiones
-        for a in self.arrows:
-            a.update(dt)
-            # Colisión con paredes
-            for wall in room.walls():
-                if a.rect().colliderect(wall):
-                    a.alive = False
-                    break
-            if not a.alive:
-                continue
-            # Colisión con obstáculos internos
-            for obs in room.obstacles():
-                if a.rect().colliderect(obs):
-                    a.alive = False
-                    if self.snd_arrow_hit:
-                        self.snd_arrow_hit.play()
-                    break
-            if not a.alive:
-                continue
-            # Colisión con enemigos
-            for e in self.enemies:
-                if e.alive and a.rect().colliderect(e.rect):
-                    died = e.take_damage(ARROW_DAMAGE)
-                    if died:
-                        if self.snd_enemy_die:
-                            self.snd_enemy_die.play()
-                        # pequeño temblor al matar enemigo
-                        self.shake_time = max(self.shake_time, 0.15)
-                        self.shake_intensity = max(self.shake_intensity, 4)
-                        # loot drop
-                        self._on_enemy_killed(e)
-                    else:
-                        # golpe no letal: impacto de flecha
-                        if self.snd_arrow_hit:
-                            self.snd_arrow_hit.play()
-                    a.alive = False
-                    break
-            # Fuera de pantalla
-            if a.alive and (a.x < 0 or a.x > WIDTH or a.y < 0 or a.y > HEIGHT):
-                a.alive = False
-        self.arrows = [a for a in self.arrows if a.alive]
+        # Flechas: un paso vectorizado y una pasada de colisiones contra los
+        # enemigos antes de que se muevan (los pinchos van después)
+        t = prof.begin()
+        self._on_projectile_hits(self.projectiles.step(dt, geo.grid, self.enemy_pool, kinds=_STEP_BEFORE_ENEMIES))
+        prof.end('arrows', t)
 
         # Transición por puertas abiertas
         self.handle_doors_transition()
 
-        # Actualizar enemigos
+        # Actualizar enemigos (la sala puede haber cambiado tras la transición)
         room = self.dungeon.get_room()
-        for e in self.enemies:
-            prev_charge_flag = getattr(e, 'charge_just_started', False)
-            e.update(self.player.rect, dt, room.walls(), room.obstacles())
+        geo = room.geometry()
+        t = prof.begin()
+        if self.enemies:
+            self.flow_field.update(geo.grid, self.player.rect.center)
+            # Movimiento de todos los enemigos en un paso vectorizado
+            self.enemy_pool.update(self.player.rect, dt, grid=geo.grid, flow=self.flow_field)
             # SFX: inicio de carga del brute
-            if e.kind == 'brute' and not prev_charge_flag and getattr(e, 'charge_just_started', False):
+            if self.enemy_pool.charges_started():
                 try:
                     if self.snd_brute_charge:
                         self.snd_brute_charge.play()
                 except Exception:
                     pass
+        # Posiciones nuevas: reconstruir hash para melee, contacto y pinchos
+        self.enemy_hash.rebuild(self.enemies)
 
         # Daño a enemigos con melee
         hit = self.player.melee_hitbox()
         if hit:
-            for e in self.enemies:
+            for e in self.enemy_hash.query_rect(hit):
                 if e.alive and hit.colliderect(e.rect):
                     died = e.take_damage(MELEE_DAMAGE)
                     if died:
@@ -477,10 +516,12 @@ class PlayScene(Scene):
                         self._on_enemy_killed(e)
 
         self.enemies = [e for e in self.enemies if e.alive]
+        if len(self.enemies) < len(self.enemy_pool):
+            self.enemy_pool.compact()
 
         # Daño al jugador por contacto con enemigos (si no hay escudo e invuln == 0)
         if self.player.invuln <= 0 and not self.player.shield:
-            for e in self.enemies:
+            for e in self.enemy_hash.query_rect(self.player.rect):
                 if e.alive and self.player.rect.colliderect(e.rect):
                     self.player.take_damage(1)
                     if self.snd_player_hurt:
@@ -489,6 +530,7 @@ class PlayScene(Scene):
                     self.shake_time = max(self.shake_time, 0.25)
                     self.shake_intensity = max(self.shake_intensity, 6)
                     break
+        prof.end('enemies', t)
 
         # Muerte del jugador -> Game Over
         if self.player.hp <= 0:
@@ -536,16 +578,15 @@ class PlayScene(Scene):
 
         # Actualizar flashes
         if self.kill_flashes:
-            updated: list[tuple[pygame.Rect, float]] = []
-            for r, t in self.kill_flashes:
-                nt = max(0.0, t - dt)
-                if nt > 0:
-                    updated.append((r, nt))
-            self.kill_flashes = updated
+            for flash in self.kill_flashes:
+                flash.update(dt)
+            self.flash_pool.sweep(self.kill_flashes)
 
         # Actualizar cofres
+        t = prof.begin()
         for chest in self.chests:
             chest.update(dt)
+        prof.end('pickups/chests', t)
 
         # Actualizar items especiales
         for item in self.special_items:
@@ -556,36 +597,45 @@ class PlayScene(Scene):
                     item.update(dt)
 
         # Actualizar compañero y sus pinchos
+        t = prof.begin()
         if self.active_companion and self.active_companion.active:
             # El compañero busca enemigos y dispara desde su posición junto al jugador
-            target_enemy = self.active_companion.find_nearest_enemy(self.enemies)
+            companion = self.active_companion
+            nearby = self.enemy_hash.query_radius(companion.rect.center, companion.detection_range)
+            target_enemy = companion.find_nearest_enemy(nearby)
             if target_enemy:
-                spikes = self.active_companion.shoot_at_enemy(target_enemy.rect)
-                if spikes:
-                    self.companion_spikes.extend(spikes)
+                self.active_companion.shoot_at_enemy(target_enemy.rect, self.projectiles)
         elif self.active_companion and not self.active_companion.active:
             # Remover compañero cuando se acaba el tiempo
             if self.active_companion in self.special_items:
                 self.special_items.remove(self.active_companion)
             self.active_companion = None
             self.has_companion = False
-
-        # Actualizar pinchos del compañero
-        for spike in self.companion_spikes:
-            spike.update(dt)
-            # Colisión con enemigos
-            for enemy in self.enemies:
-                if enemy.alive and spike.alive and spike.rect().colliderect(enemy.rect):
-                    died = enemy.take_damage(spike.damage)
-                    if died:
-                        if self.snd_enemy_die:
-                            self.snd_enemy_die.play()
-                        self._on_enemy_killed(enemy)
-                    spike.alive = False
-                    break
-
-        # Limpiar pinchos muertos
-        self.companion_spikes = [s for s in self.companion_spikes if s.alive]
+        # Pinchos (también los recién disparados) contra los enemigos ya movidos
+        if self.projectiles.count:
+            self._on_projectile_hits(self.projectiles.step(dt, geo.grid, self.enemy_pool, kinds=_STEP_AFTER_ENEMIES))
+        prof.end('companion', t)
+
+    def _on_projectile_hits(self, hits) -> None:
+        # Obstáculos y enemigos devuelven el impacto (las paredes no suenan)
+        for kind, e, died in hits:
+            if e is None:
+                # Colisión con obstáculos internos
+                if self.snd_arrow_hit:
+                    self.snd_arrow_hit.play()
+            elif died:
+                if self.snd_enemy_die:
+                    self.snd_enemy_die.play()
+                if kind == KIND_ARROW:
+                    # pequeño temblor al matar enemigo
+                    self.shake_time = max(self.shake_time, 0.15)
+                    self.shake_intensity = max(self.shake_intensity, 4)
+                # loot drop
+                self._on_enemy_killed(e)
+            elif kind == KIND_ARROW:
+                # golpe no letal: impacto de flecha
+                if self.snd_arrow_hit:
+                    self.snd_arrow_hit.play()
 
     def _activate_pause_option(self) -> None:
         if not self.in_options:
@@ -638,29 +688,41 @@ class PlayScene(Scene):
     def draw(self, surface: pygame.Surface) -> None:
         # Calcular offset de shake
         ox = oy = 0
-        if self.shake_time > 0 and self.shake_intensity > 0:
-            ox = random.randint(-self.shake_intensity, self.shake_intensity)
-            oy = random.randint(-self.shake_intensity, self.shake_intensity)
-
-        # Dibujar mundo en superficie temporal y aplicar offset
-        world = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        if self.shake_time > 0 and self.shake_intensity > 0 and _SCREEN_SHAKE.enabled:
+            shake_rng = self.rng.stream(STREAM_COSMETIC)
+            ox = shake_rng.randint(-self.shake_intensity, self.shake_intensity)
+            oy = shake_rng.randint(-self.shake_intensity, self.shake_intensity)
+
+        # Sin temblor el mundo se dibuja directamente en pantalla. Con temblor se
+        # dibuja en un buffer persistente del mismo formato que la pantalla y se
+        # copia desplazado (copia opaca, sin mezcla alfa ni asignar por frame)
+        if ox or oy:
+            world = self._get_world_buffer(surface)
+            world.fill(GRAY)
+        else:
+            world = surface
+        # Entidades entre el tick anterior y el actual (fracción del acumulador)
+        lag = self._begin_interpolation()
+        prof = self.game.profiler
+        t = prof.begin()
         # Fondo de sala simple y paredes/puertas
         self.draw_room(world)
+        prof.end('draw_room', t)
 
         # Dibujar flechas
-        for a in self.arrows:
-            a.draw(world)
+        t = prof.begin()
+        self.projectiles.draw(world, KIND_ARROW, lag)
 
         # Dibujar enemigos
         for e in self.enemies:
             e.draw(world)
 
         # Dibujar flashes de muerte sobre el mundo
-        for r, t in self.kill_flashes:
-            alpha = int(220 * (t / 0.15))
-            flash = pygame.Surface((r.width, r.height), pygame.SRCALPHA)
-            flash.fill((255, 255, 255, max(0, alpha)))
-            world.blit(flash, (r.x, r.y))
+        if _KILL_FLASHES.enabled:
+            for kf in self.kill_flashes:
+                r = kf.rect
+                alpha = int(220 * (kf.time / KillFlash.DURATION))
+                overlay_cache.blit(world, r.topleft, r.size, WHITE, alpha)
 
         # Dibujar jugador (parpadeo si invulnerable)
         if int(self.player.invuln * 10) % 2 == 0:
@@ -680,61 +742,122 @@ class PlayScene(Scene):
                 item.draw(world)
 
         # Dibujar pinchos del compañero
-        for spike in self.companion_spikes:
-            spike.draw(world)
+        self.projectiles.draw(world, KIND_SPIKE, lag)
 
         # Blit del mundo con shake
-        surface.blit(world, (ox, oy))
-
-        # HUD de corazones y magia (sin shake)
-        self.draw_hud(surface)
-
-        # Slots de inventario (sin shake)
-        self.draw_inventory_slots(surface)
-
-        # Mostrar estado de inventario (texto simple)
-        inv_text = self.font.render(
-            f"Bombas: {self.inventory.bombs}  Llaves: {self.inventory.keys}  Flechas: {self.inventory.arrows}",
-            True, WHITE,
-        )
-        surface.blit(inv_text, (10, HEIGHT - 30))
+        if world is not surface:
+            surface.blit(world, (ox, oy))
+        prof.end('entities', t)
 
-        # Indicador de escudo
-        if self.player.shield:
-            txt = self.font.render("[ESCUDO]", True, CYAN)
-            surface.blit(txt, (WIDTH - 120, 10))
+        # HUD (sin shake): franjas retenidas, un blit cada una salvo que cambie
+        # el estado. La vida y el inventario las invalidan al notificar; la
+        # magia y el escudo no notifican y van en la clave
+        t = prof.begin()
+        self.hud_top.blit(surface, (int(self.player.magic), self._magic_fill_width(), self.player.shield))
+        self.hud_bottom.blit(surface)
 
         # Indicador visual de puertas abiertas
         if self.door_feedback_timer > 0:
             alpha = int(200 * self.door_feedback_timer)
-            msg = self.big_font.render("¡Puertas abiertas!", True, GREEN)
-            # Crear una superficie con alpha para desvanecer
-            surf = pygame.Surface(msg.get_size(), pygame.SRCALPHA)
-            surf.fill((0, 0, 0, 0))
-            # Pintar el texto en la superficie con alpha manual aplicando multiplicación
-            surf.blit(msg, (0, 0))
+            msg = text_cache.render(self.big_font, "¡Puertas abiertas!", GREEN)
             # Dibujar una banda translúcida detrás
             band_w = msg.get_width() + 24
             band_h = msg.get_height() + 10
-            band = pygame.Surface((band_w, band_h), pygame.SRCALPHA)
-            band.fill((30, 120, 60, max(0, alpha // 2)))
             bx = WIDTH // 2 - band_w // 2
             by = 80
-            surface.blit(band, (bx, by))
-            surface.blit(surf, (WIDTH // 2 - msg.get_width() // 2, by + (band_h - msg.get_height()) // 2))
+            overlay_cache.blit(surface, (bx, by), (band_w, band_h), (30, 120, 60), alpha // 2)
+            surface.blit(msg, (WIDTH // 2 - msg.get_width() // 2, by + (band_h - msg.get_height()) // 2))
+        prof.end('hud', t)
 
         # Indicador de pausa
         if self.paused:
+            t = prof.begin()
             self.draw_pause_menu(surface)
+            prof.end('pause', t)
 
         # Overlay de fade
         if self._fade_dir != 0 or self._fade_alpha > 0:
             alpha = int(self._fade_alpha)
-            if alpha > 0:
-                overlay = pygame.Surface((WIDTH, HEIGHT))
-                overlay.set_alpha(alpha)
-                overlay.fill((0, 0, 0))
-                surface.blit(overlay, (0, 0))
+            overlay_cache.blit(surface, (0, 0), (WIDTH, HEIGHT), (0, 0, 0), alpha)
+
+        if self.game.dirty_rects:
+            self._track_dirty(full=bool(ox or oy), lag=lag)
+        self._end_interpolation()
+
+    def _begin_interpolation(self) -> float:
+        """Mueve jugador y enemigos a su posición interpolada; devuelve el retraso de los proyectiles."""
+        self._interp_cur = self.player.rect.center
+        if not self._sim_moved:
+            return 0.0
+        alpha = self.game.interp_alpha
+        if alpha >= 1.0:
+            return 0.0
+        (px, py), (cx, cy) = self._interp_prev, self._interp_cur
+        if abs(cx - px) <= INTERP_SNAP_DISTANCE and abs(cy - py) <= INTERP_SNAP_DISTANCE:
+            self.player.rect.center = (round(px + (cx - px) * alpha), round(py + (cy - py) * alpha))
+        if self.enemy_pool is not None:
+            self.enemy_pool.interpolate_rects(alpha, INTERP_SNAP_DISTANCE)
+        return (1.0 - alpha) * self.game.sim_dt
+
+    def _end_interpolation(self) -> None:
+        # Devolver los rects a la posición simulada
+        self.player.rect.center = self._interp_cur
+        if self.enemy_pool is not None:
+            self.enemy_pool.sync_rects()
+
+    def dirty_rects(self) -> list[pygame.Rect] | None:
+        return self._dirty
+
+    def _track_dirty(self, full: bool, lag: float = 0.0) -> None:
+        # Lo dibujado este frame más lo del anterior (para borrar donde ya no está).
+        # Temblor, fade, pausa o sala nueva cambian toda la pantalla: volcado
+        # completo en ese frame y en el siguiente (que la devuelve a su sitio)
+        room = self.dungeon.get_room()
+        drawn = self._collect_drawn_rects(room, lag)
+        full = (full or self.paused or self._fade_dir != 0 or self._fade_alpha > 0
+                or room.pos != self._drawn_room)
+        rects = None if full or self._last_full else self._prev_drawn + drawn
+        if rects is not None and len(rects) > DIRTY_RECT_MAX:
+            rects = None
+        self._dirty = rects
+        self._prev_drawn = drawn
+        self._drawn_room = room.pos
+        self._last_full = full
+
+    def _collect_drawn_rects(self, room, lag: float = 0.0) -> list[pygame.Rect]:
+        m = 2 * DIRTY_RECT_MARGIN
+        rects = [
+            # HUD: corazones, magia e indicador de escudo / texto e inventario
+            self.hud_top.rect,
+            self.hud_bottom.rect,
+            # Puertas (cambian de color al abrirse y durante el pulso)
+            *room.geometry().doors.values(),
+            self.player.rect.inflate(m, m),
+        ]
+        if self.door_feedback_timer > 0:
+            rects.append(pygame.Rect(0, 80, WIDTH, 50))
+        # Copias: los rects de enemigos y flashes se actualizan en el sitio
+        rects.extend(e.rect.copy() for e in self.enemies if e.alive)
+        self.projectiles.bounds(rects, lag=lag)
+        rects.extend(kf.rect.copy() for kf in self.kill_flashes)
+        rects.extend(p.rect() for p in self.pickups)
+        rects.extend(chest.rect.inflate(m, m) for chest in self.chests)
+        for item in self.special_items:
+            if hasattr(item, 'rect'):
+                rects.append(item.rect.inflate(m, m))
+            # Círculo de rango del compañero activo
+            if isinstance(item, Companion) and item.active:
+                r = item.detection_range
+                rects.append(pygame.Rect(item.rect.centerx - r, item.rect.centery - r, 2 * r, 2 * r))
+        return rects
+
+    def _get_world_buffer(self, surface: pygame.Surface) -> pygame.Surface:
+        buf = self._world_buffer
+        if buf is None or buf.get_size() != surface.get_size():
+            # Mismo formato de píxel que el destino: el blit es una copia directa
+            buf = pygame.Surface(surface.get_size(), 0, surface)
+            self._world_buffer = buf
+        return buf
 
     # ---- Fade helpers ----
     def _start_fade(self, out: bool, duration: float, on_complete=None) -> None:
@@ -778,6 +901,22 @@ class PlayScene(Scene):
             # Establecer un cooldown breve para no reactivar puerta de inmediato
             self._door_cooldown = 0.25
 
+    def _paint_hud_bottom(self, surface: pygame.Surface) -> None:
+        # Franja inferior: y relativa a HEIGHT - 60
+        # Slots de inventario
+        self.draw_inventory_slots(surface, base_y=2)
+
+        # Mostrar estado de inventario (texto simple)
+        inv_text = text_cache.render(
+            self.font,
+            f"Bombas: {self.inventory.bombs}  Llaves: {self.inventory.keys}  Flechas: {self.inventory.arrows}",
+            WHITE,
+        )
+        surface.blit(inv_text, (10, 30))
+
+    def _magic_fill_width(self, bar_w: int = 160) -> int:
+        return int(bar_w * (self.player.magic / MAGIC_MAX))
+
     def draw_hud(self, surface: pygame.Surface) -> None:
         # Corazones (enteros)
         for i in range(self.player.max_hp):
@@ -791,34 +930,35 @@ class PlayScene(Scene):
         x = 10
         y = 10 + HUD_HEART_SIZE + 6
         pygame.draw.rect(surface, (60, 60, 60), (x, y, bar_w, bar_h), border_radius=3)
-        fill_w = int(bar_w * (self.player.magic / MAGIC_MAX))
+        fill_w = self._magic_fill_width(bar_w)
         pygame.draw.rect(surface, CYAN, (x, y, fill_w, bar_h), border_radius=3)
         # Valor numérico de magia
-        mp_text = self.font.render(f"MP {int(self.player.magic)}/{int(MAGIC_MAX)}", True, WHITE)
-        surface.blit(mp_text, (x + bar_w + 8, y - 2))
+        self.counter_digits.blit(surface, f"MP {int(self.player.magic)}/{int(MAGIC_MAX)}", (x + bar_w + 8, y - 2))
+        # Indicador de escudo
+        if self.player.shield:
+            txt = text_cache.render(self.font, "[ESCUDO]", CYAN)
+            surface.blit(txt, (WIDTH - 120, 10))
 
     def draw_pause_menu(self, surface: pygame.Surface) -> None:
         # Fondo translúcido
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 140))
-        surface.blit(overlay, (0, 0))
+        overlay_cache.blit(surface, (0, 0), (WIDTH, HEIGHT), (0, 0, 0), 140)
         if not self.in_options:
-            title = self.big_font.render("PAUSA", True, YELLOW)
+            title = text_cache.render(self.big_font, "PAUSA", YELLOW)
             surface.blit(title, (WIDTH // 2 - title.get_width() // 2, 120))
             # Menú principal
             base_y = 170
             # Mostramos también hint para abrir opciones con "O"
-            hint = self.font.render("O: Opciones  |  Enter: Seleccionar", True, WHITE)
+            hint = text_cache.render(self.font, "O: Opciones  |  Enter: Seleccionar", WHITE)
             surface.blit(hint, (WIDTH // 2 - hint.get_width() // 2, 150))
             for i, opt in enumerate(self.pause_options):
                 color = WHITE if i != self.pause_index else GREEN
-                txt = self.big_font.render(opt, True, color)
+                txt = text_cache.render(self.big_font, opt, color)
                 surface.blit(txt, (WIDTH // 2 - txt.get_width() // 2, base_y + i * 36))
             # Botón ficticio Opciones al final
-            opt_label = self.big_font.render("Opciones (O)", True, WHITE)
+            opt_label = text_cache.render(self.big_font, "Opciones (O)", WHITE)
             surface.blit(opt_label, (WIDTH // 2 - opt_label.get_width() // 2, base_y + len(self.pause_options) * 36 + 12))
         else:
-            title = self.big_font.render("OPCIONES", True, YELLOW)
+            title = text_cache.render(self.big_font, "OPCIONES", YELLOW)
             surface.blit(title, (WIDTH // 2 - title.get_width() // 2, 120))
             base_y = 170
             # Elementos de opciones
@@ -832,9 +972,9 @@ class PlayScene(Scene):
                     val = self.difficulty
                 else:
                     val = ""
-                label = self.big_font.render(f"{opt}: {val}", True, color)
+                label = text_cache.render(self.big_font, f"{opt}: {val}", color)
                 surface.blit(label, (WIDTH // 2 - label.get_width() // 2, base_y + i * 36))
-            hint = self.font.render("Esc: Volver | ←/→: Ajustar | Enter: Alternar", True, WHITE)
+            hint = text_cache.render(self.font, "Esc: Volver | ←/→: Ajustar | Enter: Alternar", WHITE)
             surface.blit(hint, (WIDTH // 2 - hint.get_width() // 2, base_y + len(self.options_items) * 36 + 12))
 
     def _options_adjust(self, direction: int) -> None:
@@ -900,12 +1040,15 @@ class PlayScene(Scene):
         self._diff_preset = DIFFICULTY_PRESETS.get(self.difficulty, DIFFICULTY_PRESETS[DEFAULT_DIFFICULTY])
         loot_scale = float(self._diff_preset.get('loot_scale', 1.0))
         self._loot_chance = max(0.0, min(1.0, LOOT_CHANCE * loot_scale))
+        # Los obstáculos escalan con la dificultad: invalida la geometría cacheada
+        geometry_cache.set_difficulty(self.difficulty)
 
-    def _on_enemy_killed(self, enemy: Enemy) -> None:
+    def _on_enemy_killed(self, enemy: PooledEnemy) -> None:
         # Probabilidad configurada de botín
-        if random.random() < self._loot_chance:
+        loot_rng = self.rng.stream(STREAM_LOOT, self.dungeon.current)
+        if loot_rng.random() < self._loot_chance:
             # Selección ponderada por LOOT_WEIGHTS
-            r = random.random()
+            r = loot_rng.random()
             accum = 0.0
             kind = 'arrow'
             for k, w in LOOT_WEIGHTS.items():
@@ -916,7 +1059,27 @@ class PlayScene(Scene):
             cx, cy = enemy.rect.center
             self.pickups.append(Pickup(kind, cx, cy))
         # Agregar flash breve (0.15s)
-        self.kill_flashes.append((enemy.rect.copy(), 0.15))
+        self.kill_flashes.append(self.flash_pool.acquire().reset(enemy.rect))
+
+    def profile_counts(self) -> dict[str, int]:
+        return {
+            'enemies': len(self.enemies),
+            'projectiles': len(self.projectiles),
+            'pickups': len(self.pickups),
+        }
+
+    def surface_allocations(self) -> int:
+        # Las franjas del HUD se repintan en el sitio: no crean superficies
+        return self.room_surfaces.renders
+
+    def location(self) -> tuple[int, int]:
+        return tuple(self.dungeon.current)
+
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        """Ocupación de los pools de objetos (para depurar/medir)."""
+        stats = {self.flash_pool.name: self.flash_pool.stats()}
+        stats['projectiles'] = self.projectiles.stats()
+        return stats
 
     def try_pickup(self) -> None:
         remaining: list[Pickup] = []
@@ -942,7 +1105,7 @@ class PlayScene(Scene):
             # Área de detección más grande
             detection_area = chest.rect.inflate(60, 60)
             if not chest.opened and detection_area.colliderect(self.player.rect):
-                item_type = chest.open()
+                item_type = chest.open(self.rng.stream(STREAM_CHESTS, self.dungeon.current))
                 if item_type:
                     # Crear el item correspondiente y aplicar efecto según el tipo
                     if item_type == 'speed_boots':
@@ -986,10 +1149,9 @@ class PlayScene(Scene):
                 break
 
     # ---------- Dungeon helpers ----------
-    def draw_inventory_slots(self, surface: pygame.Surface) -> None:
+    def draw_inventory_slots(self, surface: pygame.Surface, base_y: int = HEIGHT - 58) -> None:
         # Tres slots: Bombas, Llaves y Flechas
         base_x = WIDTH - 240
-        base_y = HEIGHT - 58
         slot_w = 64
         slot_h = 40
         gap = 12
@@ -1001,8 +1163,7 @@ class PlayScene(Scene):
         # Ícono simple de bomba (círculo y mecha)
         pygame.draw.circle(surface, (200, 200, 200), (rect_b.x + 14, rect_b.y + 20), 8)
         pygame.draw.line(surface, (220, 180, 80), (rect_b.x + 20, rect_b.y + 12), (rect_b.x + 28, rect_b.y + 8), 2)
-        txt_b = self.font.render(f"x{self.inventory.bombs}", True, WHITE)
-        surface.blit(txt_b, (rect_b.x + 34, rect_b.y + 10))
+        self.counter_digits.blit(surface, f"x{self.inventory.bombs}", (rect_b.x + 34, rect_b.y + 10))
 
         # Slot Llaves
         rect_k = pygame.Rect(base_x + slot_w + gap, base_y, slot_w, slot_h)
@@ -1012,8 +1173,7 @@ class PlayScene(Scene):
         pygame.draw.circle(surface, (255, 215, 0), (rect_k.x + 14, rect_k.y + 20), 6)
         pygame.draw.rect(surface, (255, 215, 0), (rect_k.x + 20, rect_k.y + 18, 14, 4))
         pygame.draw.rect(surface, (255, 215, 0), (rect_k.x + 30, rect_k.y + 16, 3, 8))
-        txt_k = self.font.render(f"x{self.inventory.keys}", True, WHITE)
-        surface.blit(txt_k, (rect_k.x + 40, rect_k.y + 10))
+        self.counter_digits.blit(surface, f"x{self.inventory.keys}", (rect_k.x + 40, rect_k.y + 10))
 
         # Slot Flechas
         rect_a = pygame.Rect(base_x + (slot_w + gap) * 2, base_y, slot_w, slot_h)
@@ -1022,33 +1182,13 @@ class PlayScene(Scene):
         # Ícono simple de flecha
         pygame.draw.line(surface, (200, 200, 200), (rect_a.x + 10, rect_a.y + 28), (rect_a.x + 28, rect_a.y + 12), 2)
         pygame.draw.polygon(surface, (200, 200, 200), [(rect_a.x + 30, rect_a.y + 10), (rect_a.x + 22, rect_a.y + 14), (rect_a.x + 26, rect_a.y + 6)])
-        txt_a = self.font.render(f"x{self.inventory.arrows}", True, WHITE)
-        surface.blit(txt_a, (rect_a.x + 40, rect_a.y + 10))
+        self.counter_digits.blit(surface, f"x{self.inventory.arrows}", (rect_a.x + 40, rect_a.y + 10))
     def draw_room(self, surface: pygame.Surface) -> None:
+        # Paredes, obstáculos y puertas pre-renderizados: un solo blit
         room = self.dungeon.get_room()
-        # paredes
-        for wall in room.walls():
-            pygame.draw.rect(surface, (90, 90, 90), wall)
-        # obstáculos internos
-        for obs in room.obstacles():
-            pygame.draw.rect(surface, (110, 110, 110), obs)
-        # puertas
-        for d in ('up', 'down', 'left', 'right'):
-            door_rect = room.door_rect(d)
-            door = room.doors[d]
-            # Color base por estado
-            base_color = (80, 200, 120) if door.open else ((200, 160, 40) if door.locked else (160, 160, 160))
-            color = base_color
-            # Pulso de color cuando se acaban de abrir
-            if door.open and self.door_feedback_timer > 0:
-                # Intensidad de 0..1
-                t = self.door_feedback_timer
-                intensity = t  # lineal simple
-                r = min(255, int(base_color[0] + 60 * intensity))
-                g = min(255, int(base_color[1] + 40 * intensity))
-                b = min(255, int(base_color[2] + 40 * intensity))
-                color = (r, g, b)
-            pygame.draw.rect(surface, color, door_rect)
+        surface.blit(self.room_surfaces.get(room, self.door_feedback_timer), (0, 0))
+        # Como mucho una sala vecina pendiente por frame
+        self.room_surfaces.warm_pending(1)
 
     def handle_doors_transition(self) -> None:
         room = self.dungeon.get_room()
@@ -0,0 +1,266 @@
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from isac.core.input import IDLE, InputState
+from isac.core.profiler import FrameTiming
+from isac.core.text import text_cache
+from isac.entities.chest import Chest
+from isac.entities.pickup import Pickup
+from isac.entities.projectiles import KIND_ARROW, KIND_SPIKE
+from isac.settings import (
+    ENEMY_TYPES, ENEMY_SIZE, TILE, WIDTH, HEIGHT, FPS, YELLOW,
+    STRESS_SETTLE_FRAMES, STRESS_MEASURE_FRAMES, STRESS_GROWTH, STRESS_RAMP_START, STRESS_RAMP_MAX,
+)
+from .play import PlayScene
+
+# Subsistemas en el orden en que se suben en la rampa
+SUBSYSTEMS = ('enemies', 'arrows', 'spikes', 'pickups', 'chests')
+UNITS = {'enemies': 'por tipo', 'arrows': '/s', 'spikes': '/s', 'pickups': '', 'chests': ''}
+
+_PICKUP_KINDS = ('arrow', 'magic', 'key', 'bomb')
+_ARROW_DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_STREAM = 'stress'
+_MIN_PLAYER_DISTANCE = 150  # lejos del jugador: ni recoge pickups ni abre cofres
+_PLACE_TRIES = 30
+
+
+@dataclass
+class StressConfig:
+    """Carga de la escena de estrés.
+
+    Sin ramp la carga es fija. Con ramp cada subsistema sube por turnos desde
+    STRESS_RAMP_START hasta que el frame pasa de budget_ms; mientras, los
+    demás se quedan en estos valores.
+    """
+    enemies_per_kind: int = 0
+    arrows_per_sec: float = 0.0
+    spikes_per_sec: float = 0.0
+    pickups: int = 0
+    chests: int = 0
+    ramp: bool = False
+    budget_ms: float = 1000.0 / FPS
+
+
+class StressScene(PlayScene):
+    """PlayScene con entidades a demanda para medir hasta dónde escala el juego.
+
+    Mantiene N enemigos de cada tipo, dispara M flechas y pinchos por segundo
+    y repone K pickups y cofres. El jugador no puede morir. Con rampa mide el
+    tiempo de frame de cada nivel (ganchos de Game) y deja en report el
+    máximo sostenible de cada subsistema; al terminar cierra el juego.
+    """
+
+    def __init__(self, game: "Game", config: Optional[StressConfig] = None) -> None:
+        super().__init__(game)
+        self.config = config if config is not None else StressConfig()
+        c = self.config
+        self.base: Dict[str, float] = {
+            'enemies': c.enemies_per_kind,
+            'arrows': c.arrows_per_sec,
+            'spikes': c.spikes_per_sec,
+            'pickups': c.pickups,
+            'chests': c.chests,
+        }
+        self.levels = dict(self.base)
+        self._stress_rng = self.rng.stream(_STREAM)
+        self._spawn_debt = {'arrows': 0.0, 'spikes': 0.0}
+        self._arrow_dir = 0
+        # Rampa
+        self.report: Dict[str, Dict] = {}
+        self.finished = False
+        self._stage = 0
+        self._frame = 0
+        self._samples: List[float] = []
+        self._peak_live = 0
+        self._last_ok: Optional[Dict] = None
+        if c.ramp:
+            self.levels[SUBSYSTEMS[0]] = STRESS_RAMP_START[SUBSYSTEMS[0]]
+
+    def start(self) -> None:
+        super().start()
+        self.game.on_frame_end(self._on_frame)
+
+    def stop(self) -> None:
+        self.game.remove_frame_hook(self._on_frame)
+        super().stop()
+
+    def update(self, dt: float, inp: InputState = IDLE) -> None:
+        if not self.paused:
+            player = self.player
+            if player.hp < player.max_hp:
+                player.hp = player.max_hp
+                player.notify_changed()
+            self._top_up(dt)
+        super().update(dt, inp)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        super().draw(surface)
+        if self.config.ramp and not self.finished:
+            name = SUBSYSTEMS[self._stage]
+            text = f"estrés: {name} {self.levels[name]:g} {UNITS[name]}"
+        else:
+            text = "estrés: " + "  ".join(f"{name} {self.levels[name]:g}" for name in SUBSYSTEMS)
+        label = text_cache.render(self.font, text, YELLOW)
+        surface.blit(label, (WIDTH // 2 - label.get_width() // 2, 8))
+
+    def dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        # Se vuelca la pantalla entera: es lo que más cuesta y así se mide
+        return None
+
+    # ---- Carga ----
+    def _free_spot(self, grid, size: int) -> Optional[Tuple[int, int]]:
+        rng = self._stress_rng
+        probe = pygame.Rect(0, 0, size, size)
+        px, py = self.player.rect.center
+        for _ in range(_PLACE_TRIES):
+            x, y = rng.randint(TILE * 2, WIDTH - TILE * 2), rng.randint(TILE * 2, HEIGHT - TILE * 2)
+            if math.hypot(x - px, y - py) < _MIN_PLAYER_DISTANCE:
+                continue
+            probe.center = (x, y)
+            if not grid.collides(probe):
+                return x, y
+        return None
+
+    def _top_up(self, dt: float) -> None:
+        grid = self.dungeon.get_room().geometry().grid
+        levels = self.levels
+        # Enemigos: reponer los muertos de cada tipo
+        per_kind = int(levels['enemies'])
+        if len(self.enemies) < per_kind * len(ENEMY_TYPES):
+            have = Counter(e.kind for e in self.enemies)
+            for kind in ENEMY_TYPES:
+                for _ in range(per_kind - have[kind]):
+                    pos = self._free_spot(grid, ENEMY_SIZE)
+                    if pos is None:
+                        break
+                    self.enemies.append(self._spawn_enemy(pos[0], pos[1], kind=kind))
+        # Flechas desde el jugador (en las cuatro direcciones) y pinchos hacia enemigos
+        debt = self._spawn_debt
+        debt['arrows'] += levels['arrows'] * dt
+        cx, cy = self.player.rect.center
+        while debt['arrows'] >= 1.0:
+            debt['arrows'] -= 1.0
+            dx, dy = _ARROW_DIRS[self._arrow_dir]
+            self._arrow_dir = (self._arrow_dir + 1) % len(_ARROW_DIRS)
+            self.projectiles.spawn_arrow(cx, cy, dx, dy)
+        debt['spikes'] += levels['spikes'] * dt
+        while debt['spikes'] >= 1.0:
+            debt['spikes'] -= 1.0
+            pos = self._free_spot(grid, 8)
+            if pos is None:
+                break
+            target = self._stress_rng.choice(self.enemies).rect.center if self.enemies else (cx, cy)
+            self.projectiles.spawn_spike(pos[0], pos[1], target[0], target[1])
+        # Pickups y cofres presentes (los abiertos cuentan)
+        while len(self.pickups) < levels['pickups']:
+            pos = self._free_spot(grid, 20)
+            if pos is None:
+                break
+            self.pickups.append(Pickup(_PICKUP_KINDS[len(self.pickups) % len(_PICKUP_KINDS)], pos[0], pos[1]))
+        while len(self.chests) < levels['chests']:
+            pos = self._free_spot(grid, TILE)
+            if pos is None:
+                break
+            self.chests.append(Chest(pos[0] - TILE // 2, pos[1] - TILE // 2))
+
+    def _trim(self, name: str) -> None:
+        """Vuelve un subsistema a su carga base tras su turno en la rampa."""
+        base = int(self.base[name])
+        if name == 'enemies':
+            have: Counter = Counter()
+            for e in self.enemies:
+                have[e.kind] += 1
+                if have[e.kind] > base:
+                    e.alive = False  # update() los quita y compacta el pool
+            self.enemies = [e for e in self.enemies if e.alive]
+        elif name == 'arrows':
+            self.projectiles.clear(KIND_ARROW)
+        elif name == 'spikes':
+            self.projectiles.clear(KIND_SPIKE)
+        elif name == 'pickups':
+            del self.pickups[base:]
+        elif name == 'chests':
+            del self.chests[base:]
+
+    def _live(self, name: str) -> int:
+        if name == 'enemies':
+            return len(self.enemies)
+        if name == 'arrows':
+            return self.projectiles.count_of(KIND_ARROW)
+        if name == 'spikes':
+            return self.projectiles.count_of(KIND_SPIKE)
+        return len(self.pickups) if name == 'pickups' else len(self.chests)
+
+    # ---- Rampa ----
+    def _on_frame(self, game: "Game", timing: FrameTiming) -> None:
+        if not self.config.ramp or self.finished or game.scene is not self:
+            return
+        self._frame += 1
+        if self._frame <= STRESS_SETTLE_FRAMES:
+            return
+        name = SUBSYSTEMS[self._stage]
+        self._samples.append(timing.work)
+        self._peak_live = max(self._peak_live, self._live(name))
+        if len(self._samples) < STRESS_MEASURE_FRAMES:
+            return
+        samples = self._samples
+        result = {
+            'level': self.levels[name],
+            'live': self._peak_live,
+            'mean_ms': round(sum(samples) * 1000.0 / len(samples), 3),
+            'max_ms': round(max(samples) * 1000.0, 3),
+        }
+        self._samples = []
+        self._frame = 0
+        self._peak_live = 0
+        if result['mean_ms'] > self.config.budget_ms:
+            self._finish_stage(name, result)
+            return
+        self._last_ok = result
+        level = math.ceil(self.levels[name] * STRESS_GROWTH)
+        if level > STRESS_RAMP_MAX[name]:
+            self._finish_stage(name, None)
+        else:
+            self.levels[name] = level
+
+    def _finish_stage(self, name: str, over: Optional[Dict]) -> None:
+        ok = self._last_ok
+        self.report[name] = {
+            'max_level': ok['level'] if ok else None,  # None: ni el nivel inicial cabe
+            'live': ok['live'] if ok else None,
+            'mean_ms': ok['mean_ms'] if ok else None,
+            'max_ms': ok['max_ms'] if ok else None,
+            'over_budget_level': over['level'] if over else None,  # None: se llegó al tope
+            'over_budget_ms': over['mean_ms'] if over else None,
+        }
+        self._last_ok = None
+        self.levels[name] = self.base[name]
+        self._trim(name)
+        self._stage += 1
+        if self._stage >= len(SUBSYSTEMS):
+            self.finished = True
+            self.game.running = False
+        else:
+            following = SUBSYSTEMS[self._stage]
+            self.levels[following] = STRESS_RAMP_START[following]
+
+
+def format_report(report: Dict[str, Dict], budget_ms: float) -> str:
+    lines = [f"Máximo sostenible por subsistema (presupuesto {budget_ms:.1f} ms de frame):"]
+    for name in SUBSYSTEMS:
+        r = report.get(name)
+        if r is None:
+            continue
+        if r['max_level'] is None:
+            line = f"  {name:<8} ni el nivel inicial ({r['over_budget_level']:g}) cabe: {r['over_budget_ms']:.2f} ms"
+        else:
+            line = (f"  {name:<8} {r['max_level']:g} {UNITS[name]:<8} ({r['live']} vivos, "
+                    f"{r['mean_ms']:.2f} ms de media, máx {r['max_ms']:.2f})")
+            if r['over_budget_level'] is None:
+                line += "  [tope de la rampa]"
+        lines.append(line)
+    return "\n".join(lines)
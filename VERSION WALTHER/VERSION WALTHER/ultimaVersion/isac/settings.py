@@ -75,9 +75,13 @@ ENEMY_SPEED = 140
 PLAYER_SIZE = 40
 ENEMY_SIZE = 36
 BULLET_RADIUS = 6
+BULLET_TTL = 1.2
 ARROW_SPEED = 520
 ARROW_SIZE = 8
 ARROW_DAMAGE = 1
+SPIKE_SPEED = 200.0  # pinchos del compañero
+SPIKE_SIZE = 6
+SPIKE_DAMAGE = 0.5
 
 PLAYER_MAX_HP = 3
 PLAYER_INVULN_TIME = 1.0  # segundos tras recibir daño
@@ -96,6 +100,62 @@ HUD_HEART_SIZE = 16
 TILE = 32
 ROOM_PADDING = 48  # margen interior donde situamos paredes
 
+# Capacidad inicial de los pools de objetos reutilizables
+PROJECTILE_CAPACITY = 64
+KILL_FLASH_POOL_SIZE = 16
+
+# Salas pre-renderizadas que se guardan a la vez (la actual y sus vecinas)
+ROOM_SURFACE_CACHE_SIZE = 9
+
+# Modo de rectángulos sucios: solo se vuelcan a pantalla las regiones que cambian
+DIRTY_RECTS = False
+DIRTY_RECT_MARGIN = 24  # margen alrededor de entidades con efectos (llamas, brillos)
+DIRTY_RECT_MAX = 96     # con más regiones se vuelca la pantalla entera
+
+# Cubetas por periodo de animación al hornear sprites (pulso del corazón, etc.)
+SPRITE_PHASE_BUCKETS = 64
+
+# Textos renderizados que se guardan (LRU)
+TEXT_CACHE_SIZE = 256
+
+# Simulación a paso fijo (independiente del refresco de pantalla)
+SIM_HZ = 120
+SIM_MAX_STEPS = 8        # ticks por frame como máximo (evita la espiral de la muerte)
+MAX_FRAME_TIME = 0.25    # un tirón más largo se simula como 0.25 s
+INTERP_SNAP_DISTANCE = 48  # saltos mayores (cambio de sala) se dibujan sin interpolar
+
+# Perfilador en pantalla (F3)
+PROFILER_HISTORY = 120   # frames en la gráfica de tiempos
+PROFILER_REFRESH = 0.25  # s entre refrescos del texto
+
+# Telemetría de rendimiento (--telemetry)
+TELEMETRY_MAX_BYTES = 8 * 1024 * 1024  # tamaño al que se rota el fichero
+TELEMETRY_BACKUPS = 3                  # ficheros rotados que se conservan (.1, .2, ...)
+TELEMETRY_FLUSH_INTERVAL = 1.0         # s máximos entre escrituras a disco
+TELEMETRY_RSS_INTERVAL = 0.5           # s entre lecturas de la memoria residente
+TELEMETRY_QUEUE_MAX = 10000            # registros en cola; si el disco no da abasto se descartan
+
+# Escena de estrés (--stress): rampa de entidades hasta pasar el presupuesto de frame
+STRESS_SETTLE_FRAMES = 60    # frames tras cada subida antes de medir (régimen estable)
+STRESS_MEASURE_FRAMES = 120  # frames medidos por nivel
+STRESS_GROWTH = 1.5          # factor de subida entre niveles
+# Nivel inicial y tope de cada subsistema en la rampa (enemigos por tipo,
+# flechas y pinchos por segundo, pickups y cofres presentes)
+STRESS_RAMP_START = {'enemies': 2, 'arrows': 10, 'spikes': 10, 'pickups': 10, 'chests': 4}
+STRESS_RAMP_MAX = {'enemies': 2000, 'arrows': 20000, 'spikes': 20000, 'pickups': 20000, 'chests': 5000}
+
+# Calidad adaptativa: quitar efectos decorativos si el frame no cabe en el presupuesto
+QUALITY_ADAPTIVE = True
+QUALITY_BUDGET_MS = 1000.0 / FPS
+QUALITY_WINDOW_FRAMES = 30       # frames por medida (media de tiempo de trabajo)
+QUALITY_RESTORE_RATIO = 0.6      # recuperar un nivel solo por debajo del 60 % del presupuesto...
+QUALITY_RESTORE_WINDOWS = 4      # ...durante tantas ventanas seguidas
+QUALITY_RESTORE_MAX_WINDOWS = 32  # tope de la espera si al recuperar se vuelve a pasar
+
+# Hash espacial para entidades dinámicas: celdas de 2 tiles (>= ENEMY_SIZE),
+# así un enemigo ocupa como mucho 2x2 celdas.
+SPATIAL_CELL_SIZE = 2 * TILE
+
 # Diseño de sala / obstáculos (parametrizable)
 # Densidad en rango [0.0 .. 1.0], ancho del pasillo central en tiles, y máximo de obstáculos por sala.
 OBSTACLE_DENSITY = 0.12
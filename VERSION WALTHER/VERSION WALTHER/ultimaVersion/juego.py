@@ -1,7 +1,116 @@
-import pygame
-from isac.core.game import Game
-from isac.scenes.menu import MenuScene
-
-if __name__ == "__main__":
-    Game(MenuScene).run()
-    
\ No newline at end of file
+import argparse
+import json
+import time
+from functools import partial
+from typing import Optional
+
+import pygame
+from isac.core.game import Game
+from isac.core.replay import Replay
+from isac.core.telemetry import FORMATS, TelemetrySink
+from isac.scenes.menu import MenuScene
+from isac.scenes.stress import StressConfig, StressScene, format_report
+from isac.settings import FPS
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Isac")
+    parser.add_argument("--headless", action="store_true",
+                        help="sin ventana ni audio; empieza en partida y simula sin límite de FPS")
+    parser.add_argument("--no-draw", action="store_true", help="no dibujar (solo simulación)")
+    parser.add_argument("--frames", type=int, default=None, help="terminar tras N frames")
+    parser.add_argument("--seed", type=int, default=None, help="semilla de la partida (reproducible)")
+    parser.add_argument("--no-adaptive-quality", action="store_true",
+                        help="no quitar efectos decorativos cuando el frame no cabe en el presupuesto")
+    parser.add_argument("--record", metavar="FICHERO", default=None,
+                        help="grabar la entrada de la partida en un fichero de repetición")
+    parser.add_argument("--replay", metavar="FICHERO", default=None,
+                        help="reproducir una grabación (sin límite de FPS)")
+    parser.add_argument("--telemetry", metavar="FICHERO", default=None,
+                        help="guardar tiempos por frame, sala, entidades, GC y memoria")
+    parser.add_argument("--telemetry-format", choices=FORMATS, default="jsonl",
+                        help="formato del fichero de telemetría")
+    parser.add_argument("--telemetry-per-second", action="store_true",
+                        help="un registro agregado por segundo en vez de uno por frame")
+    stress = parser.add_argument_group("estrés", "escena de partida con entidades a demanda")
+    stress.add_argument("--stress", action="store_true", help="empezar en la escena de estrés")
+    stress.add_argument("--stress-enemies", type=int, default=0, metavar="N", help="enemigos de cada tipo")
+    stress.add_argument("--stress-arrows", type=float, default=0.0, metavar="M", help="flechas por segundo")
+    stress.add_argument("--stress-spikes", type=float, default=0.0, metavar="M", help="pinchos por segundo")
+    stress.add_argument("--stress-pickups", type=int, default=0, metavar="K", help="pickups en la sala")
+    stress.add_argument("--stress-chests", type=int, default=0, metavar="K", help="cofres en la sala")
+    stress.add_argument("--stress-ramp", action="store_true",
+                        help="subir cada subsistema hasta pasar el presupuesto e informar del máximo")
+    stress.add_argument("--stress-budget", type=float, default=1000.0 / FPS, metavar="MS",
+                        help="presupuesto de frame en ms (por defecto el de FPS)")
+    stress.add_argument("--stress-out", metavar="FICHERO", default=None, help="guardar el informe en JSON")
+    return parser.parse_args()
+
+
+def attach_telemetry(game: Game, args: argparse.Namespace) -> Optional[TelemetrySink]:
+    if not args.telemetry:
+        return None
+    return TelemetrySink(game, args.telemetry, fmt=args.telemetry_format, per_second=args.telemetry_per_second)
+
+
+def stress_config(args: argparse.Namespace) -> StressConfig:
+    return StressConfig(
+        enemies_per_kind=args.stress_enemies,
+        arrows_per_sec=args.stress_arrows,
+        spikes_per_sec=args.stress_spikes,
+        pickups=args.stress_pickups,
+        chests=args.stress_chests,
+        ramp=args.stress_ramp,
+        budget_ms=args.stress_budget,
+    )
+
+
+def report_stress(scene: StressScene, args: argparse.Namespace) -> None:
+    if not scene.report:
+        return
+    print(format_report(scene.report, scene.config.budget_ms))
+    if args.stress_out:
+        with open(args.stress_out, 'w', encoding='utf-8') as f:
+            json.dump({'budget_ms': scene.config.budget_ms, 'subsystems': scene.report}, f, indent=2)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    replay = Replay.load(args.replay) if args.replay else None
+    if args.stress:
+        game = Game(partial(StressScene, config=stress_config(args)), headless=args.headless,
+                    render=not args.no_draw, seed=args.seed, adaptive_quality=False)
+        scene = game.scene
+        telemetry = attach_telemetry(game, args)
+        try:
+            game.run(max_frames=args.frames)
+        finally:
+            if telemetry is not None:
+                telemetry.close()
+        report_stress(scene, args)
+    elif args.headless or replay is not None or args.record:
+        # Grabaciones y repeticiones empiezan directamente en la partida
+        from isac.scenes.play import PlayScene
+        game = Game(PlayScene, headless=args.headless, render=not args.no_draw, seed=args.seed,
+                    record_path=args.record, replay=replay,
+                    adaptive_quality=False if args.no_adaptive_quality else None)
+        telemetry = attach_telemetry(game, args)
+        t0 = time.perf_counter()
+        try:
+            game.run(max_frames=args.frames)
+        finally:
+            if telemetry is not None:
+                telemetry.close()
+        elapsed = time.perf_counter() - t0
+        if args.headless or replay is not None:
+            print(f"{game.frames} frames, {game.ticks} ticks en {elapsed:.2f} s "
+                  f"({game.ticks / max(elapsed, 1e-9):.0f} ticks/s)")
+    else:
+        game = Game(MenuScene, render=not args.no_draw, seed=args.seed,
+                    adaptive_quality=False if args.no_adaptive_quality else None)
+        telemetry = attach_telemetry(game, args)
+        try:
+            game.run(max_frames=args.frames)
+        finally:
+            if telemetry is not None:
+                telemetry.close()
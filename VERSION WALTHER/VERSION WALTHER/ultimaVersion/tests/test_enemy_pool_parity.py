@@ -1,9 +1,27 @@
-import pygame
+"""Paridad de EnemyPool con el Enemy por objeto al que sustituyó.
+
+ReferenceEnemy es la clase original; se avanzan los dos lado a lado en salas
+con obstáculos, campo de flujo y golpes al azar y se comparan rects, vida y
+el inicio de las embestidas en cada tick.
+"""
 import math
-from isac.settings import RED, ENEMY_SPEED, ENEMY_SIZE, ENEMY_DEFAULT_HP
+import random
+
+import pygame
+import pytest
+
+from isac.core.pathfinding import FlowField
+from isac.core.room import Room
+from isac.entities.enemy_pool import EnemyPool
+from isac.settings import RED, ENEMY_SPEED, ENEMY_SIZE, ENEMY_DEFAULT_HP, ENEMY_TYPES, WIDTH, HEIGHT
 
+DT = 1.0 / 120
+TICKS = 600
+
+
+class ReferenceEnemy:
+    """El Enemy por objeto de antes de EnemyPool, tal cual (sin draw)."""
 
-class Enemy:
     def __init__(self, x: int, y: int, hp: int | None = None, speed_scale: float = 1.0, color: tuple[int, int, int] | None = None, kind: str = 'grunt'):
         self.rect = pygame.Rect(0, 0, ENEMY_SIZE, ENEMY_SIZE)
         self.rect.center = (x, y)
@@ -36,7 +54,15 @@ class Enemy:
             return True
         return False
 
-    def update(self, player_rect: pygame.Rect, dt: float, walls: list = None, obstacles: list = None):
+    def _blocked(self, rect: pygame.Rect, walls: list, obstacles: list, grid) -> bool:
+        """Colisión contra la geometría estática: rejilla si existe, listas si no."""
+        if grid is not None:
+            return grid.collides(rect)
+        if walls and rect.collidelist(walls) != -1:
+            return True
+        return bool(obstacles) and rect.collidelist(obstacles) != -1
+
+    def update(self, player_rect: pygame.Rect, dt: float, walls: list = None, obstacles: list = None, grid=None, flow=None):
         if not self.alive:
             return
         # reset de bandera de inicio de carga
@@ -54,7 +80,12 @@ class Enemy:
         to_player = pygame.Vector2(player_rect.centerx - self.rect.centerx,
                                    player_rect.centery - self.rect.centery)
         base_speed = ENEMY_SPEED * self.speed_scale
-        if to_player.length_squared() > 0:
+        # Con campo de flujo se sigue el camino alrededor de los obstáculos;
+        # sin él (o ya junto al jugador) se va en línea recta
+        flow_dir = flow.direction_at(self.rect.center) if flow is not None else None
+        if flow_dir is not None:
+            dir_vec = pygame.Vector2(flow_dir)
+        elif to_player.length_squared() > 0:
             dir_vec = to_player.normalize()
         else:
             dir_vec = pygame.Vector2(0, 0)
@@ -88,31 +119,15 @@ class Enemy:
         self.rect.x += int(vx * dt)
         self.rect.y += int(vy * dt)
         
-        # Verificar colisiones y aplicar navegación inteligente
-        collision_detected = False
-        
-        # Verificar colisiones con paredes
-        if walls:
-            for wall in walls:
-                if self.rect.colliderect(wall):
-                    collision_detected = True
-                    break
-        
-        # Verificar colisiones con obstáculos
-        if not collision_detected and obstacles:
-            for obstacle in obstacles:
-                if self.rect.colliderect(obstacle):
-                    collision_detected = True
-                    break
-        
-        if collision_detected:
+        # Verificar colisiones (paredes y obstáculos) y aplicar navegación inteligente
+        if self._blocked(self.rect, walls, obstacles, grid):
             # Revertir posición
             self.rect.x, self.rect.y = prev_x, prev_y
             
             # Intentar navegación alternativa
-            self._navigate_around_obstacle(prev_x, prev_y, vx, vy, dt, walls, obstacles)
+            self._navigate_around_obstacle(prev_x, prev_y, vx, vy, dt, walls, obstacles, grid)
 
-    def _navigate_around_obstacle(self, prev_x: int, prev_y: int, vx: float, vy: float, dt: float, walls: list, obstacles: list):
+    def _navigate_around_obstacle(self, prev_x: int, prev_y: int, vx: float, vy: float, dt: float, walls: list, obstacles: list, grid=None):
         """Intenta encontrar una ruta alternativa alrededor del obstáculo"""
         # Direcciones alternativas para probar (perpendiculares y diagonales)
         alternative_dirs = [
@@ -140,37 +155,56 @@ class Enemy:
             # Crear rect temporal para probar colisión
             test_rect = pygame.Rect(test_x, test_y, self.rect.width, self.rect.height)
             
-            # Verificar si esta posición es válida
-            collision_found = False
-            
-            if walls:
-                for wall in walls:
-                    if test_rect.colliderect(wall):
-                        collision_found = True
-                        break
-            
-            if not collision_found and obstacles:
-                for obstacle in obstacles:
-                    if test_rect.colliderect(obstacle):
-                        collision_found = True
-                        break
-            
             # Si no hay colisión, usar esta dirección
-            if not collision_found:
+            if not self._blocked(test_rect, walls, obstacles, grid):
                 self.rect.x = test_x
                 self.rect.y = test_y
                 return
         
         # Si ninguna dirección funciona, quedarse quieto (pero esto es raro)
 
-    def draw(self, surface: pygame.Surface):
-        if self.alive:
-            # Color base y flash blanco si recientemente herido
-            color = self.color
-            # Parpadeo blanco cuando está herido (prioridad máxima)
-            if self.hurt_timer > 0 and int(self.hurt_timer * 15) % 2 == 0:
-                color = (255, 255, 255)  # Blanco puro
-            # Telegraph: brute en carga se tiñe anaranjado (solo si no está herido)
-            elif self.kind == 'brute' and self._charge_time > 0:
-                color = (255, 200, 80)
-            pygame.draw.rect(surface, color, self.rect)
+
+def _free_positions(grid, count, rng):
+    probe = pygame.Rect(0, 0, ENEMY_SIZE, ENEMY_SIZE)
+    out = []
+    while len(out) < count:
+        x, y = rng.randint(60, WIDTH - 60), rng.randint(60, HEIGHT - 60)
+        probe.center = (x, y)
+        if not grid.collides(probe):
+            out.append((x, y))
+    return out
+
+
+@pytest.mark.parametrize('room_pos', [(0, 0), (1, 0), (0, 1), (-1, -1)])
+def test_pool_matches_reference_enemies(room_pos):
+    rng = random.Random(hash(room_pos))
+    grid = Room(room_pos).geometry().grid
+    kinds = list(ENEMY_TYPES)
+    pool = EnemyPool()
+    reference = []
+    for i, (x, y) in enumerate(_free_positions(grid, 30, rng)):
+        kind = kinds[i % len(kinds)]
+        cfg = ENEMY_TYPES[kind]
+        pool.spawn(x, y, hp=cfg['hp'], speed_scale=cfg['speed_scale'], color=cfg['color'], kind=kind)
+        reference.append(ReferenceEnemy(x, y, hp=cfg['hp'], speed_scale=cfg['speed_scale'],
+                                        color=cfg['color'], kind=kind))
+    player = pygame.Rect(0, 0, 40, 40)
+    flow = FlowField()
+    for tick in range(TICKS):
+        # El jugador se mueve (y a veces sin campo de flujo: línea recta)
+        player.center = (WIDTH // 2 + int(200 * math.cos(tick / 90)), HEIGHT // 2 + int(120 * math.sin(tick / 70)))
+        use_flow = tick % 200 < 150
+        if use_flow:
+            flow.update(grid, player.center)
+        pool.update(player, DT, grid=grid, flow=flow if use_flow else None)
+        for enemy in reference:
+            enemy.update(player, DT, grid=grid, flow=flow if use_flow else None)
+        # Golpes al azar a los mismos enemigos
+        if tick % 7 == 0:
+            i = rng.randrange(len(reference))
+            assert pool.handles[i].take_damage(1) == reference[i].take_damage(1)
+        for handle, enemy in zip(pool.handles, reference):
+            assert handle.rect == enemy.rect, (tick, enemy.kind)
+            assert handle.alive == enemy.alive
+            assert handle.hp == enemy.hp
+            assert handle.charge_just_started == enemy.charge_just_started
@@ -0,0 +1,225 @@
+"""Paridad de ProjectileSystem con las flechas y pinchos por objeto que sustituyó.
+
+ReferenceArrow y ReferenceSpike son las clases originales y reference_step()
+los bucles de PlayScene que las movían y resolvían sus impactos (recorriendo
+los enemigos en orden de lista, que es el orden que conserva el sistema). Se
+disparan los mismos proyectiles en los dos y se comparan impactos, vida de
+los enemigos y posiciones en cada tick. La última prueba sigue el orden de
+PlayScene: flechas, enemigos que se mueven y pinchos disparados en el tick.
+"""
+import math
+import random
+
+import numpy as np
+import pygame
+import pytest
+
+from isac.core.room import Room
+from isac.entities.enemy_pool import EnemyPool
+from isac.entities.projectiles import ProjectileSystem, KIND_ARROW, KIND_SPIKE
+from isac.settings import (
+    ARROW_SPEED, ARROW_SIZE, ARROW_DAMAGE, SPIKE_SPEED, SPIKE_SIZE, SPIKE_DAMAGE,
+    ENEMY_SIZE, ENEMY_TYPES, WIDTH, HEIGHT,
+)
+
+DT = 1.0 / 120
+TICKS = 600
+ENEMIES = 40
+
+
+class ReferenceArrow:
+    """La flecha por objeto de antes de ProjectileSystem (sin draw)."""
+
+    def __init__(self, x: float, y: float, dx: int, dy: int) -> None:
+        self.x = x
+        self.y = y
+        self.dx = dx
+        self.dy = dy
+        self.alive = True
+        self._rect = pygame.Rect(0, 0, ARROW_SIZE, ARROW_SIZE)
+        self._sync_rect()
+
+    def _sync_rect(self) -> None:
+        self._rect.x = int(self.x) - ARROW_SIZE // 2
+        self._rect.y = int(self.y) - ARROW_SIZE // 2
+
+    def rect(self) -> pygame.Rect:
+        return self._rect
+
+    def update(self, dt: float) -> None:
+        self.x += self.dx * ARROW_SPEED * dt
+        self.y += self.dy * ARROW_SPEED * dt
+        self._sync_rect()
+
+
+class ReferenceSpike:
+    """El Spike del compañero de antes de ProjectileSystem (sin draw)."""
+
+    def __init__(self, x: int, y: int, target_x: float, target_y: float) -> None:
+        self.speed = SPIKE_SPEED
+        self.damage = SPIKE_DAMAGE
+        self._rect = pygame.Rect(0, 0, SPIKE_SIZE, SPIKE_SIZE)
+        self.x = float(x)
+        self.y = float(y)
+        self.alive = True
+        self._rect.center = (int(self.x), int(self.y))
+        dx = target_x - x
+        dy = target_y - y
+        distance = math.sqrt(dx * dx + dy * dy)
+        if distance > 0:
+            self.vx = (dx / distance) * self.speed
+            self.vy = (dy / distance) * self.speed
+        else:
+            self.vx = self.vy = 0
+
+    def update(self, dt: float) -> None:
+        if not self.alive:
+            return
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self._rect.x = int(self.x) - SPIKE_SIZE // 2
+        self._rect.y = int(self.y) - SPIKE_SIZE // 2
+        if self.x < -50 or self.x > WIDTH + 50 or self.y < -50 or self.y > HEIGHT + 50:
+            self.alive = False
+
+    def rect(self) -> pygame.Rect:
+        return self._rect
+
+
+def reference_step(arrows, spikes, grid, enemies, dt):
+    """Los bucles originales de PlayScene.update; devuelve los impactos como step()."""
+    obstacle_hits = []
+    enemy_hits = []
+    for a in arrows:
+        a.update(dt)
+        arrow_rect = a.rect()
+        if grid.collides(arrow_rect, obstacles=False):
+            a.alive = False
+            continue
+        if grid.collides(arrow_rect, walls=False):
+            a.alive = False
+            obstacle_hits.append((KIND_ARROW, None, False))
+            continue
+        for e in enemies:
+            if e.alive and arrow_rect.colliderect(e.rect):
+                enemy_hits.append((KIND_ARROW, e, e.take_damage(ARROW_DAMAGE)))
+                a.alive = False
+                break
+        if a.alive and (a.x < 0 or a.x > WIDTH or a.y < 0 or a.y > HEIGHT):
+            a.alive = False
+    for spike in spikes:
+        spike.update(dt)
+        if not spike.alive:
+            continue
+        spike_rect = spike.rect()
+        for e in enemies:
+            if e.alive and spike_rect.colliderect(e.rect):
+                enemy_hits.append((KIND_SPIKE, e, e.take_damage(spike.damage)))
+                spike.alive = False
+                break
+    arrows[:] = [a for a in arrows if a.alive]
+    spikes[:] = [s for s in spikes if s.alive]
+    return obstacle_hits, enemy_hits
+
+
+def _enemy_pool(grid, rng):
+    pool = EnemyPool()
+    kinds = list(ENEMY_TYPES)
+    probe = pygame.Rect(0, 0, ENEMY_SIZE, ENEMY_SIZE)
+    while len(pool) < ENEMIES:
+        x, y = rng.randint(60, WIDTH - 60), rng.randint(60, HEIGHT - 60)
+        probe.center = (x, y)
+        if not grid.collides(probe):
+            kind = kinds[len(pool) % len(kinds)]
+            pool.spawn(x, y, hp=ENEMY_TYPES[kind]['hp'], kind=kind)
+    return pool
+
+
+def _as_indices(hits, pool):
+    return [(kind, None if e is None else pool.handles.index(e), died) for kind, e, died in hits]
+
+
+@pytest.mark.parametrize('kind', [KIND_ARROW, KIND_SPIKE])
+@pytest.mark.parametrize('room_pos', [(0, 0), (1, 0), (0, -1)])
+def test_system_matches_reference_loops(kind, room_pos):
+    # Un tipo por prueba: los bucles originales movían todas las flechas
+    # antes que los pinchos y el sistema los mueve en orden de disparo
+    rng = random.Random(hash((kind, room_pos)))
+    grid = Room(room_pos).geometry().grid
+    pool = _enemy_pool(grid, random.Random(7))
+    ref_pool = _enemy_pool(grid, random.Random(7))
+    system = ProjectileSystem()
+    arrows, spikes = [], []
+    for tick in range(TICKS):
+        for _ in range(rng.randint(0, 3)):
+            x, y = rng.randint(0, WIDTH), rng.randint(0, HEIGHT)
+            if kind == KIND_ARROW:
+                dx, dy = rng.choice(((1, 0), (-1, 0), (0, 1), (0, -1)))
+                system.spawn_arrow(x, y, dx, dy)
+                arrows.append(ReferenceArrow(x, y, dx, dy))
+            else:
+                angle = rng.uniform(0, 2 * math.pi)
+                tx, ty = x + math.cos(angle) * 200, y + math.sin(angle) * 200
+                system.spawn_spike(x, y, tx, ty)
+                spikes.append(ReferenceSpike(x, y, tx, ty))
+        hits = system.step(DT, grid, pool)
+        ref_obstacles, ref_enemies = reference_step(arrows, spikes, grid, ref_pool.handles, DT)
+        assert [h for h in hits if h[1] is None] == ref_obstacles, tick
+        assert _as_indices([h for h in hits if h[1] is not None], pool) == _as_indices(ref_enemies, ref_pool), tick
+        n = len(pool)
+        assert np.array_equal(pool.hp[:n], ref_pool.hp[:n])
+        assert np.array_equal(pool.alive[:n], ref_pool.alive[:n])
+        live = arrows if kind == KIND_ARROW else spikes
+        assert system.count == len(live)
+        assert system.x[:system.count].tolist() == [p.x for p in live]
+        assert system.y[:system.count].tolist() == [p.y for p in live]
+        # Los enemigos no se mueven, pero su invulnerabilidad corre igual en los dos
+        for p in (pool, ref_pool):
+            p.invuln_timer[:n] = np.maximum(0.0, p.invuln_timer[:n] - DT)
+
+
+@pytest.mark.parametrize('room_pos', [(0, 0), (1, 0)])
+def test_kind_steps_interleaved_with_enemy_movement(room_pos):
+    # step(kinds=...) deja quietos los demás tipos: las flechas chocan con los
+    # enemigos antes de que se muevan y los pinchos, disparados en el mismo
+    # tick, con los enemigos ya movidos
+    rng = random.Random(hash(('interleaved', room_pos)))
+    grid = Room(room_pos).geometry().grid
+    pool = _enemy_pool(grid, random.Random(11))
+    ref_pool = _enemy_pool(grid, random.Random(11))
+    player = pygame.Rect(0, 0, 40, 40)
+    player.center = (WIDTH // 2, HEIGHT // 2)
+    system = ProjectileSystem()
+    arrows, spikes = [], []
+    for tick in range(TICKS):
+        for _ in range(rng.randint(0, 2)):
+            x, y = rng.randint(0, WIDTH), rng.randint(0, HEIGHT)
+            dx, dy = rng.choice(((1, 0), (-1, 0), (0, 1), (0, -1)))
+            system.spawn_arrow(x, y, dx, dy)
+            arrows.append(ReferenceArrow(x, y, dx, dy))
+        hits = system.step(DT, grid, pool, kinds=(KIND_ARROW,))
+        ref_obstacles, ref_enemies = reference_step(arrows, [], grid, ref_pool.handles, DT)
+        assert [h for h in hits if h[1] is None] == ref_obstacles, tick
+        assert _as_indices([h for h in hits if h[1] is not None], pool) == _as_indices(ref_enemies, ref_pool), tick
+
+        pool.update(player, DT, grid=grid)
+        ref_pool.update(player, DT, grid=grid)
+
+        for _ in range(rng.randint(0, 2)):
+            x, y = rng.randint(0, WIDTH), rng.randint(0, HEIGHT)
+            i = rng.randrange(len(ref_pool))
+            tx, ty = ref_pool.handles[i].rect.center
+            system.spawn_spike(x, y, tx, ty)
+            spikes.append(ReferenceSpike(x, y, tx, ty))
+        hits = system.step(DT, grid, pool, kinds=(KIND_SPIKE,))
+        _, ref_enemies = reference_step([], spikes, grid, ref_pool.handles, DT)
+        assert _as_indices(hits, pool) == _as_indices(ref_enemies, ref_pool), tick
+
+        n = len(pool)
+        assert np.array_equal(pool.x[:n], ref_pool.x[:n])
+        assert np.array_equal(pool.hp[:n], ref_pool.hp[:n])
+        assert np.array_equal(pool.alive[:n], ref_pool.alive[:n])
+        live = np.asarray(system.kind[:system.count])
+        assert system.x[:system.count][live == KIND_ARROW].tolist() == [a.x for a in arrows]
+        assert system.x[:system.count][live == KIND_SPIKE].tolist() == [s.x for s in spikes]
+        assert system.y[:system.count][live == KIND_SPIKE].tolist() == [s.y for s in spikes]
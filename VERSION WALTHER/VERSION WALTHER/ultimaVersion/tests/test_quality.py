@@ -0,0 +1,65 @@
+from isac.core.quality import QualityManager, TIER_ORNAMENT, TIER_EFFECT
+from isac.settings import QUALITY_WINDOW_FRAMES, QUALITY_RESTORE_WINDOWS, QUALITY_RESTORE_MAX_WINDOWS
+
+BUDGET_MS = 10.0
+
+
+def _windows(manager: QualityManager, work_ms: float, count: int) -> None:
+    for _ in range(count * QUALITY_WINDOW_FRAMES):
+        manager.observe(work_ms / 1000.0)
+
+
+def _oscillating_load(manager: QualityManager, windows: int) -> list:
+    """Carga que no cabe con calidad completa y sobra con un nivel apagado.
+
+    Devuelve cuántas ventanas se mantuvo cada recuperación de calidad completa.
+    """
+    waits = []
+    calm = 0
+    for _ in range(windows):
+        if manager.dropped == 0:
+            if calm:
+                waits.append(calm)
+            calm = 0
+            _windows(manager, BUDGET_MS * 2, 1)
+        else:
+            calm += 1
+            _windows(manager, BUDGET_MS * 0.3, 1)
+    return waits
+
+
+def _manager() -> QualityManager:
+    manager = QualityManager(BUDGET_MS)
+    manager.register('ornament', TIER_ORNAMENT)
+    manager.register('effect', TIER_EFFECT)
+    return manager
+
+
+def test_over_budget_drops_tiers_in_order():
+    manager = _manager()
+    _windows(manager, BUDGET_MS * 2, 1)
+    assert manager.dropped == 1
+    assert manager.effects() == {'ornament': False, 'effect': True}
+    _windows(manager, BUDGET_MS * 2, 5)
+    assert manager.dropped == 2  # no pasa del nivel más alto registrado
+
+
+def test_backoff_doubles_across_full_quality_flip():
+    manager = _manager()
+    waits = _oscillating_load(manager, 200)
+    base = QUALITY_RESTORE_WINDOWS
+    assert waits[:3] == [base, base * 2, base * 4]
+    assert set(waits[4:]) == {QUALITY_RESTORE_MAX_WINDOWS}
+
+
+def test_backoff_resets_after_restore_holds():
+    manager = _manager()
+    _oscillating_load(manager, 60)
+    assert manager._restore_after > QUALITY_RESTORE_WINDOWS
+    # Carga que sí cabe: se recupera todo y, si aguanta, la espera vuelve a la base
+    _windows(manager, BUDGET_MS * 0.3, QUALITY_RESTORE_MAX_WINDOWS * 3)
+    assert manager.dropped == 0
+    assert manager._restore_after == QUALITY_RESTORE_WINDOWS
+    _windows(manager, BUDGET_MS * 2, 1)
+    _windows(manager, BUDGET_MS * 0.3, QUALITY_RESTORE_WINDOWS)
+    assert manager.dropped == 0
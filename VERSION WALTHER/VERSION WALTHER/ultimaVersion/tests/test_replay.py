@@ -0,0 +1,77 @@
+"""Una repetición con F5, F9 y cambios de opciones no toca los ficheros del jugador.
+
+Se graba una sesión que guarda (F5), cambia el sonido en el menú de opciones
+y carga (F9). Antes de reproducirla se cambian savegame.json y options.json
+en disco: la repetición tiene que acabar igual que la grabación (F9 carga la
+partida que había al grabar) y dejar los dos ficheros como estaban.
+"""
+import json
+import os
+
+import pygame
+
+from isac.core.game import Game
+from isac.core.input import InputState, ScriptedInput
+from isac.core.replay import Replay
+from isac.scenes.play import PlayScene
+
+FRAMES = 160
+# Teclas por frame: guardar, pausa > opciones > sonido > volver > seguir, cargar
+KEYS = {
+    40: [pygame.K_F5],
+    80: [pygame.K_p, pygame.K_o, pygame.K_RETURN, pygame.K_o, pygame.K_p],
+    120: [pygame.K_F9],
+}
+
+
+def _movement(frame):
+    if frame < 40:
+        return InputState(move_x=1)
+    if frame < 120:
+        return InputState(move_y=1)
+    return InputState(move_x=-1)
+
+
+def _post_keys(game):
+    for key in KEYS.get(game.frames, ()):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=''))
+
+
+def _state(scene):
+    p, inv = scene.player, scene.inventory
+    return (p.rect.center, p.hp, p.magic, inv.bombs, inv.keys, inv.arrows,
+            scene.dungeon.current, scene.sound_enabled)
+
+
+def _write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def test_replay_leaves_save_and_options_untouched(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_json('options.json', {'options': {'sound_enabled': True, 'volume': 0.5, 'difficulty': 'Normal'}})
+
+    game = Game(PlayScene, headless=True, seed=3, record_path='s.rpl', input_source=ScriptedInput(_movement))
+    game.on_frame_begin(_post_keys)
+    game.run(max_frames=FRAMES)
+    game.recorder.close()
+    recorded = _state(game.scene)
+    # La sesión grabada sí guardó y cambió las opciones del jugador
+    assert os.path.exists('savegame.json')
+    assert json.load(open('options.json'))['options']['sound_enabled'] is False
+
+    # Otra partida guardada y otras opciones en disco antes de reproducir
+    _write_json('savegame.json', {'player': {'hp': 1, 'pos': [100, 100]}, 'inventory': {'bombs': 9}})
+    _write_json('options.json', {'options': {'sound_enabled': True, 'volume': 0.2, 'difficulty': 'Normal'}})
+    before = {name: (open(name, 'rb').read(), os.stat(name).st_mtime_ns) for name in ('savegame.json', 'options.json')}
+
+    replay = Replay.load('s.rpl')
+    assert len(replay) == FRAMES
+    game = Game(PlayScene, headless=True, replay=replay)
+    scratch = os.path.dirname(game.save_path)
+    game.run()
+    assert _state(game.scene) == recorded
+    after = {name: (open(name, 'rb').read(), os.stat(name).st_mtime_ns) for name in ('savegame.json', 'options.json')}
+    assert after == before
+    assert not os.path.exists(scratch)